@@ -1,3 +1,4 @@
 from langgraph_bigtool.graph import create_agent
+from langgraph_bigtool.tools import aindex_tool_registry, index_tool_registry
 
-__all__ = ["create_agent"]
+__all__ = ["create_agent", "index_tool_registry", "aindex_tool_registry"]
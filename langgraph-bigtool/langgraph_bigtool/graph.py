@@ -1,21 +1,36 @@
+import asyncio
+import threading
+from collections import OrderedDict
 from typing import Annotated, Callable
 
 from langchain_core.language_models import LanguageModelLike
 from langchain_core.messages import AIMessage, ToolMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import get_executor_for_config
 from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.graph import END, MessagesState, StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.store.base import BaseStore
 from langgraph.types import Send
 from langgraph.utils.runnable import RunnableCallable
 
-from langgraph_bigtool.tools import get_default_retrieval_tool, get_store_arg
+from langgraph_bigtool.tools import (
+    get_default_batch_retrieval,
+    get_default_retrieval_tool,
+    get_store_arg,
+)
 
 
 def _add_new(left: list, right: list) -> list:
-    """Extend left list with new items from right list."""
-    return left + [item for item in right if item not in set(left)]
+    """Extend left list with new items from right list, keeping items unique."""
+    seen = set(left)
+    merged = list(left)
+    for item in right:
+        if item not in seen:
+            seen.add(item)
+            merged.append(item)
+    return merged
 
 
 class State(MessagesState):
@@ -42,6 +57,49 @@ def _format_selected_tools(
     return tool_messages, tool_ids
 
 
+class _BoundModelCache:
+    """LRU cache of the model bound to each list of selected tools.
+
+    Tool schemas are converted once per tool, and bound models are reused for
+    as long as the selected tools don't change.
+    """
+
+    def __init__(
+        self,
+        llm: LanguageModelLike,
+        retrieve_tools: BaseTool,
+        tool_registry: dict[str, BaseTool | Callable],
+        maxsize: int,
+    ) -> None:
+        self.llm = llm
+        self.retrieve_tools_schema = convert_to_openai_tool(retrieve_tools)
+        self.tool_registry = tool_registry
+        self.maxsize = maxsize
+        self.schemas: dict[str, dict] = {}
+        self.models: OrderedDict[tuple[str, ...], Runnable] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, tool_ids: list[str]) -> Runnable:
+        key = tuple(tool_ids)
+        with self.lock:
+            if (model := self.models.get(key)) is not None:
+                self.models.move_to_end(key)
+                return model
+        schemas = [self.retrieve_tools_schema]
+        for tool_id in tool_ids:
+            if (schema := self.schemas.get(tool_id)) is None:
+                schema = self.schemas[tool_id] = convert_to_openai_tool(
+                    self.tool_registry[tool_id]
+                )
+            schemas.append(schema)
+        model = self.llm.bind_tools(schemas)
+        with self.lock:
+            self.models[key] = model
+            while len(self.models) > self.maxsize:
+                self.models.popitem(last=False)
+        return model
+
+
 def create_agent(
     llm: LanguageModelLike,
     tool_registry: dict[str, BaseTool | Callable],
@@ -51,6 +109,7 @@ def create_agent(
     namespace_prefix: tuple[str, ...] = ("tools",),
     retrieve_tools_function: Callable | None = None,
     retrieve_tools_coroutine: Callable | None = None,
+    max_bound_models: int = 128,
 ) -> StateGraph:
     """Create an agent with a registry of tools.
 
@@ -71,43 +130,66 @@ def create_agent(
         retrieve_tools_coroutine: Optional coroutine to use for retrieving tools. This
             function should return a list of tool IDs. If not specified, uses semantic
             against the Store with limit, filter, and namespace_prefix set above.
+        max_bound_models: Maximum number of models bound to a list of selected
+            tools to keep, so they are not bound again on every turn.
     """
     if retrieve_tools_function is None and retrieve_tools_coroutine is None:
         retrieve_tools_function, retrieve_tools_coroutine = get_default_retrieval_tool(
             namespace_prefix, limit=limit, filter=filter
         )
+        # searches for all retrieval calls of a turn are sent in one batch
+        batch_retrieve_tools, abatch_retrieve_tools = get_default_batch_retrieval(
+            namespace_prefix, limit=limit, filter=filter
+        )
+    else:
+        batch_retrieve_tools = abatch_retrieve_tools = None
     retrieve_tools = StructuredTool.from_function(
         func=retrieve_tools_function, coroutine=retrieve_tools_coroutine
     )
     # If needed, get argument name to inject Store
     store_arg = get_store_arg(retrieve_tools)
+    bound_models = _BoundModelCache(
+        llm, retrieve_tools, tool_registry, maxsize=max_bound_models
+    )
 
     def call_model(state: State, config: RunnableConfig, *, store: BaseStore) -> State:
-        selected_tools = [tool_registry[id] for id in state["selected_tool_ids"]]
-        llm_with_tools = llm.bind_tools([retrieve_tools, *selected_tools])
+        llm_with_tools = bound_models.get(state["selected_tool_ids"])
         response = llm_with_tools.invoke(state["messages"])
         return {"messages": [response]}
 
     async def acall_model(
         state: State, config: RunnableConfig, *, store: BaseStore
     ) -> State:
-        selected_tools = [tool_registry[id] for id in state["selected_tool_ids"]]
-        llm_with_tools = llm.bind_tools([retrieve_tools, *selected_tools])
+        llm_with_tools = bound_models.get(state["selected_tool_ids"])
         response = await llm_with_tools.ainvoke(state["messages"])
         return {"messages": [response]}
 
     tool_node = ToolNode(tool for tool in tool_registry.values())
 
+    def _retrieval_kwargs(tool_call: dict, store: BaseStore) -> dict:
+        kwargs = {**tool_call["args"]}
+        if store_arg:
+            kwargs[store_arg] = store
+        return kwargs
+
     def select_tools(
         tool_calls: list[dict], config: RunnableConfig, *, store: BaseStore
     ) -> State:
-        selected_tools = {}
-        for tool_call in tool_calls:
-            kwargs = {**tool_call["args"]}
-            if store_arg:
-                kwargs[store_arg] = store
-            result = retrieve_tools.invoke(kwargs)
-            selected_tools[tool_call["id"]] = result
+        if batch_retrieve_tools is not None:
+            queries = [tool_call["args"]["query"] for tool_call in tool_calls]
+            results = batch_retrieve_tools(queries, store)
+        else:
+            with get_executor_for_config(config) as executor:
+                results = list(
+                    executor.map(
+                        lambda tool_call: retrieve_tools.invoke(
+                            _retrieval_kwargs(tool_call, store)
+                        ),
+                        tool_calls,
+                    )
+                )
+        tool_call_ids = [tool_call["id"] for tool_call in tool_calls]
+        selected_tools = dict(zip(tool_call_ids, results, strict=True))
 
         tool_messages, tool_ids = _format_selected_tools(selected_tools, tool_registry)
         return {"messages": tool_messages, "selected_tool_ids": tool_ids}
@@ -115,13 +197,18 @@ def create_agent(
     async def aselect_tools(
         tool_calls: list[dict], config: RunnableConfig, *, store: BaseStore
     ) -> State:
-        selected_tools = {}
-        for tool_call in tool_calls:
-            kwargs = {**tool_call["args"]}
-            if store_arg:
-                kwargs[store_arg] = store
-            result = await retrieve_tools.ainvoke(kwargs)
-            selected_tools[tool_call["id"]] = result
+        if abatch_retrieve_tools is not None:
+            queries = [tool_call["args"]["query"] for tool_call in tool_calls]
+            results = await abatch_retrieve_tools(queries, store)
+        else:
+            results = await asyncio.gather(
+                *(
+                    retrieve_tools.ainvoke(_retrieval_kwargs(tool_call, store))
+                    for tool_call in tool_calls
+                )
+            )
+        tool_call_ids = [tool_call["id"] for tool_call in tool_calls]
+        selected_tools = dict(zip(tool_call_ids, results, strict=True))
 
         tool_messages, tool_ids = _format_selected_tools(selected_tools, tool_registry)
         return {"messages": tool_messages, "selected_tool_ids": tool_ids}
@@ -133,12 +220,16 @@ def create_agent(
             return END
         else:
             destinations = []
+            retrieval_calls = []
             for call in last_message.tool_calls:
                 if call["name"] == retrieve_tools.name:
-                    destinations.append(Send("select_tools", [call]))
+                    retrieval_calls.append(call)
                 else:
                     tool_call = tool_node.inject_tool_args(call, state, store)
                     destinations.append(Send("tools", [tool_call]))
+            if retrieval_calls:
+                # all retrieval calls are handled together in a single task
+                destinations.append(Send("select_tools", retrieval_calls))
 
             return destinations
 
@@ -1,15 +1,23 @@
-from typing import Any, Type, Union
+import asyncio
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Type, Union
 
 from langchain_core.tools.base import (
     BaseTool,
     get_all_basemodel_annotations,
 )
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.prebuilt import InjectedState, InjectedStore
-from langgraph.store.base import BaseStore
+from langgraph.store.base import BaseStore, Item, PutOp, SearchOp
 from typing_extensions import Annotated, get_args, get_origin
 
 ToolId = str
 
+# Number of indexed tools read per search when listing a namespace
+_LIST_PAGE_SIZE = 1000
+
 
 def get_default_retrieval_tool(
     namespace_prefix: tuple[str, ...],
@@ -50,6 +58,173 @@ def get_default_retrieval_tool(
     return retrieve_tools, aretrieve_tools
 
 
+def get_default_batch_retrieval(
+    namespace_prefix: tuple[str, ...],
+    *,
+    limit: int = 2,
+    filter: dict[str, Any] | None = None,
+):
+    """Get default sync and async functions retrieving tools for several queries.
+
+    All queries are searched with a single `store.batch` call.
+    """
+
+    def _search_ops(queries: list[str]) -> list[SearchOp]:
+        return [
+            SearchOp(namespace_prefix, filter=filter, limit=limit, query=query)
+            for query in queries
+        ]
+
+    def batch_retrieve_tools(
+        queries: list[str], store: BaseStore
+    ) -> list[list[ToolId]]:
+        return [
+            [result.key for result in results]
+            for results in store.batch(_search_ops(queries))
+        ]
+
+    async def abatch_retrieve_tools(
+        queries: list[str], store: BaseStore
+    ) -> list[list[ToolId]]:
+        return [
+            [result.key for result in results]
+            for results in await store.abatch(_search_ops(queries))
+        ]
+
+    return batch_retrieve_tools, abatch_retrieve_tools
+
+
+def _tool_document(tool: BaseTool | Callable) -> dict[str, Any]:
+    """Get the document indexed for a tool, with a hash of its content."""
+    function = convert_to_openai_tool(tool)["function"]
+    document = {
+        "description": f"{function['name']}: {function.get('description', '')}",
+        "args": function.get("parameters", {}),
+    }
+    content = json.dumps(document, sort_keys=True, default=str)
+    document["hash"] = hashlib.sha256(content.encode()).hexdigest()
+    return document
+
+
+def _list_op(namespace_prefix: tuple[str, ...], offset: int) -> SearchOp:
+    return SearchOp(namespace_prefix, limit=_LIST_PAGE_SIZE, offset=offset)
+
+
+def _add_page(
+    existing: dict[ToolId, Item], namespace_prefix: tuple[str, ...], page: list[Item]
+) -> bool:
+    """Add a page of listed items, returning whether there are more pages."""
+    for item in page:
+        # tools are stored in the namespace itself, not below it
+        if tuple(item.namespace) == namespace_prefix:
+            existing[item.key] = item
+    return len(page) == _LIST_PAGE_SIZE
+
+
+def _changed_tools(
+    tool_registry: dict[ToolId, BaseTool | Callable],
+    namespace_prefix: tuple[str, ...],
+    existing: dict[ToolId, Item],
+    prune: bool,
+) -> list[PutOp]:
+    ops = []
+    for tool_id, tool in tool_registry.items():
+        document = _tool_document(tool)
+        item = existing.get(tool_id)
+        if item is None or item.value.get("hash") != document["hash"]:
+            ops.append(
+                PutOp(namespace_prefix, tool_id, document, index=["description"])
+            )
+    if prune:
+        ops.extend(
+            PutOp(namespace_prefix, tool_id, None)
+            for tool_id in existing
+            if tool_id not in tool_registry
+        )
+    return ops
+
+
+def _chunks(ops: list[PutOp], batch_size: int) -> list[list[PutOp]]:
+    return [ops[i : i + batch_size] for i in range(0, len(ops), batch_size)]
+
+
+def index_tool_registry(
+    store: BaseStore,
+    tool_registry: dict[ToolId, BaseTool | Callable],
+    namespace_prefix: tuple[str, ...] = ("tools",),
+    *,
+    batch_size: int = 500,
+    max_concurrency: int = 4,
+    prune: bool = True,
+) -> int:
+    """Index the tools of a registry in a store, for retrieval by `create_agent`.
+
+    Each tool is stored under its ID, with its description and the JSON schema of
+    its arguments. Only the description is embedded. Tools whose description and
+    arguments didn't change since they were last indexed are skipped, so indexing
+    an unchanged registry only reads from the store.
+
+    The items already in `namespace_prefix` are listed a page at a time. Tools that
+    are no longer in the registry are deleted along with the other writes, so they
+    can't be retrieved anymore.
+
+    Args:
+        store: The store to index the tools in, configured with an index.
+        tool_registry: A dict mapping string IDs to tools or callables.
+        namespace_prefix: Namespace to store the tools in. Defaults to ("tools",).
+        batch_size: Number of tools written (and embedded) per store batch.
+        max_concurrency: Maximum number of store batches written concurrently.
+        prune: Whether to delete the tools of `namespace_prefix` that are not in
+            the registry. Defaults to True.
+
+    Returns:
+        The number of tools written or deleted.
+    """
+    existing: dict[ToolId, Item] = {}
+    offset = 0
+    while _add_page(
+        existing, namespace_prefix, store.batch([_list_op(namespace_prefix, offset)])[0]
+    ):
+        offset += _LIST_PAGE_SIZE
+    ops = _changed_tools(tool_registry, namespace_prefix, existing, prune)
+    chunks = _chunks(ops, batch_size)
+    if len(chunks) == 1:
+        store.batch(chunks[0])
+    elif chunks:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            list(executor.map(store.batch, chunks))
+    return len(ops)
+
+
+async def aindex_tool_registry(
+    store: BaseStore,
+    tool_registry: dict[ToolId, BaseTool | Callable],
+    namespace_prefix: tuple[str, ...] = ("tools",),
+    *,
+    batch_size: int = 500,
+    max_concurrency: int = 4,
+    prune: bool = True,
+) -> int:
+    """Async version of `index_tool_registry`."""
+    existing: dict[ToolId, Item] = {}
+    offset = 0
+    while _add_page(
+        existing,
+        namespace_prefix,
+        (await store.abatch([_list_op(namespace_prefix, offset)]))[0],
+    ):
+        offset += _LIST_PAGE_SIZE
+    ops = _changed_tools(tool_registry, namespace_prefix, existing, prune)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def write(chunk: list[PutOp]) -> None:
+        async with semaphore:
+            await store.abatch(chunk)
+
+    await asyncio.gather(*(write(chunk) for chunk in _chunks(ops, batch_size)))
+    return len(ops)
+
+
 def _is_injection(
     type_arg: Any, injection_type: Union[Type[InjectedState], Type[InjectedStore]]
 ) -> bool:
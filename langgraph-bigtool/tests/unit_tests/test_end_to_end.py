@@ -10,14 +10,14 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.embeddings.fake import DeterministicFakeEmbedding
 from langchain_core.language_models import GenericFakeChatModel, LanguageModelLike
 from langchain_core.messages import AIMessage, ToolMessage
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool
 from langgraph.prebuilt import InjectedStore
 from langgraph.store.base import BaseStore
 from langgraph.store.memory import InMemoryStore
 from typing_extensions import Annotated
 
-from langgraph_bigtool import create_agent
-from langgraph_bigtool.graph import State
+from langgraph_bigtool import aindex_tool_registry, create_agent, index_tool_registry
+from langgraph_bigtool.graph import State, _add_new, _BoundModelCache
 from langgraph_bigtool.utils import convert_positional_only_function_to_tool
 
 EMBEDDING_SIZE = 1536
@@ -466,3 +466,171 @@ def test_functions_in_registry() -> None:
         {"messages": "Use available tools to calculate arc cosine of 0.5."}
     )
     _validate_result(result, tool_registry=tool_registry)
+
+
+def test_bound_model_cache() -> None:
+    bound = []
+
+    class RecordingModel(FakeModel):
+        def bind_tools(self, tools, **kwargs) -> "RecordingModel":
+            bound.append(tools)
+            return self
+
+    llm = RecordingModel(messages=iter([]))
+    retrieve_tools = StructuredTool.from_function(custom_retrieve_tools_no_store)
+    tool_ids = list(tool_registry)[:3]
+    cache = _BoundModelCache(llm, retrieve_tools, tool_registry, maxsize=2)
+
+    assert cache.get(tool_ids[:2]) is llm
+    cache.get(tool_ids[:2])
+    assert [[schema["function"]["name"] for schema in tools] for tools in bound] == [
+        [
+            "custom_retrieve_tools_no_store",
+            tool_registry[tool_ids[0]].name,
+            tool_registry[tool_ids[1]].name,
+        ]
+    ]
+
+    # least recently used models are evicted, tool schemas are kept
+    cache.get(tool_ids[1:])
+    cache.get(tool_ids[:1])
+    cache.get(tool_ids[:2])
+    assert len(bound) == 4
+    assert list(cache.schemas) == tool_ids
+
+
+def test_add_new() -> None:
+    assert _add_new(["a", "b"], ["b", "c", "c", "d"]) == ["a", "b", "c", "d"]
+    assert _add_new([], []) == []
+
+
+class BatchCountingStore(InMemoryStore):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[int] = []
+
+    def batch(self, ops):
+        ops = list(ops)
+        self.batches.append(len(ops))
+        return super().batch(ops)
+
+    async def abatch(self, ops):
+        ops = list(ops)
+        self.batches.append(len(ops))
+        return await super().abatch(ops)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_batched_retrieval(use_async: bool) -> None:
+    tools_by_name = {tool.name: tool for tool in tool_registry.values()}
+    queries = [
+        f"{name}: {tools_by_name[name].description}" for name in ("acos", "asin")
+    ]
+    fake_llm = FakeModel(
+        messages=iter(
+            [
+                AIMessage(
+                    "",
+                    tool_calls=[
+                        {
+                            "name": "retrieve_tools",
+                            "args": {"query": query},
+                            "id": f"call-{i}",
+                            "type": "tool_call",
+                        }
+                        for i, query in enumerate(queries)
+                    ],
+                ),
+                AIMessage("Done."),
+            ]
+        )
+    )
+    store = BatchCountingStore(
+        index={
+            "embed": DeterministicFakeEmbedding(size=EMBEDDING_SIZE),
+            "dims": EMBEDDING_SIZE,
+            "fields": ["description"],
+        }
+    )
+    for tool_id, tool in tool_registry.items():
+        store.put(
+            ("tools",), tool_id, {"description": f"{tool.name}: {tool.description}"}
+        )
+    store.batches.clear()
+
+    agent = create_agent(fake_llm, tool_registry, limit=1).compile(store=store)
+    inputs = {"messages": "Find tools."}
+    result = await agent.ainvoke(inputs) if use_async else agent.invoke(inputs)
+
+    # both searches are sent to the store at once
+    assert store.batches == [2]
+    selected = [tool_registry[tool_id].name for tool_id in result["selected_tool_ids"]]
+    assert selected == ["acos", "asin"]
+    assert [m.tool_call_id for m in result["messages"] if m.type == "tool"] == [
+        "call-0",
+        "call-1",
+    ]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_index_tool_registry(
+    use_async: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("langgraph_bigtool.tools._LIST_PAGE_SIZE", 7)
+    store = BatchCountingStore(
+        index={
+            "embed": DeterministicFakeEmbedding(size=EMBEDDING_SIZE),
+            "dims": EMBEDDING_SIZE,
+        }
+    )
+
+    async def index(registry: dict, **kwargs) -> int:
+        if use_async:
+            return await aindex_tool_registry(store, registry, batch_size=10, **kwargs)
+        return index_tool_registry(store, registry, batch_size=10, **kwargs)
+
+    # tools below the namespace are neither listed nor pruned
+    store.put(("tools", "nested"), "other", {"description": "other"})
+    store.batches.clear()
+    assert await index(tool_registry) == len(tool_registry)
+    # one read, then writes in chunks of 10 tools
+    num_chunks = math.ceil(len(tool_registry) / 10)
+    assert store.batches[0] == 1
+    assert sorted(store.batches[1:], reverse=True) == [10] * (num_chunks - 1) + [
+        len(tool_registry) % 10 or 10
+    ]
+    acos_id, acos_tool = next(
+        (tool_id, tool)
+        for tool_id, tool in tool_registry.items()
+        if tool.name == "acos"
+    )
+    item = store.get(("tools",), acos_id)
+    assert item.value["description"] == f"acos: {acos_tool.description}"
+    assert item.value["args"]["properties"].keys() == {"x"}
+    [result] = store.search(("tools",), query=item.value["description"], limit=1)
+    assert result.key == acos_id
+
+    # unchanged tools are skipped
+    store.batches.clear()
+    assert await index(tool_registry) == 0
+    # the namespace is listed a page at a time
+    num_pages = len(tool_registry) // 7 + 1
+    assert store.batches == [1] * num_pages
+
+    def acos(x: float) -> float:
+        """Return the arc cosine of x, in radians."""
+        return math.acos(x)
+
+    assert await index({**tool_registry, acos_id: acos}) == 1
+    assert store.get(("tools",), acos_id).value["description"] == (
+        "acos: Return the arc cosine of x, in radians."
+    )
+
+    # tools missing from the registry are deleted, unless pruning is disabled
+    registry = {k: v for k, v in tool_registry.items() if k != acos_id}
+    assert await index(registry, prune=False) == 0
+    assert store.get(("tools",), acos_id) is not None
+    assert await index(registry) == 1
+    assert store.get(("tools",), acos_id) is None
+    assert store.get(("tools", "nested"), "other") is not None
+    assert await index(registry) == 0
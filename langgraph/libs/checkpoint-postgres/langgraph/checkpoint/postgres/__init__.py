@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import threading
 from collections import defaultdict
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
-from psycopg import Capabilities, Connection, Cursor, Pipeline
+from psycopg import Capabilities, Connection, Cursor, Pipeline, ServerCursor
 from psycopg.rows import DictRow, dict_row
-from psycopg.types.json import Jsonb
 from psycopg_pool import ConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
@@ -21,8 +21,20 @@ from langgraph.checkpoint.base import (
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.base.export import (
+    CHUNK_SIZE,
+    encode_frame,
+    encode_header,
+    read_frames,
+)
 from langgraph.checkpoint.postgres import _internal
-from langgraph.checkpoint.postgres.base import BasePostgresSaver
+from langgraph.checkpoint.postgres.base import (
+    EXPORT_CHECKPOINTS,
+    EXPORT_COPY_SQL,
+    EXPORT_SOURCE,
+    BasePostgresSaver,
+    _columns,
+)
 from langgraph.checkpoint.postgres.shallow import ShallowPostgresSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
@@ -39,8 +51,30 @@ class PostgresSaver(BasePostgresSaver):
         conn: _internal.Conn,
         pipe: Pipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        binary_checkpoints: bool = False,
+        indexed_metadata_keys: Sequence[str] | None = None,
     ) -> None:
+        """
+        Args:
+            conn: The Postgres connection or connection pool.
+            pipe: Optional pipeline to use with a single connection.
+            serde: The serializer to use for checkpoint data.
+            binary_checkpoints: Store new checkpoints and their metadata as a msgpack
+                blob instead of JSONB, which avoids a JSON encode/parse per put and read.
+                Requires running `setup()` to apply the migration. Rows written in either
+                format can always be read.
+            indexed_metadata_keys: With binary_checkpoints, only these metadata keys are
+                kept in the JSONB metadata column, and only they can be used in the
+                `filter` of list(). Defaults to None (all keys).
+        """
         super().__init__(serde=serde)
+        self.binary_checkpoints = binary_checkpoints
+        self.indexed_metadata_keys = (
+            frozenset(indexed_metadata_keys)
+            if indexed_metadata_keys is not None
+            else None
+        )
         if isinstance(conn, ConnectionPool) and pipe is not None:
             raise ValueError(
                 "Pipeline should be used only with a single Connection, not ConnectionPool."
@@ -107,17 +141,23 @@ class PostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        channels: Sequence[str] | None = None,
+        include_pending_writes: bool = True,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
         This method retrieves a list of checkpoint tuples from the Postgres database based
         on the provided config. The checkpoints are ordered by checkpoint ID in descending order (newest first).
+        Rows are streamed from a server-side cursor, `LIST_BATCH_SIZE` at a time.
 
         Args:
             config: The config to use for listing the checkpoints.
             filter: Additional filtering criteria for metadata. Defaults to None.
             before: If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
             limit: The maximum number of checkpoints to return. Defaults to None.
+            channels: Only load the values of these channels. Pass an empty list to
+                skip channel values, e.g. when only metadata is needed. Defaults to None (all channels).
+            include_pending_writes: Whether to load the pending writes of each checkpoint. Defaults to True.
 
         Yields:
             Iterator[CheckpointTuple]: An iterator of checkpoint tuples.
@@ -140,43 +180,48 @@ class PostgresSaver(BasePostgresSaver):
             >>> print(checkpoints)
             [CheckpointTuple(...), ...]
         """
+        select, select_args = self._select_sql(channels, include_pending_writes)
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        query = select + where + " ORDER BY checkpoint_id DESC"
         if limit:
             query += f" LIMIT {limit}"
-        # if we change this to use .stream() we need to make sure to close the cursor
-        with self._cursor() as cur:
-            cur.execute(query, args)
-            values = cur.fetchall()
-            if not values:
-                return
-            # migrate pending sends if necessary
-            if to_migrate := [
-                v
-                for v in values
-                if v["checkpoint"]["v"] < 4 and v["parent_checkpoint_id"]
-            ]:
-                cur.execute(
-                    self.SELECT_PENDING_SENDS_SQL,
-                    (
-                        values[0]["thread_id"],
-                        [v["parent_checkpoint_id"] for v in to_migrate],
-                    ),
-                )
-                grouped_by_parent = defaultdict(list)
-                for value in to_migrate:
-                    grouped_by_parent[value["parent_checkpoint_id"]].append(value)
-                for sends in cur:
-                    for value in grouped_by_parent[sends["checkpoint_id"]]:
-                        if value["channel_values"] is None:
-                            value["channel_values"] = []
-                        self._migrate_pending_sends(
-                            sends["sends"],
-                            value["checkpoint"],
-                            value["channel_values"],
+        with self._stream_cursor() as cur:
+            cur.execute(query, [*select_args, *args])
+            while values := cur.fetchmany(self.LIST_BATCH_SIZE):
+                self._load_checkpoints(values)
+                # migrate pending sends if necessary
+                if to_migrate := [
+                    v
+                    for v in values
+                    if v["checkpoint"]["v"] < 4 and v["parent_checkpoint_id"]
+                ]:
+                    with cur.connection.cursor(
+                        binary=True, row_factory=dict_row
+                    ) as sends_cur:
+                        sends_cur.execute(
+                            self.SELECT_PENDING_SENDS_SQL,
+                            (
+                                values[0]["thread_id"],
+                                [v["parent_checkpoint_id"] for v in to_migrate],
+                            ),
                         )
-            for value in values:
-                yield self._load_checkpoint_tuple(value)
+                        grouped_by_parent = defaultdict(list)
+                        for value in to_migrate:
+                            grouped_by_parent[value["parent_checkpoint_id"]].append(
+                                value
+                            )
+                        for sends in sends_cur:
+                            for value in grouped_by_parent[sends["checkpoint_id"]]:
+                                if value["channel_values"] is None:
+                                    value["channel_values"] = []
+                                self._migrate_pending_sends(
+                                    sends["sends"],
+                                    value["checkpoint"],
+                                    value["channel_values"],
+                                )
+                self._project_channels(values, channels)
+                for value in values:
+                    yield self._load_checkpoint_tuple(value)
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
@@ -231,6 +276,7 @@ class PostgresSaver(BasePostgresSaver):
             value = cur.fetchone()
             if value is None:
                 return None
+            self._load_checkpoints([value])
 
             # migrate pending sends if necessary
             if value["checkpoint"]["v"] < 4 and value["parent_checkpoint_id"]:
@@ -304,18 +350,22 @@ class PostgresSaver(BasePostgresSaver):
             else:
                 blob_values[k] = copy["channel_values"].pop(k)
 
+        # both statements are sent in a single round trip
         with self._cursor(pipeline=True) as cur:
             if blob_versions := {
                 k: v for k, v in new_versions.items() if k in blob_values
             }:
-                cur.executemany(
-                    self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                    self._dump_blobs(
-                        thread_id,
-                        checkpoint_ns,
-                        blob_values,
-                        blob_versions,
+                cur.execute(
+                    self.BULK_UPSERT_CHECKPOINT_BLOBS_SQL,
+                    _columns(
+                        self._dump_blobs(
+                            thread_id,
+                            checkpoint_ns,
+                            blob_values,
+                            blob_versions,
+                        )
                     ),
+                    prepare=True,
                 )
             cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
@@ -324,9 +374,11 @@ class PostgresSaver(BasePostgresSaver):
                     checkpoint_ns,
                     checkpoint["id"],
                     checkpoint_id,
-                    Jsonb(copy),
-                    Jsonb(get_checkpoint_metadata(config, metadata)),
+                    *self._dump_checkpoint(
+                        copy, get_checkpoint_metadata(config, metadata)
+                    ),
                 ),
+                prepare=True,
             )
         return next_config
 
@@ -346,23 +398,18 @@ class PostgresSaver(BasePostgresSaver):
             writes: List of writes to store.
             task_id: Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
+        if not writes:
+            return
+        query, params = self._dump_writes_bulk(
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+            config["configurable"]["checkpoint_id"],
+            task_id,
+            task_path,
+            writes,
         )
         with self._cursor(pipeline=True) as cur:
-            cur.executemany(
-                query,
-                self._dump_writes(
-                    config["configurable"]["thread_id"],
-                    config["configurable"]["checkpoint_ns"],
-                    config["configurable"]["checkpoint_id"],
-                    task_id,
-                    task_path,
-                    writes,
-                ),
-            )
+            cur.execute(query, params, prepare=True)
 
     def delete_thread(self, thread_id: str) -> None:
         """Delete all checkpoints and writes associated with a thread ID.
@@ -387,6 +434,96 @@ class PostgresSaver(BasePostgresSaver):
                 (str(thread_id),),
             )
 
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Only thread IDs are read, `THREAD_IDS_PAGE_SIZE` at a time, with one query
+        per page, so threads can be deleted while iterating.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs.
+        """
+        after = ""
+        while True:
+            with self._cursor() as cur:
+                cur.execute(
+                    self.SELECT_THREAD_IDS_SQL, (after, self.THREAD_IDS_PAGE_SIZE)
+                )
+                thread_ids = [row["thread_id"] for row in cur.fetchall()]
+            yield from thread_ids
+            if len(thread_ids) < self.THREAD_IDS_PAGE_SIZE:
+                return
+            after = thread_ids[-1]
+
+    def export_threads(self, thread_ids: Sequence[str]) -> Iterator[bytes]:
+        """Export all checkpoints, blobs and writes of the given threads.
+
+        Each table is read with a single `COPY ... TO STDOUT (FORMAT BINARY)`. The data
+        is yielded as chunks of a framed byte stream (see `langgraph.checkpoint.base.export`)
+        which can be written to a file and loaded into another database with `import_threads`.
+
+        Args:
+            thread_ids: The thread IDs to export.
+
+        Yields:
+            Iterator[bytes]: Chunks of the export stream.
+        """
+        yield encode_header(EXPORT_SOURCE)
+        with self._copy_cursor() as cur:
+            for kind, query in EXPORT_COPY_SQL.items():
+                with cur.copy(query, ([str(t) for t in thread_ids],)) as copy:
+                    data = bytearray()
+                    for chunk in copy:
+                        data += chunk
+                        if len(data) >= CHUNK_SIZE:
+                            yield encode_frame(kind, data)
+                            data.clear()
+                    if data:
+                        yield encode_frame(kind, data)
+
+    def import_threads(self, stream: Iterable[bytes]) -> int:
+        """Import threads from a stream created by `export_threads`.
+
+        Each table is loaded with a single `COPY ... FROM STDIN (FORMAT BINARY)`, all in
+        one transaction. Checkpoints, blobs and writes that already exist are left untouched.
+
+        Args:
+            stream: The chunks of the export stream.
+
+        Returns:
+            int: The number of checkpoints inserted.
+        """
+        inserted = 0
+        with self._copy_cursor() as cur:
+            for kind, frames in groupby(
+                read_frames(stream, EXPORT_SOURCE), key=itemgetter(0)
+            ):
+                create_sql, copy_sql, move_sql = self._import_sql(kind)
+                cur.execute(create_sql)
+                with cur.copy(copy_sql) as copy:
+                    for _, payload in frames:
+                        copy.write(payload)
+                cur.execute(move_sql)
+                if kind == EXPORT_CHECKPOINTS:
+                    inserted += cur.rowcount
+        return inserted
+
+    @contextmanager
+    def _copy_cursor(self) -> Iterator[Cursor[DictRow]]:
+        """Create a cursor for COPY operations, inside a transaction."""
+        if self.pipe:
+            raise ValueError(
+                "COPY is not supported in pipeline mode. "
+                "Use a PostgresSaver initialized without a pipeline."
+            )
+        with (
+            self.lock,
+            _internal.get_connection(self.conn) as conn,
+            conn.transaction(),
+            conn.cursor(row_factory=dict_row) as cur,
+        ):
+            yield cur
+
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
         """Create a database cursor as a context manager.
@@ -427,6 +564,27 @@ class PostgresSaver(BasePostgresSaver):
                 with conn.cursor(binary=True, row_factory=dict_row) as cur:
                     yield cur
 
+    @contextmanager
+    def _stream_cursor(self) -> Iterator[Cursor[DictRow] | ServerCursor[DictRow]]:
+        """Create a cursor that fetches query results in batches.
+
+        Uses a server-side cursor, which has to be declared inside a transaction.
+        Pipeline mode doesn't support server-side cursors, so a regular cursor is
+        used when the PostgresSaver was initialized with a pipeline.
+        """
+        with self.lock, _internal.get_connection(self.conn) as conn:
+            if self.pipe:
+                with conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+            else:
+                with (
+                    conn.transaction(),
+                    conn.cursor(
+                        "list_checkpoints", binary=True, row_factory=dict_row
+                    ) as cur,
+                ):
+                    yield cur
+
     def _load_checkpoint_tuple(self, value: DictRow) -> CheckpointTuple:
         """
         Convert a database row into a CheckpointTuple object.
@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncIterator, Iterator, Sequence
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
-from psycopg import AsyncConnection, AsyncCursor, AsyncPipeline, Capabilities
+from psycopg import (
+    AsyncConnection,
+    AsyncCursor,
+    AsyncPipeline,
+    AsyncServerCursor,
+    Capabilities,
+)
 from psycopg.rows import DictRow, dict_row
-from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
 
 from langgraph.checkpoint.base import (
-    WRITES_IDX_MAP,
     ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
@@ -21,8 +25,20 @@ from langgraph.checkpoint.base import (
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.base.export import (
+    CHUNK_SIZE,
+    aread_frames,
+    encode_frame,
+    encode_header,
+)
 from langgraph.checkpoint.postgres import _ainternal
-from langgraph.checkpoint.postgres.base import BasePostgresSaver
+from langgraph.checkpoint.postgres.base import (
+    EXPORT_CHECKPOINTS,
+    EXPORT_COPY_SQL,
+    EXPORT_SOURCE,
+    BasePostgresSaver,
+    _columns,
+)
 from langgraph.checkpoint.postgres.shallow import AsyncShallowPostgresSaver
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
@@ -39,8 +55,30 @@ class AsyncPostgresSaver(BasePostgresSaver):
         conn: _ainternal.Conn,
         pipe: AsyncPipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        binary_checkpoints: bool = False,
+        indexed_metadata_keys: Sequence[str] | None = None,
     ) -> None:
+        """
+        Args:
+            conn: The Postgres connection or connection pool.
+            pipe: Optional pipeline to use with a single connection.
+            serde: The serializer to use for checkpoint data.
+            binary_checkpoints: Store new checkpoints and their metadata as a msgpack
+                blob instead of JSONB, which avoids a JSON encode/parse per put and read.
+                Requires running `setup()` to apply the migration. Rows written in either
+                format can always be read.
+            indexed_metadata_keys: With binary_checkpoints, only these metadata keys are
+                kept in the JSONB metadata column, and only they can be used in the
+                `filter` of list(). Defaults to None (all keys).
+        """
         super().__init__(serde=serde)
+        self.binary_checkpoints = binary_checkpoints
+        self.indexed_metadata_keys = (
+            frozenset(indexed_metadata_keys)
+            if indexed_metadata_keys is not None
+            else None
+        )
         if isinstance(conn, AsyncConnectionPool) and pipe is not None:
             raise ValueError(
                 "Pipeline should be used only with a single AsyncConnection, not AsyncConnectionPool."
@@ -112,58 +150,69 @@ class AsyncPostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        channels: Sequence[str] | None = None,
+        include_pending_writes: bool = True,
     ) -> AsyncIterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
         This method retrieves a list of checkpoint tuples from the Postgres database based
         on the provided config. The checkpoints are ordered by checkpoint ID in descending order (newest first).
+        Rows are streamed from a server-side cursor, `LIST_BATCH_SIZE` at a time.
 
         Args:
             config: Base configuration for filtering checkpoints.
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
             limit: Maximum number of checkpoints to return.
+            channels: Only load the values of these channels. Pass an empty list to
+                skip channel values, e.g. when only metadata is needed. Defaults to None (all channels).
+            include_pending_writes: Whether to load the pending writes of each checkpoint. Defaults to True.
 
         Yields:
             AsyncIterator[CheckpointTuple]: An asynchronous iterator of matching checkpoint tuples.
         """
+        select, select_args = self._select_sql(channels, include_pending_writes)
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        query = select + where + " ORDER BY checkpoint_id DESC"
         if limit:
             query += f" LIMIT {limit}"
-        # if we change this to use .stream() we need to make sure to close the cursor
-        async with self._cursor() as cur:
-            await cur.execute(query, args, binary=True)
-            values = await cur.fetchall()
-            if not values:
-                return
-            # migrate pending sends if necessary
-            if to_migrate := [
-                v
-                for v in values
-                if v["checkpoint"]["v"] < 4 and v["parent_checkpoint_id"]
-            ]:
-                await cur.execute(
-                    self.SELECT_PENDING_SENDS_SQL,
-                    (
-                        values[0]["thread_id"],
-                        [v["parent_checkpoint_id"] for v in to_migrate],
-                    ),
-                )
-                grouped_by_parent = defaultdict(list)
-                for value in to_migrate:
-                    grouped_by_parent[value["parent_checkpoint_id"]].append(value)
-                async for sends in cur:
-                    for value in grouped_by_parent[sends["checkpoint_id"]]:
-                        if value["channel_values"] is None:
-                            value["channel_values"] = []
-                        self._migrate_pending_sends(
-                            sends["sends"],
-                            value["checkpoint"],
-                            value["channel_values"],
+        async with self._stream_cursor() as cur:
+            await cur.execute(query, [*select_args, *args])
+            while values := await cur.fetchmany(self.LIST_BATCH_SIZE):
+                self._load_checkpoints(values)
+                # migrate pending sends if necessary
+                if to_migrate := [
+                    v
+                    for v in values
+                    if v["checkpoint"]["v"] < 4 and v["parent_checkpoint_id"]
+                ]:
+                    async with cur.connection.cursor(
+                        binary=True, row_factory=dict_row
+                    ) as sends_cur:
+                        await sends_cur.execute(
+                            self.SELECT_PENDING_SENDS_SQL,
+                            (
+                                values[0]["thread_id"],
+                                [v["parent_checkpoint_id"] for v in to_migrate],
+                            ),
                         )
-            for value in values:
-                yield await self._load_checkpoint_tuple(value)
+                        grouped_by_parent = defaultdict(list)
+                        for value in to_migrate:
+                            grouped_by_parent[value["parent_checkpoint_id"]].append(
+                                value
+                            )
+                        async for sends in sends_cur:
+                            for value in grouped_by_parent[sends["checkpoint_id"]]:
+                                if value["channel_values"] is None:
+                                    value["channel_values"] = []
+                                self._migrate_pending_sends(
+                                    sends["sends"],
+                                    value["checkpoint"],
+                                    value["channel_values"],
+                                )
+                self._project_channels(values, channels)
+                for value in values:
+                    yield await self._load_checkpoint_tuple(value)
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
@@ -198,6 +247,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
             value = await cur.fetchone()
             if value is None:
                 return None
+            self._load_checkpoints([value])
 
             # migrate pending sends if necessary
             if value["checkpoint"]["v"] < 4 and value["parent_checkpoint_id"]:
@@ -261,19 +311,23 @@ class AsyncPostgresSaver(BasePostgresSaver):
             else:
                 blob_values[k] = copy["channel_values"].pop(k)
 
+        # both statements are sent in a single round trip
         async with self._cursor(pipeline=True) as cur:
             if blob_versions := {
                 k: v for k, v in new_versions.items() if k in blob_values
             }:
-                await cur.executemany(
-                    self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                    await asyncio.to_thread(
-                        self._dump_blobs,
-                        thread_id,
-                        checkpoint_ns,
-                        blob_values,
-                        blob_versions,
+                await cur.execute(
+                    self.BULK_UPSERT_CHECKPOINT_BLOBS_SQL,
+                    _columns(
+                        await asyncio.to_thread(
+                            self._dump_blobs,
+                            thread_id,
+                            checkpoint_ns,
+                            blob_values,
+                            blob_versions,
+                        )
                     ),
+                    prepare=True,
                 )
             await cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
@@ -282,9 +336,11 @@ class AsyncPostgresSaver(BasePostgresSaver):
                     checkpoint_ns,
                     checkpoint["id"],
                     checkpoint_id,
-                    Jsonb(copy),
-                    Jsonb(get_checkpoint_metadata(config, metadata)),
+                    *self._dump_checkpoint(
+                        copy, get_checkpoint_metadata(config, metadata)
+                    ),
                 ),
+                prepare=True,
             )
         return next_config
 
@@ -304,13 +360,10 @@ class AsyncPostgresSaver(BasePostgresSaver):
             writes: List of writes to store, each as (channel, value) pair.
             task_id: Identifier for the task creating the writes.
         """
-        query = (
-            self.UPSERT_CHECKPOINT_WRITES_SQL
-            if all(w[0] in WRITES_IDX_MAP for w in writes)
-            else self.INSERT_CHECKPOINT_WRITES_SQL
-        )
-        params = await asyncio.to_thread(
-            self._dump_writes,
+        if not writes:
+            return
+        query, params = await asyncio.to_thread(
+            self._dump_writes_bulk,
             config["configurable"]["thread_id"],
             config["configurable"]["checkpoint_ns"],
             config["configurable"]["checkpoint_id"],
@@ -319,7 +372,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
             writes,
         )
         async with self._cursor(pipeline=True) as cur:
-            await cur.executemany(query, params)
+            await cur.execute(query, params, prepare=True)
 
     async def adelete_thread(self, thread_id: str) -> None:
         """Delete all checkpoints and writes associated with a thread ID.
@@ -344,6 +397,108 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 (str(thread_id),),
             )
 
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Only thread IDs are read, `THREAD_IDS_PAGE_SIZE` at a time, with one query
+        per page, so threads can be deleted while iterating.
+
+        Returns:
+            AsyncIterator[str]: Async iterator of thread IDs.
+        """
+        after = ""
+        while True:
+            async with self._cursor() as cur:
+                await cur.execute(
+                    self.SELECT_THREAD_IDS_SQL, (after, self.THREAD_IDS_PAGE_SIZE)
+                )
+                thread_ids = [row["thread_id"] for row in await cur.fetchall()]
+            for thread_id in thread_ids:
+                yield thread_id
+            if len(thread_ids) < self.THREAD_IDS_PAGE_SIZE:
+                return
+            after = thread_ids[-1]
+
+    async def aexport_threads(self, thread_ids: Sequence[str]) -> AsyncIterator[bytes]:
+        """Export all checkpoints, blobs and writes of the given threads asynchronously.
+
+        Each table is read with a single `COPY ... TO STDOUT (FORMAT BINARY)`. The data
+        is yielded as chunks of a framed byte stream (see `langgraph.checkpoint.base.export`)
+        which can be written to a file and loaded into another database with `aimport_threads`.
+
+        Args:
+            thread_ids: The thread IDs to export.
+
+        Yields:
+            AsyncIterator[bytes]: Chunks of the export stream.
+        """
+        yield encode_header(EXPORT_SOURCE)
+        async with self._copy_cursor() as cur:
+            for kind, query in EXPORT_COPY_SQL.items():
+                async with cur.copy(query, ([str(t) for t in thread_ids],)) as copy:
+                    data = bytearray()
+                    async for chunk in copy:
+                        data += chunk
+                        if len(data) >= CHUNK_SIZE:
+                            yield encode_frame(kind, data)
+                            data.clear()
+                    if data:
+                        yield encode_frame(kind, data)
+
+    async def aimport_threads(
+        self, stream: AsyncIterable[bytes] | Iterable[bytes]
+    ) -> int:
+        """Import threads from a stream created by `aexport_threads` asynchronously.
+
+        Each table is loaded with a single `COPY ... FROM STDIN (FORMAT BINARY)`, all in
+        one transaction. Checkpoints, blobs and writes that already exist are left untouched.
+
+        Args:
+            stream: The chunks of the export stream.
+
+        Returns:
+            int: The number of checkpoints inserted.
+        """
+        inserted = 0
+        async with self._copy_cursor() as cur, AsyncExitStack() as stack:
+            current_kind: int | None = None
+            move_sql = ""
+            async for kind, payload in aread_frames(stream, EXPORT_SOURCE):
+                if kind != current_kind:
+                    # the frames of a table are contiguous, finish the previous one
+                    if current_kind is not None:
+                        await stack.aclose()
+                        await cur.execute(move_sql)
+                        if current_kind == EXPORT_CHECKPOINTS:
+                            inserted += cur.rowcount
+                    create_sql, copy_sql, move_sql = self._import_sql(kind)
+                    await cur.execute(create_sql)
+                    copy = await stack.enter_async_context(cur.copy(copy_sql))
+                    current_kind = kind
+                await copy.write(payload)
+            if current_kind is not None:
+                await stack.aclose()
+                await cur.execute(move_sql)
+                if current_kind == EXPORT_CHECKPOINTS:
+                    inserted += cur.rowcount
+        return inserted
+
+    @asynccontextmanager
+    async def _copy_cursor(self) -> AsyncIterator[AsyncCursor[DictRow]]:
+        """Create a cursor for COPY operations, inside a transaction."""
+        if self.pipe:
+            raise ValueError(
+                "COPY is not supported in pipeline mode. "
+                "Use an AsyncPostgresSaver initialized without a pipeline."
+            )
+        async with (
+            self.lock,
+            _ainternal.get_connection(self.conn) as conn,
+            conn.transaction(),
+            conn.cursor(row_factory=dict_row) as cur,
+        ):
+            yield cur
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -386,6 +541,29 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 async with conn.cursor(binary=True, row_factory=dict_row) as cur:
                     yield cur
 
+    @asynccontextmanager
+    async def _stream_cursor(
+        self,
+    ) -> AsyncIterator[AsyncCursor[DictRow] | AsyncServerCursor[DictRow]]:
+        """Create a cursor that fetches query results in batches.
+
+        Uses a server-side cursor, which has to be declared inside a transaction.
+        Pipeline mode doesn't support server-side cursors, so a regular cursor is
+        used when the AsyncPostgresSaver was initialized with a pipeline.
+        """
+        async with self.lock, _ainternal.get_connection(self.conn) as conn:
+            if self.pipe:
+                async with conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+            else:
+                async with (
+                    conn.transaction(),
+                    conn.cursor(
+                        "list_checkpoints", binary=True, row_factory=dict_row
+                    ) as cur,
+                ):
+                    yield cur
+
     async def _load_checkpoint_tuple(self, value: DictRow) -> CheckpointTuple:
         """
         Convert a database row into a CheckpointTuple object.
@@ -435,6 +613,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        channels: Sequence[str] | None = None,
+        include_pending_writes: bool = True,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
@@ -446,6 +626,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned. Defaults to None.
             limit: Maximum number of checkpoints to return.
+            channels: Only load the values of these channels. Defaults to None (all channels).
+            include_pending_writes: Whether to load the pending writes of each checkpoint. Defaults to True.
 
         Yields:
             Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
@@ -462,7 +644,14 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 )
         except RuntimeError:
             pass
-        aiter_ = self.alist(config, filter=filter, before=before, limit=limit)
+        aiter_ = self.alist(
+            config,
+            filter=filter,
+            before=before,
+            limit=limit,
+            channels=channels,
+            include_pending_writes=include_pending_writes,
+        )
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
@@ -573,5 +762,31 @@ class AsyncPostgresSaver(BasePostgresSaver):
             self.adelete_thread(thread_id), self.loop
         ).result()
 
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Yields:
+            Iterator[str]: An iterator of thread IDs.
+        """
+        try:
+            # check if we are in the main thread, only bg threads can block
+            if asyncio.get_running_loop() is self.loop:
+                raise asyncio.InvalidStateError(
+                    "Synchronous calls to AsyncPostgresSaver are only allowed from a "
+                    "different thread. From the main thread, use the async interface. "
+                    "For example, use `checkpointer.alist_thread_ids()`."
+                )
+        except RuntimeError:
+            pass
+        aiter_ = self.alist_thread_ids()
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    anext(aiter_),  # type: ignore[arg-type]  # noqa: F821
+                    self.loop,
+                ).result()
+            except StopAsyncIteration:
+                break
+
 
 __all__ = ["AsyncPostgresSaver", "AsyncShallowPostgresSaver", "Conn"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from collections.abc import Sequence
-from typing import Any, Optional, cast
+from typing import Any, Optional
 
 from langchain_core.runnables import RunnableConfig
 from psycopg.types.json import Jsonb
@@ -69,17 +69,12 @@ MIGRATIONS = [
     CREATE INDEX CONCURRENTLY IF NOT EXISTS checkpoint_writes_thread_id_idx ON checkpoint_writes(thread_id);
     """,
     """ALTER TABLE checkpoint_writes ADD COLUMN task_path TEXT NOT NULL DEFAULT '';""",
+    # msgpack-encoded checkpoint and metadata, written when binary_checkpoints is enabled.
+    # The serde type is stored in the (previously unused) type column.
+    """ALTER TABLE checkpoints ADD COLUMN checkpoint_blob BYTEA;""",
 ]
 
-SELECT_SQL = """
-select
-    thread_id,
-    checkpoint,
-    checkpoint_ns,
-    checkpoint_id,
-    parent_checkpoint_id,
-    metadata,
-    (
+SELECT_CHANNEL_VALUES_SQL = """(
         select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob])
         from jsonb_each_text(checkpoint -> 'channel_versions')
         inner join checkpoint_blobs bl
@@ -87,17 +82,37 @@ select
             and bl.checkpoint_ns = checkpoints.checkpoint_ns
             and bl.channel = jsonb_each_text.key
             and bl.version = jsonb_each_text.value
-    ) as channel_values,
-    (
+        {channel_filter}
+    )"""
+
+SELECT_PENDING_WRITES_SQL = """(
         select
         array_agg(array[cw.task_id::text::bytea, cw.channel::bytea, cw.type::bytea, cw.blob] order by cw.task_id, cw.idx)
         from checkpoint_writes cw
         where cw.thread_id = checkpoints.thread_id
             and cw.checkpoint_ns = checkpoints.checkpoint_ns
             and cw.checkpoint_id = checkpoints.checkpoint_id
-    ) as pending_writes
+    )"""
+
+PROJECTED_SELECT_SQL = """
+select
+    thread_id,
+    checkpoint,
+    checkpoint_ns,
+    checkpoint_id,
+    parent_checkpoint_id,
+    metadata,
+    type,
+    checkpoint_blob,
+    {channel_values} as channel_values,
+    {pending_writes} as pending_writes
 from checkpoints """
 
+SELECT_SQL = PROJECTED_SELECT_SQL.format(
+    channel_values=SELECT_CHANNEL_VALUES_SQL.format(channel_filter=""),
+    pending_writes=SELECT_PENDING_WRITES_SQL,
+)
+
 SELECT_PENDING_SENDS_SQL = f"""
 select
     checkpoint_id,
@@ -116,12 +131,14 @@ UPSERT_CHECKPOINT_BLOBS_SQL = """
 """
 
 UPSERT_CHECKPOINTS_SQL = """
-    INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata)
-    VALUES (%s, %s, %s, %s, %s, %s)
+    INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata, type, checkpoint_blob)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id)
     DO UPDATE SET
         checkpoint = EXCLUDED.checkpoint,
-        metadata = EXCLUDED.metadata;
+        metadata = EXCLUDED.metadata,
+        type = EXCLUDED.type,
+        checkpoint_blob = EXCLUDED.checkpoint_blob;
 """
 
 UPSERT_CHECKPOINT_WRITES_SQL = """
@@ -139,15 +156,78 @@ INSERT_CHECKPOINT_WRITES_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
 """
 
+# Multi-row versions of the statements above, taking one array per column. Their
+# text doesn't depend on the number of rows, so each is prepared once per connection.
+BULK_UPSERT_CHECKPOINT_BLOBS_SQL = """
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob)
+    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::bytea[])
+    ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
+"""
+
+BULK_UPSERT_CHECKPOINT_WRITES_SQL = """
+    INSERT INTO checkpoint_writes (thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, idx, channel, type, blob)
+    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::integer[], %s::text[], %s::text[], %s::bytea[])
+    ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO UPDATE SET
+        channel = EXCLUDED.channel,
+        type = EXCLUDED.type,
+        blob = EXCLUDED.blob;
+"""
+
+BULK_INSERT_CHECKPOINT_WRITES_SQL = """
+    INSERT INTO checkpoint_writes (thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, idx, channel, type, blob)
+    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::integer[], %s::text[], %s::text[], %s::bytea[])
+    ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx) DO NOTHING
+"""
+
+# Bulk export format: frame payloads hold the raw `COPY ... (FORMAT BINARY)` data
+# of a table, with the frame kind identifying the table.
+EXPORT_SOURCE = "postgres"
+EXPORT_CHECKPOINTS = 1
+EXPORT_TABLES = {
+    EXPORT_CHECKPOINTS: (
+        "checkpoints",
+        "thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata, checkpoint_blob",
+    ),
+    2: (
+        "checkpoint_blobs",
+        "thread_id, checkpoint_ns, channel, version, type, blob",
+    ),
+    3: (
+        "checkpoint_writes",
+        "thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, idx, channel, type, blob",
+    ),
+}
+SELECT_THREAD_IDS_SQL = """
+SELECT DISTINCT thread_id FROM checkpoints
+WHERE thread_id > %s
+ORDER BY thread_id
+LIMIT %s
+"""
+
+EXPORT_COPY_SQL = {
+    kind: f"COPY (SELECT {columns} FROM {table} WHERE thread_id = ANY(%s)) TO STDOUT (FORMAT BINARY)"
+    for kind, (table, columns) in EXPORT_TABLES.items()
+}
+
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
+    # Rows fetched per round trip when streaming results of list()
+    LIST_BATCH_SIZE = 100
+    # Thread IDs fetched per query by list_thread_ids()
+    THREAD_IDS_PAGE_SIZE = 1000
+    SELECT_THREAD_IDS_SQL = SELECT_THREAD_IDS_SQL
+    binary_checkpoints: bool = False
+    indexed_metadata_keys: frozenset[str] | None = None
     SELECT_PENDING_SENDS_SQL = SELECT_PENDING_SENDS_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
+    BULK_UPSERT_CHECKPOINT_BLOBS_SQL = BULK_UPSERT_CHECKPOINT_BLOBS_SQL
+    BULK_UPSERT_CHECKPOINT_WRITES_SQL = BULK_UPSERT_CHECKPOINT_WRITES_SQL
+    BULK_INSERT_CHECKPOINT_WRITES_SQL = BULK_INSERT_CHECKPOINT_WRITES_SQL
 
     supports_pipeline: bool
 
@@ -171,6 +251,107 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             else self.get_next_version(None, None)
         )
 
+    def _select_sql(
+        self, channels: Sequence[str] | None, include_pending_writes: bool
+    ) -> tuple[str, list[Any]]:
+        """Return the SELECT statement and its parameters for the requested projection.
+
+        Args:
+            channels: Only load the values of these channels. None loads all of them.
+            include_pending_writes: Whether to load the pending writes.
+        """
+        if channels is None and include_pending_writes:
+            return self.SELECT_SQL, []
+        args: list[Any] = []
+        if channels is None:
+            channel_values = SELECT_CHANNEL_VALUES_SQL.format(channel_filter="")
+        elif channels:
+            channel_values = SELECT_CHANNEL_VALUES_SQL.format(
+                channel_filter="where jsonb_each_text.key = any(%s)"
+            )
+            args.append(list(channels))
+        else:
+            channel_values = "null"
+        query = PROJECTED_SELECT_SQL.format(
+            channel_values=channel_values,
+            pending_writes=(
+                SELECT_PENDING_WRITES_SQL if include_pending_writes else "null"
+            ),
+        )
+        return query, args
+
+    def _project_channels(
+        self, values: Sequence[dict[str, Any]], channels: Sequence[str] | None
+    ) -> None:
+        """Drop inline channel values outside of `channels` from the loaded rows."""
+        if channels is None:
+            return
+        for value in values:
+            inline = value["checkpoint"].get("channel_values") or {}
+            value["checkpoint"]["channel_values"] = {
+                k: v for k, v in inline.items() if k in channels
+            }
+
+    def _dump_checkpoint(
+        self, checkpoint: dict[str, Any], metadata: dict[str, Any]
+    ) -> tuple[Jsonb, Jsonb, str | None, bytes | None]:
+        """Return the checkpoint, metadata, type and checkpoint_blob column values.
+
+        With binary_checkpoints enabled, the checkpoint and metadata are stored as
+        a single msgpack blob. The JSONB columns then only keep what the queries
+        need: the channel versions (to join checkpoint_blobs) and the indexed
+        metadata keys (to filter in list()).
+        """
+        if not self.binary_checkpoints:
+            return Jsonb(checkpoint), Jsonb(metadata), None, None
+        type_, blob = self.serde.dumps_typed(
+            {"checkpoint": checkpoint, "metadata": metadata}
+        )
+        if self.indexed_metadata_keys is not None:
+            metadata = {
+                k: v for k, v in metadata.items() if k in self.indexed_metadata_keys
+            }
+        skeleton = {
+            "v": checkpoint["v"],
+            "channel_versions": checkpoint["channel_versions"],
+        }
+        return (
+            Jsonb(skeleton),
+            Jsonb(metadata),
+            type_,
+            blob,
+        )
+
+    def _load_checkpoints(self, values: Sequence[dict[str, Any]]) -> None:
+        """Decode the checkpoint and metadata of rows stored as msgpack blobs in place."""
+        for value in values:
+            if value["checkpoint_blob"] is not None:
+                body = self.serde.loads_typed((value["type"], value["checkpoint_blob"]))
+                value["checkpoint"] = body["checkpoint"]
+                value["metadata"] = body["metadata"]
+
+    def _import_sql(self, kind: int) -> tuple[str, str, str]:
+        """Return the statements importing the COPY data of an export frame kind.
+
+        COPY can't skip rows that already exist, so rows are copied into a
+        temporary staging table first, then moved into the target table.
+
+        Returns:
+            The statements creating the staging table, copying into it, and moving
+            its rows into the target table.
+        """
+        if kind not in EXPORT_TABLES:
+            raise ValueError(f"Unknown frame kind {kind} in export stream")
+        table, columns = EXPORT_TABLES[kind]
+        staging = f"import_{table}"
+        return (
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table}) ON COMMIT DROP",
+            f"COPY {staging} ({columns}) FROM STDIN (FORMAT BINARY)",
+            f"WITH moved AS (DELETE FROM {staging} RETURNING {columns}) "
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM moved "
+            "ON CONFLICT DO NOTHING",
+        )
+
     def _load_blobs(
         self, blob_values: list[tuple[bytes, bytes, bytes]]
     ) -> dict[str, Any]:
@@ -197,7 +378,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
                 thread_id,
                 checkpoint_ns,
                 k,
-                cast(str, ver),
+                str(ver),
                 *(
                     self.serde.dumps_typed(values[k])
                     if k in values
@@ -246,6 +427,25 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for idx, (channel, value) in enumerate(writes)
         ]
 
+    def _dump_writes_bulk(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        task_id: str,
+        task_path: str,
+        writes: Sequence[tuple[str, Any]],
+    ) -> tuple[str, list[list[Any]]]:
+        """Return the statement and parameters storing all writes in one insert."""
+        rows = self._dump_writes(
+            thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, writes
+        )
+        if all(w[0] in WRITES_IDX_MAP for w in writes):
+            # a single statement can't update a row twice, the last write wins
+            rows = list({row[5]: row for row in rows}.values())
+            return self.BULK_UPSERT_CHECKPOINT_WRITES_SQL, _columns(rows)
+        return self.BULK_INSERT_CHECKPOINT_WRITES_SQL, _columns(rows)
+
     def get_next_version(self, current: str | None, channel: None) -> str:
         if current is None:
             current_v = 0
@@ -288,6 +488,14 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
 
         # construct predicate for metadata filter
         if filter:
+            if (
+                self.binary_checkpoints
+                and self.indexed_metadata_keys is not None
+                and (unindexed := filter.keys() - self.indexed_metadata_keys)
+            ):
+                raise ValueError(
+                    f"Cannot filter on metadata keys that are not indexed: {sorted(unindexed)}"
+                )
             wheres.append("metadata @> %s ")
             param_values.append(Jsonb(filter))
 
@@ -300,3 +508,8 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             "WHERE " + " AND ".join(wheres) if wheres else "",
             param_values,
         )
+
+
+def _columns(rows: Sequence[Sequence[Any]]) -> list[list[Any]]:
+    """Transpose rows into one list per column, as taken by the BULK_* statements."""
+    return [list(column) for column in zip(*rows)]
@@ -1333,6 +1333,7 @@ def _ensure_index_config(
     index_config["__estimated_num_vectors"] = tot
     embeddings = ensure_embeddings(
         index_config.get("embed"),
+        cache=index_config.get("cache"),
     )
     return embeddings, index_config
 
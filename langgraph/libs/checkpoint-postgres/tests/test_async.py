@@ -344,3 +344,144 @@ async def test_pending_sends_migration(saver_name: str) -> None:
             TASKS: ["send-1", "send-2", "send-3"]
         }
         assert TASKS in search_results[0].checkpoint["channel_versions"]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+async def test_alist_projection(saver_name: str) -> None:
+    async with _saver(saver_name) as saver:
+        saver.LIST_BATCH_SIZE = 2
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        checkpoint = empty_checkpoint()
+        for i in range(5):
+            checkpoint = create_checkpoint(checkpoint, {}, i)
+            checkpoint["channel_values"] = {"foo": f"foo-{i}", "bar": [i]}
+            checkpoint["channel_versions"] = {"foo": i + 1, "bar": i + 1}
+            config = await saver.aput(
+                config, checkpoint, {"step": i}, checkpoint["channel_versions"]
+            )
+            await saver.aput_writes(config, [("foo", f"write-{i}")], task_id="task-1")
+
+        thread_config = {"configurable": {"thread_id": "thread-1"}}
+        # results are streamed in batches of LIST_BATCH_SIZE
+        full = [c async for c in saver.alist(thread_config)]
+        assert [c.metadata["step"] for c in full] == [4, 3, 2, 1, 0]
+        assert full[0].checkpoint["channel_values"] == {"foo": "foo-4", "bar": [4]}
+        assert full[0].pending_writes == [("task-1", "foo", "write-4")]
+
+        projected = [
+            c
+            async for c in saver.alist(
+                thread_config, channels=["foo"], include_pending_writes=False
+            )
+        ]
+        assert [c.metadata for c in projected] == [c.metadata for c in full]
+        assert projected[0].checkpoint["channel_values"] == {"foo": "foo-4"}
+        assert projected[0].pending_writes == []
+
+        metadata_only = [
+            c async for c in saver.alist(thread_config, channels=[], limit=3)
+        ]
+        assert len(metadata_only) == 3
+        assert all(c.checkpoint["channel_values"] == {} for c in metadata_only)
+        assert metadata_only[0].pending_writes == [("task-1", "foo", "write-4")]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+async def test_binary_checkpoints(saver_name: str, test_data) -> None:
+    async with _saver(saver_name) as saver:
+        binary_saver = AsyncPostgresSaver(
+            saver.conn,
+            saver.pipe,
+            binary_checkpoints=True,
+            indexed_metadata_keys=["source"],
+        )
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+        checkpoint["channel_values"] = {"foo": "bar", "baz": ["qux"]}
+        checkpoint["channel_versions"] = {"foo": 1, "baz": 1}
+        metadata = {"source": "loop", "step": 1, "parents": {}}
+        # one row per format, both are readable by either saver
+        json_config = await saver.aput(config, test_data["checkpoints"][0], {}, {})
+        binary_config = await binary_saver.aput(
+            json_config, checkpoint, metadata, checkpoint["channel_versions"]
+        )
+
+        for s in (saver, binary_saver):
+            loaded = await s.aget_tuple(binary_config)
+            assert loaded.checkpoint == checkpoint
+            assert loaded.metadata == metadata
+            assert loaded.parent_config == json_config
+
+        results = [r async for r in binary_saver.alist(None, filter={"source": "loop"})]
+        assert [r.metadata for r in results] == [metadata]
+        with pytest.raises(ValueError, match="not indexed"):
+            [r async for r in binary_saver.alist(None, filter={"step": 1})]
+
+        # without binary_checkpoints the full metadata is stored, so any key filters
+        json_saver = AsyncPostgresSaver(
+            saver.conn, saver.pipe, indexed_metadata_keys=["source"]
+        )
+        await json_saver.aput(
+            {"configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}},
+            test_data["checkpoints"][1],
+            {"source": "input", "step": 2},
+            {},
+        )
+        results = [r async for r in json_saver.alist(None, filter={"step": 2})]
+        assert [r.metadata for r in results] == [{"source": "input", "step": 2}]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool"])
+async def test_export_import_threads(saver_name: str, test_data) -> None:
+    configs = test_data["configs"]
+    checkpoints = test_data["checkpoints"]
+    metadata = test_data["metadata"]
+    async with _saver(saver_name) as saver:
+        for config, checkpoint, meta in zip(configs, checkpoints, metadata):
+            await saver.aput(config, checkpoint, meta, {})
+        blob_checkpoint = create_checkpoint(checkpoints[0], {}, 1)
+        blob_checkpoint["channel_values"] = {"foo": ["bar"]}
+        blob_checkpoint["channel_versions"] = {"foo": 1}
+        blob_config = await saver.aput(
+            configs[0], blob_checkpoint, {}, blob_checkpoint["channel_versions"]
+        )
+        await saver.aput_writes(blob_config, [("foo", "baz")], task_id="task-1")
+        thread_ids = ["thread-1", "thread-2"]
+        stream = [chunk async for chunk in saver.aexport_threads(thread_ids)]
+        expected = [c async for c in saver.alist(None)]
+
+        for thread_id in thread_ids:
+            await saver.adelete_thread(thread_id)
+        assert [c async for c in saver.alist(None)] == []
+
+        assert await saver.aimport_threads(stream) == 4
+        assert [c async for c in saver.alist(None)] == expected
+        assert await saver.aimport_threads(stream) == 0
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+async def test_list_thread_ids(saver_name: str) -> None:
+    async with _saver(saver_name) as saver:
+        saver.THREAD_IDS_PAGE_SIZE = 2
+        checkpoint = empty_checkpoint()
+        for i in (3, 0, 4, 1, 2):
+            for checkpoint_ns in ("", "child"):
+                checkpoint = create_checkpoint(checkpoint, {}, i)
+                await saver.aput(
+                    {
+                        "configurable": {
+                            "thread_id": f"thread-{i}",
+                            "checkpoint_ns": checkpoint_ns,
+                        }
+                    },
+                    checkpoint,
+                    {},
+                    {},
+                )
+        assert [t async for t in saver.alist_thread_ids()] == [
+            f"thread-{i}" for i in range(5)
+        ]
+        # threads can be deleted while paging through them
+        async for thread_id in saver.alist_thread_ids():
+            await saver.adelete_thread(thread_id)
+        assert [t async for t in saver.alist_thread_ids()] == []
@@ -12,6 +12,7 @@ from psycopg.rows import dict_row
 from psycopg_pool import ConnectionPool
 
 from langgraph.checkpoint.base import (
+    ERROR,
     EXCLUDED_METADATA_KEYS,
     Checkpoint,
     CheckpointMetadata,
@@ -332,3 +333,182 @@ def test_pending_sends_migration(saver_name: str) -> None:
             TASKS: ["send-1", "send-2", "send-3"]
         }
         assert TASKS in search_results[0].checkpoint["channel_versions"]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_list_projection(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        saver.LIST_BATCH_SIZE = 2
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        checkpoint = empty_checkpoint()
+        for i in range(5):
+            checkpoint = create_checkpoint(checkpoint, {}, i)
+            checkpoint["channel_values"] = {"foo": f"foo-{i}", "bar": [i]}
+            checkpoint["channel_versions"] = {"foo": i + 1, "bar": i + 1}
+            config = saver.put(
+                config, checkpoint, {"step": i}, checkpoint["channel_versions"]
+            )
+            saver.put_writes(config, [("foo", f"write-{i}")], task_id="task-1")
+
+        thread_config = {"configurable": {"thread_id": "thread-1"}}
+        # results are streamed in batches of LIST_BATCH_SIZE
+        full = list(saver.list(thread_config))
+        assert [c.metadata["step"] for c in full] == [4, 3, 2, 1, 0]
+        assert full[0].checkpoint["channel_values"] == {"foo": "foo-4", "bar": [4]}
+        assert full[0].pending_writes == [("task-1", "foo", "write-4")]
+
+        projected = list(
+            saver.list(thread_config, channels=["foo"], include_pending_writes=False)
+        )
+        assert [c.metadata for c in projected] == [c.metadata for c in full]
+        assert projected[0].checkpoint["channel_values"] == {"foo": "foo-4"}
+        assert projected[0].pending_writes == []
+
+        metadata_only = list(saver.list(thread_config, channels=[], limit=3))
+        assert len(metadata_only) == 3
+        assert all(c.checkpoint["channel_values"] == {} for c in metadata_only)
+        assert metadata_only[0].pending_writes == [("task-1", "foo", "write-4")]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_bulk_put(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+        checkpoint["channel_values"] = {"a": ["a"], "b": {"b": 1}, "c": "c"}
+        checkpoint["channel_versions"] = {"a": 1, "b": "2", "c": 3}
+        config = saver.put(config, checkpoint, {}, checkpoint["channel_versions"])
+        assert saver.get_tuple(config).checkpoint == checkpoint
+
+        # all writes of a call are stored by a single statement
+        saver.put_writes(config, [("a", 1), ("b", 2), ("a", 3)], task_id="task-1")
+        saver.put_writes(config, [("a", 4)], task_id="task-1")
+        saver.put_writes(config, [(ERROR, "first"), (ERROR, "second")], "task-2")
+        saver.put_writes(config, [], task_id="task-3")
+        assert saver.get_tuple(config).pending_writes == [
+            ("task-1", "a", 1),
+            ("task-1", "b", 2),
+            ("task-1", "a", 3),
+            ("task-2", ERROR, "second"),
+        ]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_binary_checkpoints(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        binary_saver = PostgresSaver(
+            saver.conn,
+            saver.pipe,
+            binary_checkpoints=True,
+            indexed_metadata_keys=["source"],
+        )
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+        checkpoint["channel_values"] = {"foo": "bar", "baz": ["qux"]}
+        checkpoint["channel_versions"] = {"foo": 1, "baz": 1}
+        metadata = {"source": "loop", "step": 1, "parents": {}}
+        # one row per format, both are readable by either saver
+        json_config = saver.put(config, test_data["checkpoints"][0], {}, {})
+        binary_config = binary_saver.put(
+            json_config, checkpoint, metadata, checkpoint["channel_versions"]
+        )
+
+        for s in (saver, binary_saver):
+            loaded = s.get_tuple(binary_config)
+            assert loaded.checkpoint == checkpoint
+            assert loaded.metadata == metadata
+            assert loaded.parent_config == json_config
+            assert (
+                s.get_tuple(json_config).checkpoint["id"]
+                == json_config["configurable"]["checkpoint_id"]
+            )
+
+        with saver._cursor() as cur:
+            cur.execute(
+                "SELECT checkpoint, metadata FROM checkpoints WHERE checkpoint_id = %s",
+                (checkpoint["id"],),
+            )
+            row = cur.fetchone()
+        assert row["checkpoint"] == {
+            "v": checkpoint["v"],
+            "channel_versions": checkpoint["channel_versions"],
+        }
+        assert row["metadata"] == {"source": "loop"}
+
+        results = list(binary_saver.list(None, filter={"source": "loop"}))
+        assert [r.metadata for r in results] == [metadata]
+        with pytest.raises(ValueError, match="not indexed"):
+            list(binary_saver.list(None, filter={"step": 1}))
+
+        # without binary_checkpoints the full metadata is stored, so any key filters
+        json_saver = PostgresSaver(
+            saver.conn, saver.pipe, indexed_metadata_keys=["source"]
+        )
+        json_saver.put(
+            {"configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}},
+            test_data["checkpoints"][1],
+            {"source": "input", "step": 2},
+            {},
+        )
+        results = list(json_saver.list(None, filter={"step": 2}))
+        assert [r.metadata for r in results] == [{"source": "input", "step": 2}]
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool"])
+def test_export_import_threads(saver_name: str, test_data) -> None:
+    configs = test_data["configs"]
+    checkpoints = test_data["checkpoints"]
+    metadata = test_data["metadata"]
+    with _saver(saver_name) as saver:
+        for config, checkpoint, meta in zip(configs, checkpoints, metadata):
+            saver.put(config, checkpoint, meta, {})
+        blob_checkpoint = create_checkpoint(checkpoints[0], {}, 1)
+        blob_checkpoint["channel_values"] = {"foo": ["bar"]}
+        blob_checkpoint["channel_versions"] = {"foo": 1}
+        blob_config = saver.put(
+            configs[0], blob_checkpoint, {}, blob_checkpoint["channel_versions"]
+        )
+        saver.put_writes(blob_config, [("foo", "baz")], task_id="task-1")
+        thread_ids = ["thread-1", "thread-2"]
+        stream = list(saver.export_threads(thread_ids))
+        expected = list(saver.list(None))
+
+        for thread_id in thread_ids:
+            saver.delete_thread(thread_id)
+        assert list(saver.list(None)) == []
+
+        # split the stream at arbitrary positions
+        data = b"".join(stream)
+        assert saver.import_threads([data[:10], data[10:1000], data[1000:]]) == 4
+        assert list(saver.list(None)) == expected
+        assert saver.import_threads(stream) == 0
+
+    with _saver("pipe") as saver:
+        with pytest.raises(ValueError, match="pipeline"):
+            list(saver.export_threads(thread_ids))
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe"])
+def test_list_thread_ids(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        saver.THREAD_IDS_PAGE_SIZE = 2
+        checkpoint = empty_checkpoint()
+        for i in (3, 0, 4, 1, 2):
+            for checkpoint_ns in ("", "child"):
+                checkpoint = create_checkpoint(checkpoint, {}, i)
+                saver.put(
+                    {
+                        "configurable": {
+                            "thread_id": f"thread-{i}",
+                            "checkpoint_ns": checkpoint_ns,
+                        }
+                    },
+                    checkpoint,
+                    {},
+                    {},
+                )
+        assert list(saver.list_thread_ids()) == [f"thread-{i}" for i in range(5)]
+        # threads can be deleted while paging through them
+        for thread_id in saver.list_thread_ids():
+            saver.delete_thread(thread_id)
+        assert list(saver.list_thread_ids()) == []
@@ -1,26 +1,46 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import datetime
 import sqlite3
 import threading
 from collections.abc import Mapping, Sequence
+from typing import Any, Callable, TypeVar
 
 from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
+T = TypeVar("T")
+
 
 class SqliteCache(BaseCache[ValueT]):
-    """File-based cache using SQLite."""
+    """File-based cache using SQLite.
+
+    Async methods run on a dedicated I/O thread owned by the cache, so lookups
+    never block the event loop or compete for the default executor.
+    """
 
     def __init__(
         self,
         *,
         path: str,
         serde: SerializerProtocol | None = None,
+        max_entries: int | None = None,
     ) -> None:
-        """Initialize the cache with a file path."""
+        """Initialize the cache with a file path.
+
+        Args:
+            path: Path to the SQLite database file.
+            serde: The serializer to use for cached values.
+            max_entries: Maximum number of entries to keep. Once exceeded, expired
+                entries are dropped first, then the least recently written ones.
+                Defaults to None (unbounded).
+        """
         super().__init__(serde=serde)
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
         # SQLite backing store
         self._conn = sqlite3.connect(
             path,
@@ -28,6 +48,8 @@ class SqliteCache(BaseCache[ValueT]):
         )
         # Serialize access to the shared connection across threads
         self._lock = threading.RLock()
+        # Single thread running the async methods, created on first use
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
         # Better concurrency & atomicity
         self._conn.execute("PRAGMA journal_mode=WAL;")
         # Schema: key -> (expiry, encoding, value)
@@ -41,59 +63,102 @@ class SqliteCache(BaseCache[ValueT]):
                 PRIMARY KEY (ns, key)
             )"""
         )
+        # Lets expired entries be purged with one range delete
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_expiry_idx ON cache (expiry) WHERE expiry IS NOT NULL"
+        )
         self._conn.commit()
+        # Upper bound on the number of rows, refreshed whenever entries are evicted
+        self._size_estimate = (
+            self._conn.execute("SELECT count(*) FROM cache").fetchone()[0]
+            if max_entries is not None
+            else 0
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run `func` on the cache's I/O thread."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="sqlite-cache"
+                    )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
 
     def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
         """Get the cached values for the given keys."""
-        with self._lock, self._conn:
-            now = datetime.datetime.now(datetime.timezone.utc).timestamp()
-            if not keys:
-                return {}
-            placeholders = ",".join("(?, ?)" for _ in keys)
-            params: list[str] = []
-            for ns_tuple, key in keys:
-                params.extend((",".join(ns_tuple), key))
-            cursor = self._conn.execute(
-                f"SELECT ns, key, expiry, encoding, val FROM cache WHERE (ns, key) IN ({placeholders})",
-                tuple(params),
-            )
-            values: dict[FullKey, ValueT] = {}
-            rows = cursor.fetchall()
-            for ns, key, expiry, encoding, raw in rows:
-                if expiry is not None and now > expiry:
-                    # purge expired entry
-                    self._conn.execute(
-                        "DELETE FROM cache WHERE (ns, key) = (?, ?)", (ns, key)
-                    )
-                    continue
-                values[(tuple(ns.split(",")), key)] = self.serde.loads_typed(
-                    (encoding, raw)
-                )
-            return values
+        if not keys:
+            return {}
+        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        placeholders = ",".join("(?, ?)" for _ in keys)
+        params: list[Any] = []
+        for ns_tuple, key in keys:
+            params.extend((",".join(ns_tuple), key))
+        params.append(now)
+        # Expired entries are skipped here and purged in bulk by `set`
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT ns, key, encoding, val FROM cache WHERE (ns, key) IN ({placeholders}) AND (expiry IS NULL OR expiry >= ?)",
+                params,
+            ).fetchall()
+        return {
+            (tuple(ns.split(",")), key): self.serde.loads_typed((encoding, raw))
+            for ns, key, encoding, raw in rows
+        }
 
     async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
         """Asynchronously get the cached values for the given keys."""
-        return await asyncio.to_thread(self.get, keys)
+        return await self._run(self.get, keys)
 
     def set(self, mapping: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
         """Set the cached values for the given keys and TTLs."""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        rows = []
+        for key, (value, ttl) in mapping.items():
+            if ttl is not None:
+                delta = datetime.timedelta(seconds=ttl)
+                expiry: float | None = (now + delta).timestamp()
+            else:
+                expiry = None
+            encoding, raw = self.serde.dumps_typed(value)
+            rows.append((",".join(key[0]), key[1], expiry, encoding, raw))
         with self._lock, self._conn:
-            now = datetime.datetime.now(datetime.timezone.utc)
-            for key, (value, ttl) in mapping.items():
-                if ttl is not None:
-                    delta = datetime.timedelta(seconds=ttl)
-                    expiry: float | None = (now + delta).timestamp()
-                else:
-                    expiry = None
-                encoding, raw = self.serde.dumps_typed(value)
-                self._conn.execute(
-                    "INSERT OR REPLACE INTO cache (ns, key, expiry, encoding, val) VALUES (?, ?, ?, ?, ?)",
-                    (",".join(key[0]), key[1], expiry, encoding, raw),
-                )
+            purged = self._conn.execute(
+                "DELETE FROM cache WHERE expiry IS NOT NULL AND expiry < ?",
+                (now.timestamp(),),
+            ).rowcount
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (ns, key, expiry, encoding, val) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            if self.max_entries is not None:
+                self._size_estimate += len(rows) - purged
+                if self._size_estimate > self.max_entries:
+                    self._evict(self.max_entries)
+
+    def _evict(self, max_entries: int) -> None:
+        """Delete the least recently written entries, down to 90% of `max_entries`.
+
+        Rows get a new rowid each time they are written, so rowid order
+        approximates write order. Trimming below the limit means eviction runs
+        once per batch of writes rather than on every write.
+        """
+        keep = max_entries - max_entries // 10
+        self._size_estimate -= self._conn.execute(
+            "DELETE FROM cache WHERE rowid <= (SELECT rowid FROM cache ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (keep,),
+        ).rowcount
+        if self._size_estimate > keep:
+            # Overwritten keys were counted as new rows
+            self._size_estimate = self._conn.execute(
+                "SELECT count(*) FROM cache"
+            ).fetchone()[0]
 
     async def aset(self, mapping: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
         """Asynchronously set the cached values for the given keys and TTLs."""
-        await asyncio.to_thread(self.set, mapping)
+        await self._run(self.set, mapping)
 
     def clear(self, namespaces: Sequence[Namespace] | None = None) -> None:
         """Delete the cached values for the given namespaces.
@@ -101,20 +166,23 @@ class SqliteCache(BaseCache[ValueT]):
         with self._lock, self._conn:
             if namespaces is None:
                 self._conn.execute("DELETE FROM cache")
+                self._size_estimate = 0
             else:
                 placeholders = ",".join("?" for _ in namespaces)
-                self._conn.execute(
+                self._size_estimate -= self._conn.execute(
                     f"DELETE FROM cache WHERE (ns) IN ({placeholders})",
                     tuple(",".join(key) for key in namespaces),
-                )
+                ).rowcount
 
     async def aclear(self, namespaces: Sequence[Namespace] | None = None) -> None:
         """Asynchronously delete the cached values for the given namespaces.
         If no namespaces are provided, clear all cached values."""
-        await asyncio.to_thread(self.clear, namespaces)
+        await self._run(self.clear, namespaces)
 
     def __del__(self) -> None:
         try:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
             self._conn.close()
         except Exception:
             pass
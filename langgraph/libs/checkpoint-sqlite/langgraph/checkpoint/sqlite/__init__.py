@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import queue
 import random
 import sqlite3
 import threading
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from contextlib import closing, contextmanager
 from typing import Any, cast
 
@@ -20,8 +21,16 @@ from langgraph.checkpoint.base import (
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.base.export import (
+    CHUNK_SIZE,
+    decode_row,
+    encode_frame,
+    encode_header,
+    encode_row,
+    read_frames,
+)
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import read_only_uri, search_where
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -33,20 +42,66 @@ _AIO_ERROR_MSG = (
     "for more information."
 )
 
+SELECT_CHECKPOINT_SQL = "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+SELECT_LATEST_CHECKPOINT_SQL = "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1"
+SELECT_WRITES_SQL = "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx"
+
+# Bulk export format: the frames of a stream hold one msgpack-encoded row each,
+# with the frame kind identifying the table.
+EXPORT_SOURCE = "sqlite"
+EXPORT_CHECKPOINTS = 1
+EXPORT_WRITES = 2
+EXPORT_TABLES = {
+    EXPORT_CHECKPOINTS: (
+        "checkpoints",
+        "thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata",
+    ),
+    EXPORT_WRITES: (
+        "writes",
+        "thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value",
+    ),
+}
+# Thread IDs bound per export query, well below SQLite's host parameter limit
+EXPORT_THREADS_BATCH_SIZE = 500
+# Rows inserted per executemany() call when importing
+IMPORT_BATCH_SIZE = 1000
+# Thread IDs fetched per query by list_thread_ids()
+THREAD_IDS_PAGE_SIZE = 1000
+SELECT_THREAD_IDS_SQL = (
+    "SELECT DISTINCT thread_id FROM checkpoints WHERE thread_id > ? "
+    "ORDER BY thread_id LIMIT ?"
+)
+
+
+def export_select_sql(kind: int, num_threads: int) -> str:
+    table, columns = EXPORT_TABLES[kind]
+    placeholders = ", ".join("?" * num_threads)
+    return f"SELECT {columns} FROM {table} WHERE thread_id IN ({placeholders})"
+
+
+def import_insert_sql(kind: int) -> str:
+    table, columns = EXPORT_TABLES[kind]
+    placeholders = ", ".join("?" * len(columns.split(", ")))
+    return f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({placeholders})"
+
 
 class SqliteSaver(BaseCheckpointSaver[str]):
     """A checkpoint saver that stores checkpoints in a SQLite database.
 
     Note:
         This class is meant for lightweight, synchronous use cases
-        (demos and small projects) and does not
-        scale to multiple threads.
+        (demos and small projects). All operations share one connection
+        guarded by a lock, unless `read_pool_size` is set: since the database
+        runs in WAL mode, `get_tuple` and `list` can then use a pool of
+        read-only connections and no longer wait for writes from other threads.
         For a similar sqlite saver with `async` support,
         consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
 
     Args:
         conn (sqlite3.Connection): The SQLite database connection.
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to JsonPlusSerializerCompat.
+        read_pool_size (int): Number of read-only connections to open for reads.
+            Ignored for in-memory databases. Defaults to 0 (reads use `conn`).
 
     Examples:
 
@@ -79,20 +134,26 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         conn: sqlite3.Connection,
         *,
         serde: SerializerProtocol | None = None,
+        read_pool_size: int = 0,
     ) -> None:
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
         self.is_setup = False
         self.lock = threading.Lock()
+        self.read_pool_size = read_pool_size
+        self.readers: queue.SimpleQueue[sqlite3.Connection] | None = None
 
     @classmethod
     @contextmanager
-    def from_conn_string(cls, conn_string: str) -> Iterator[SqliteSaver]:
+    def from_conn_string(
+        cls, conn_string: str, *, read_pool_size: int = 0
+    ) -> Iterator[SqliteSaver]:
         """Create a new SqliteSaver instance from a connection string.
 
         Args:
             conn_string: The SQLite connection string.
+            read_pool_size: Number of read-only connections to open for reads.
 
         Yields:
             SqliteSaver: A new SqliteSaver instance.
@@ -116,7 +177,17 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 check_same_thread=False,
             )
         ) as conn:
-            yield cls(conn)
+            saver = cls(conn, read_pool_size=read_pool_size)
+            try:
+                yield saver
+            finally:
+                saver.close()
+
+    def close(self) -> None:
+        """Close the read-only connections. The main connection is left open."""
+        readers, self.readers = self.readers, None
+        while readers is not None and not readers.empty():
+            readers.get_nowait().close()
 
     def setup(self) -> None:
         """Set up the checkpoint database.
@@ -154,6 +225,14 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             );
             """
         )
+        if self.read_pool_size and (
+            uri := read_only_uri(self.conn.execute("PRAGMA database_list"))
+        ):
+            self.readers = queue.SimpleQueue()
+            for _ in range(self.read_pool_size):
+                self.readers.put(
+                    sqlite3.connect(uri, uri=True, check_same_thread=False)
+                )
 
         self.is_setup = True
 
@@ -180,6 +259,37 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor for reading from the SQLite database.
+
+        Uses an idle connection from the read pool if there is one, and otherwise
+        falls back to `cursor(transaction=False)`. It is used internally by the
+        SqliteSaver and should not be called directly by the user.
+
+        Yields:
+            sqlite3.Cursor: A cursor for the SQLite database.
+        """
+        if not self.is_setup:
+            with self.lock:
+                self.setup()
+        try:
+            conn = self.readers.get_nowait() if self.readers is not None else None
+        except queue.Empty:
+            conn = None
+        if conn is None:
+            with self.cursor(transaction=False) as cur:
+                yield cur
+            return
+        try:
+            with closing(conn.cursor()) as cur:
+                yield cur
+        finally:
+            if self.readers is not None:
+                self.readers.put(conn)
+            else:
+                conn.close()
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -216,11 +326,11 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             CheckpointTuple(...)
         """  # noqa
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        with self.cursor(transaction=False) as cur:
+        with self._read_cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    SELECT_CHECKPOINT_SQL,
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -229,7 +339,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 )
             else:
                 cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    SELECT_LATEST_CHECKPOINT_SQL,
                     (str(config["configurable"]["thread_id"]), checkpoint_ns),
                 )
             # if a checkpoint is found, return it
@@ -252,7 +362,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     }
                 # find any pending writes
                 cur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                    SELECT_WRITES_SQL,
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -332,7 +442,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        with self.cursor(transaction=False) as cur, closing(self.conn.cursor()) as wcur:
+        with (
+            self._read_cursor() as cur,
+            closing(cur.connection.cursor()) as wcur,
+        ):
             cur.execute(query, param_values)
             for (
                 thread_id,
@@ -344,7 +457,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 metadata,
             ) in cur:
                 wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                    SELECT_WRITES_SQL,
                     (thread_id, checkpoint_ns, checkpoint_id),
                 )
                 yield CheckpointTuple(
@@ -495,6 +608,95 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 (str(thread_id),),
             )
 
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Only thread IDs are read, `THREAD_IDS_PAGE_SIZE` at a time, with one query
+        per page, so threads can be deleted while iterating.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs.
+        """
+        after = ""
+        while True:
+            with self._read_cursor() as cur:
+                cur.execute(SELECT_THREAD_IDS_SQL, (after, THREAD_IDS_PAGE_SIZE))
+                thread_ids = [thread_id for (thread_id,) in cur.fetchall()]
+            yield from thread_ids
+            if len(thread_ids) < THREAD_IDS_PAGE_SIZE:
+                return
+            after = thread_ids[-1]
+
+    def export_threads(self, thread_ids: Sequence[str]) -> Iterator[bytes]:
+        """Export all checkpoints and writes of the given threads.
+
+        Yields chunks of a framed byte stream (see `langgraph.checkpoint.base.export`)
+        which can be written to a file and loaded into another database with
+        `import_threads`.
+
+        Args:
+            thread_ids: The thread IDs to export.
+
+        Yields:
+            Iterator[bytes]: Chunks of the export stream.
+
+        Examples:
+
+            >>> with open("threads.export", "wb") as f:
+            ...     for chunk in memory.export_threads(["1", "2"]):
+            ...         f.write(chunk)
+        """
+        buffer = bytearray(encode_header(EXPORT_SOURCE))
+        for i in range(0, len(thread_ids), EXPORT_THREADS_BATCH_SIZE):
+            batch = [str(t) for t in thread_ids[i : i + EXPORT_THREADS_BATCH_SIZE]]
+            for kind in EXPORT_TABLES:
+                with self._read_cursor() as cur:
+                    cur.execute(export_select_sql(kind, len(batch)), batch)
+                    for row in cur:
+                        buffer += encode_frame(kind, encode_row(tuple(row)))
+                        if len(buffer) >= CHUNK_SIZE:
+                            yield bytes(buffer)
+                            buffer.clear()
+        yield bytes(buffer)
+
+    def import_threads(self, stream: Iterable[bytes]) -> int:
+        """Import threads from a stream created by `export_threads`.
+
+        Rows are inserted in batches with `executemany`, all in one transaction.
+        Checkpoints and writes that already exist are left untouched.
+
+        Args:
+            stream: The chunks of the export stream.
+
+        Returns:
+            int: The number of checkpoints inserted.
+
+        Examples:
+
+            >>> with open("threads.export", "rb") as f:
+            ...     memory.import_threads(iter(lambda: f.read(1 << 16), b""))
+            2
+        """
+        inserted = 0
+        batches: dict[int, list[list[Any]]] = {}
+        with self.cursor(transaction=False) as cur, self.conn:
+            for kind, payload in read_frames(stream, EXPORT_SOURCE):
+                if kind not in EXPORT_TABLES:
+                    raise ValueError(f"Unknown frame kind {kind} in export stream")
+                batch = batches.setdefault(kind, [])
+                batch.append(decode_row(payload))
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    cur.executemany(import_insert_sql(kind), batch)
+                    if kind == EXPORT_CHECKPOINTS:
+                        inserted += cur.rowcount
+                    batch.clear()
+            for kind, batch in batches.items():
+                if batch:
+                    cur.executemany(import_insert_sql(kind), batch)
+                    if kind == EXPORT_CHECKPOINTS:
+                        inserted += cur.rowcount
+        return inserted
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
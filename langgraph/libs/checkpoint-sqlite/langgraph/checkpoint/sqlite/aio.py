@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
 from contextlib import asynccontextmanager
 from typing import Any, Callable, TypeVar, cast
 
@@ -20,8 +20,30 @@ from langgraph.checkpoint.base import (
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
+from langgraph.checkpoint.base.export import (
+    CHUNK_SIZE,
+    aread_frames,
+    decode_row,
+    encode_frame,
+    encode_header,
+    encode_row,
+)
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite import (
+    EXPORT_CHECKPOINTS,
+    EXPORT_SOURCE,
+    EXPORT_TABLES,
+    EXPORT_THREADS_BATCH_SIZE,
+    IMPORT_BATCH_SIZE,
+    SELECT_CHECKPOINT_SQL,
+    SELECT_LATEST_CHECKPOINT_SQL,
+    SELECT_THREAD_IDS_SQL,
+    SELECT_WRITES_SQL,
+    THREAD_IDS_PAGE_SIZE,
+    export_select_sql,
+    import_insert_sql,
+)
+from langgraph.checkpoint.sqlite.utils import read_only_uri, search_where
 
 T = TypeVar("T", bound=Callable)
 
@@ -52,6 +74,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         will not exit until the connection is closed).
 
         The easiest way is to use the `async with` statement as shown in the examples.
+        Savers created with `read_pool_size` also hold read-only connections,
+        which are closed by `from_conn_string` or by calling `aclose()`.
 
         ```python
         async with AsyncSqliteSaver.from_conn_string("checkpoints.sqlite") as saver:
@@ -111,29 +135,54 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         conn: aiosqlite.Connection,
         *,
         serde: SerializerProtocol | None = None,
+        read_pool_size: int = 0,
     ):
+        """Initialize the saver.
+
+        Args:
+            conn: The asynchronous SQLite database connection, used for writes.
+            serde: The serializer to use for checkpoints.
+            read_pool_size: Number of read-only connections to open for
+                `aget_tuple` and `alist`. Since the database runs in WAL mode,
+                reads on these connections don't wait for writes, or for the
+                lock guarding `conn`. Ignored for in-memory databases.
+                Defaults to 0 (reads use `conn`).
+        """
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.is_setup = False
+        self.read_pool_size = read_pool_size
+        self.readers: asyncio.Queue[aiosqlite.Connection] | None = None
 
     @classmethod
     @asynccontextmanager
     async def from_conn_string(
-        cls, conn_string: str
+        cls, conn_string: str, *, read_pool_size: int = 0
     ) -> AsyncIterator[AsyncSqliteSaver]:
         """Create a new AsyncSqliteSaver instance from a connection string.
 
         Args:
             conn_string: The SQLite connection string.
+            read_pool_size: Number of read-only connections to open for reads.
 
         Yields:
             AsyncSqliteSaver: A new AsyncSqliteSaver instance.
         """
         async with aiosqlite.connect(conn_string) as conn:
-            yield cls(conn)
+            saver = cls(conn, read_pool_size=read_pool_size)
+            try:
+                yield saver
+            finally:
+                await saver.aclose()
+
+    async def aclose(self) -> None:
+        """Close the read-only connections. The main connection is left open."""
+        readers, self.readers = self.readers, None
+        while readers is not None and not readers.empty():
+            await readers.get_nowait().close()
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
@@ -309,9 +358,39 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 """
             ):
                 await self.conn.commit()
+            if self.read_pool_size:
+                async with self.conn.execute("PRAGMA database_list") as cur:
+                    uri = read_only_uri(await cur.fetchall())
+                if uri is not None:
+                    self.readers = asyncio.Queue()
+                    for _ in range(self.read_pool_size):
+                        self.readers.put_nowait(await aiosqlite.connect(uri, uri=True))
 
             self.is_setup = True
 
+    @asynccontextmanager
+    async def _read_conn(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow an idle read-only connection.
+
+        Falls back to the main connection, under the lock, when the pool is
+        disabled or all of its connections are in use.
+        """
+        try:
+            conn = self.readers.get_nowait() if self.readers is not None else None
+        except asyncio.QueueEmpty:
+            conn = None
+        if conn is None:
+            async with self.lock:
+                yield self.conn
+            return
+        try:
+            yield conn
+        finally:
+            if self.readers is not None:
+                self.readers.put_nowait(conn)
+            else:
+                await conn.close()
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -328,11 +407,11 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         """
         await self.setup()
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        async with self.lock, self.conn.cursor() as cur:
+        async with self._read_conn() as conn, conn.cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    SELECT_CHECKPOINT_SQL,
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -341,7 +420,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 )
             else:
                 await cur.execute(
-                    "SELECT thread_id, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    SELECT_LATEST_CHECKPOINT_SQL,
                     (str(config["configurable"]["thread_id"]), checkpoint_ns),
                 )
             # if a checkpoint is found, return it
@@ -364,7 +443,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     }
                 # find any pending writes
                 await cur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                    SELECT_WRITES_SQL,
                     (
                         str(config["configurable"]["thread_id"]),
                         checkpoint_ns,
@@ -429,9 +508,9 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         if limit:
             query += f" LIMIT {limit}"
         async with (
-            self.lock,
-            self.conn.execute(query, params) as cur,
-            self.conn.cursor() as wcur,
+            self._read_conn() as conn,
+            conn.execute(query, params) as cur,
+            conn.cursor() as wcur,
         ):
             async for (
                 thread_id,
@@ -443,7 +522,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 metadata,
             ) in cur:
                 await wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                    SELECT_WRITES_SQL,
                     (thread_id, checkpoint_ns, checkpoint_id),
                 )
                 yield CheckpointTuple(
@@ -591,6 +670,100 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             )
             await self.conn.commit()
 
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Only thread IDs are read, `THREAD_IDS_PAGE_SIZE` at a time, with one query
+        per page, so threads can be deleted while iterating.
+
+        Returns:
+            AsyncIterator[str]: Async iterator of thread IDs.
+        """
+        await self.setup()
+        after = ""
+        while True:
+            async with (
+                self._read_conn() as conn,
+                conn.execute(
+                    SELECT_THREAD_IDS_SQL, (after, THREAD_IDS_PAGE_SIZE)
+                ) as cur,
+            ):
+                thread_ids = [thread_id for (thread_id,) in await cur.fetchall()]
+            for thread_id in thread_ids:
+                yield thread_id
+            if len(thread_ids) < THREAD_IDS_PAGE_SIZE:
+                return
+            after = thread_ids[-1]
+
+    async def aexport_threads(self, thread_ids: Sequence[str]) -> AsyncIterator[bytes]:
+        """Export all checkpoints and writes of the given threads asynchronously.
+
+        Yields chunks of a framed byte stream (see `langgraph.checkpoint.base.export`)
+        which can be written to a file and loaded into another database with
+        `aimport_threads`.
+
+        Args:
+            thread_ids: The thread IDs to export.
+
+        Yields:
+            AsyncIterator[bytes]: Chunks of the export stream.
+        """
+        await self.setup()
+        buffer = bytearray(encode_header(EXPORT_SOURCE))
+        for i in range(0, len(thread_ids), EXPORT_THREADS_BATCH_SIZE):
+            batch = [str(t) for t in thread_ids[i : i + EXPORT_THREADS_BATCH_SIZE]]
+            for kind in EXPORT_TABLES:
+                async with (
+                    self._read_conn() as conn,
+                    conn.execute(export_select_sql(kind, len(batch)), batch) as cur,
+                ):
+                    async for row in cur:
+                        buffer += encode_frame(kind, encode_row(tuple(row)))
+                        if len(buffer) >= CHUNK_SIZE:
+                            yield bytes(buffer)
+                            buffer.clear()
+        yield bytes(buffer)
+
+    async def aimport_threads(
+        self, stream: AsyncIterable[bytes] | Iterable[bytes]
+    ) -> int:
+        """Import threads from a stream created by `aexport_threads` asynchronously.
+
+        Rows are inserted in batches with `executemany`, all in one transaction.
+        Checkpoints and writes that already exist are left untouched.
+
+        Args:
+            stream: The chunks of the export stream.
+
+        Returns:
+            int: The number of checkpoints inserted.
+        """
+        await self.setup()
+        inserted = 0
+        batches: dict[int, list[list[Any]]] = {}
+        async with self.lock, self.conn.cursor() as cur:
+            try:
+                async for kind, payload in aread_frames(stream, EXPORT_SOURCE):
+                    if kind not in EXPORT_TABLES:
+                        raise ValueError(f"Unknown frame kind {kind} in export stream")
+                    batch = batches.setdefault(kind, [])
+                    batch.append(decode_row(payload))
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        await cur.executemany(import_insert_sql(kind), batch)
+                        if kind == EXPORT_CHECKPOINTS:
+                            inserted += cur.rowcount
+                        batch.clear()
+                for kind, batch in batches.items():
+                    if batch:
+                        await cur.executemany(import_insert_sql(kind), batch)
+                        if kind == EXPORT_CHECKPOINTS:
+                            inserted += cur.rowcount
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            await self.conn.commit()
+        return inserted
+
     def get_next_version(self, current: str | None, channel: None) -> str:
         """Generate the next version ID for a channel.
 
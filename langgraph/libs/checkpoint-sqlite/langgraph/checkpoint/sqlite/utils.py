@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from pathlib import Path
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
@@ -94,3 +95,15 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def read_only_uri(database_list: Iterable[Sequence[Any]]) -> str | None:
+    """Return a read-only URI for the main database file.
+
+    Takes the rows of `PRAGMA database_list`. Returns None for in-memory and
+    temporary databases, which cannot be shared with other connections.
+    """
+    for _, name, file in database_list:
+        if name == "main" and file:
+            return f"{Path(file).as_uri()}?mode=ro"
+    return None
@@ -23,6 +23,7 @@ from langgraph.store.base import (
 )
 from langgraph.store.base.batch import AsyncBatchedBaseStore
 from langgraph.store.sqlite.base import (
+    _ANN_INDEX_BATCH_SIZE,
     _PLACEHOLDER,
     BaseSqliteStore,
     SqliteIndexConfig,
@@ -209,6 +210,11 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
                         "INSERT INTO vector_migrations (v) VALUES (?)", (v,)
                     )
 
+                if ann_query := self._get_ann_create_query():
+                    await self.conn.execute(ann_query)
+                    async with self.conn.cursor() as cur:
+                        await self._index_ann_vectors(cur)
+
             self.is_setup = True
 
     @asynccontextmanager
@@ -243,12 +249,8 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
             int: The number of deleted items.
         """
         async with self._cursor() as cur:
-            await cur.execute(
-                """
-                DELETE FROM store
-                WHERE expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP
-                """
-            )
+            for query, params in self._get_sweep_ttl_queries():
+                await cur.execute(query, params)
             deleted_count = cur.rowcount
             return deleted_count
 
@@ -494,6 +496,23 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
         for query, params in queries:
             await cur.execute(query, params)
 
+        if embedding_request:
+            await self._index_ann_vectors(cur, txt_params)
+
+    async def _index_ann_vectors(
+        self,
+        cur: aiosqlite.Cursor,
+        vector_keys: Sequence[tuple[str, str, str, Any]] | None = None,
+    ) -> None:
+        """Add stored vectors to the ANN index, if one is configured."""
+        if not (missing_query := self._get_ann_missing_query(vector_keys)):
+            return
+        insert_query = self._get_ann_insert_query()
+        await cur.execute(*missing_query)
+        async with self.conn.cursor() as write_cur:
+            while rows := await cur.fetchmany(_ANN_INDEX_BATCH_SIZE):
+                await write_cur.executemany(insert_query, rows)
+
     async def _batch_search_ops(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
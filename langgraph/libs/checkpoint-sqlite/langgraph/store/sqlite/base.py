@@ -8,8 +8,8 @@ import sqlite3
 import threading
 from collections import defaultdict
 from collections.abc import Iterable, Iterator, Sequence
-from contextlib import contextmanager
-from typing import Any, Callable, Literal, NamedTuple, cast
+from contextlib import closing, contextmanager
+from typing import Any, Callable, Literal, NamedTuple, TypedDict, cast
 
 import orjson
 import sqlite_vec  # type: ignore[import-untyped]
@@ -88,10 +88,43 @@ CREATE TABLE IF NOT EXISTS store_vectors (
 ]
 
 
-class SqliteIndexConfig(IndexConfig):
+class ANNIndexConfig(TypedDict, total=False):
+    """Configuration for the approximate nearest neighbor index in SQLite store."""
+
+    kind: Literal["vec0", "flat"]
+    """Type of index to use: 'vec0' for a sqlite-vec virtual table queried with KNN,
+    or 'flat' to score every stored vector (default)."""
+    vector_type: Literal["float", "int8", "bit"]
+    """How vectors are stored in the vec0 index.
+    Options:
+    - 'float': 32-bit floats, same as the stored embeddings (default)
+    - 'int8': scalar quantization to 8-bit integers, 4x smaller
+    - 'bit': binary quantization compared by hamming distance, 32x smaller.
+        Requires `dims` to be a multiple of 8.
+    """
+    oversample: int
+    """Multiplier on the number of candidates fetched from the vec0 index, relative
+    to `limit + offset` and the number of vectors per item.
+
+    Candidates are re-scored against the full-precision embeddings and then
+    filtered by namespace and `filter`, so larger values trade latency for recall.
+    Defaults to 2 for 'float', 4 for 'int8' and 16 for 'bit'.
+    """
+
+
+class SqliteIndexConfig(IndexConfig, total=False):
     """Configuration for vector embeddings in SQLite store."""
 
-    pass
+    ann_index_config: ANNIndexConfig
+    """Configuration for the approximate nearest neighbor index.
+
+    By default, vector search scores every stored vector. With `{"kind": "vec0"}`,
+    a sqlite-vec `vec0` virtual table is kept in sync with the stored vectors
+    and used to select candidates, which keeps search latency low on large stores.
+    Existing vectors are indexed when `setup()` runs.
+    """
+    distance_type: Literal["l2", "inner_product", "cosine"]
+    """Distance metric to use for vector similarity search. Defaults to 'cosine'."""
 
 
 def _namespace_to_text(
@@ -215,6 +248,89 @@ class BaseSqliteStore:
     index_config: SqliteIndexConfig | None = None
     ttl_config: TTLConfig | None = None
 
+    @property
+    def _ann_table(self) -> str | None:
+        """Name of the vec0 table backing the ANN index, if one is configured."""
+        if not self.index_config:
+            return None
+        ann_config = self.index_config.get("ann_index_config") or {}
+        if ann_config.get("kind", "flat") != "vec0":
+            return None
+        return f"store_vectors_{ann_config.get('vector_type', 'float')}_ann"
+
+    def _ann_vector_expr(self, arg: str) -> str:
+        """SQL expression converting a float32 vector to the ANN index's vector type."""
+        ann_config = cast(SqliteIndexConfig, self.index_config)["ann_index_config"]
+        return _VEC0_VECTOR_EXPRS[ann_config.get("vector_type", "float")].format(arg)
+
+    def _get_ann_create_query(self) -> str | None:
+        """Create the vec0 table backing the ANN index."""
+        table = self._ann_table
+        if table is None:
+            return None
+        index_config = cast(SqliteIndexConfig, self.index_config)
+        vector_type = index_config["ann_index_config"].get("vector_type", "float")
+        column = f"embedding {vector_type}[{index_config['dims']}]"
+        if vector_type != "bit":
+            distance_type = index_config.get("distance_type", "cosine")
+            column += f" distance_metric={_VEC0_DISTANCE_METRICS[distance_type]}"
+        return f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING vec0({column})"
+
+    def _get_ann_missing_query(
+        self, vector_keys: Sequence[tuple[str, str, str, Any]] | None = None
+    ) -> tuple[str, Sequence] | None:
+        """Select (rowid, embedding) of stored vectors missing from the ANN index.
+
+        Restricted to `vector_keys` when given, e.g. the vectors written by a batch.
+        The rows are then written with the query from `_get_ann_insert_query`:
+        quantized vectors lose their type when passed through `INSERT ... SELECT`.
+        """
+        table = self._ann_table
+        if table is None:
+            return None
+        query = f"""
+            SELECT sv.rowid, sv.embedding FROM store_vectors sv
+            WHERE NOT EXISTS (SELECT 1 FROM {table} a WHERE a.rowid = sv.rowid)
+        """
+        if vector_keys is None:
+            return query, ()
+        if not vector_keys:
+            return None
+        values_str = ",".join(["(?, ?, ?)"] * len(vector_keys))
+        query += f" AND (sv.prefix, sv.key, sv.field_name) IN (VALUES {values_str})"
+        return query, [
+            p for ns, k, pathname, _ in vector_keys for p in (ns, k, pathname)
+        ]
+
+    def _get_ann_insert_query(self) -> str:
+        table = cast(str, self._ann_table)
+        return f"INSERT INTO {table} (rowid, embedding) VALUES (?, {self._ann_vector_expr('?')})"
+
+    def _get_ann_delete_queries(
+        self, where: str, params: Sequence
+    ) -> list[tuple[str, Sequence]]:
+        """Delete the vectors matching `where` from store_vectors and the ANN index."""
+        table = self._ann_table
+        if table is None:
+            return []
+        return [
+            (
+                f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM store_vectors WHERE {where})",
+                params,
+            ),
+            (f"DELETE FROM store_vectors WHERE {where}", params),
+        ]
+
+    def _get_sweep_ttl_queries(self) -> list[tuple[str, Sequence]]:
+        """Queries deleting expired items. The last one deletes from the store table."""
+        expired = "expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP"
+        return [
+            *self._get_ann_delete_queries(
+                f"(prefix, key) IN (SELECT prefix, key FROM store WHERE {expired})", ()
+            ),
+            (f"DELETE FROM store WHERE {expired}", ()),
+        ]
+
     def _get_batch_GET_ops_queries(
         self, get_ops: Sequence[tuple[int, GetOp]]
     ) -> list[PreparedGetQuery]:
@@ -302,6 +418,11 @@ class BaseSqliteStore:
                     f"DELETE FROM store WHERE prefix = ? AND key IN ({placeholders})"
                 )
                 params = (_namespace_to_text(namespace), *keys)
+                queries.extend(
+                    self._get_ann_delete_queries(
+                        f"prefix = ? AND key IN ({placeholders})", params
+                    )
+                )
                 queries.append((query, params))
 
         embedding_request: tuple[str, Sequence[tuple[str, str, str, str]]] | None = None
@@ -360,6 +481,20 @@ class BaseSqliteStore:
             queries.append((query, insertion_params))
 
             if vector_values:
+                # Replaced vectors get new rowids, so drop them from the ANN index
+                # before they are rewritten
+                queries.extend(
+                    self._get_ann_delete_queries(
+                        "(prefix, key, field_name) IN (VALUES "
+                        + ",".join(["(?, ?, ?)"] * len(embedding_request_params))
+                        + ")",
+                        [
+                            p
+                            for ns, k, pathname, _ in embedding_request_params
+                            for p in (ns, k, pathname)
+                        ],
+                    )
+                )
                 values_str = ",".join(vector_values)
                 query = f"""
                     INSERT OR REPLACE INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
@@ -443,7 +578,8 @@ class BaseSqliteStore:
                 if distance_type == "cosine":
                     score_expr = "1.0 - vec_distance_cosine(sv.embedding, ?)"
                 elif distance_type == "l2":
-                    score_expr = "vec_distance_L2(sv.embedding, ?)"
+                    # Negate the distance so that nearer vectors score higher
+                    score_expr = "-1 * vec_distance_L2(sv.embedding, ?)"
                 elif distance_type == "inner_product":
                     # For inner product, we want higher values to be better, so negate the result
                     # since inner product similarity is higher when vectors are more similar
@@ -452,6 +588,32 @@ class BaseSqliteStore:
                     # Default to cosine similarity
                     score_expr = "1.0 - vec_distance_cosine(sv.embedding, ?)"
 
+                if ann_table := self._ann_table:
+                    # Select candidates with a KNN query on the vec0 index, then
+                    # score them exactly and apply namespace and filter conditions
+                    ann_config = self.index_config["ann_index_config"]
+                    oversample = ann_config.get(
+                        "oversample",
+                        _DEFAULT_OVERSAMPLE[ann_config.get("vector_type", "float")],
+                    )
+                    num_candidates = min(
+                        _VEC0_MAX_K,
+                        (op.offset + op.limit)
+                        * cast(dict, self.index_config)["__estimated_num_vectors"]
+                        * oversample,
+                    )
+                    vectors_source = f"""(
+                            SELECT rowid FROM {ann_table}
+                            WHERE embedding MATCH {self._ann_vector_expr("?")} AND k = ?
+                        ) candidates
+                        JOIN store_vectors sv ON sv.rowid = candidates.rowid
+                        JOIN store s ON s.prefix = sv.prefix AND s.key = sv.key"""
+                    ann_args: Sequence = (_PLACEHOLDER, num_candidates)
+                else:
+                    vectors_source = """store s
+                        JOIN store_vectors sv ON s.prefix = sv.prefix AND s.key = sv.key"""
+                    ann_args = ()
+
                 filter_str = (
                     ""
                     if not filter_conditions
@@ -472,8 +634,7 @@ class BaseSqliteStore:
                     WITH scored AS (
                         SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at, s.expires_at, s.ttl_minutes,
                             {score_expr} AS score
-                        FROM store s
-                        JOIN store_vectors sv ON s.prefix = sv.prefix AND s.key = sv.key
+                        FROM {vectors_source}
                         {prefix_filter_str}
                             ORDER BY score DESC 
                         LIMIT ?
@@ -492,6 +653,7 @@ class BaseSqliteStore:
                     """
                 params = [
                     _PLACEHOLDER,  # Vector placeholder
+                    *ann_args,
                     *ns_args,
                     *filter_params,
                     op.limit * 2,  # Expanded limit for better results
@@ -786,6 +948,16 @@ class SqliteStore(BaseSqliteStore, BaseStore):
             results = store.search(("docs",), query="programming guides", limit=2)
         ```
 
+        For large stores, search through a sqlite-vec `vec0` index instead of
+        scoring every vector, optionally with quantized vectors:
+        ```python
+        index = {
+            "dims": 1536,
+            "embed": OpenAIEmbeddings(),
+            "ann_index_config": {"kind": "vec0", "vector_type": "int8"},
+        }
+        ```
+
     Note:
         Semantic search is disabled by default. You can enable it by providing an `index` configuration
         when creating the store. Without this configuration, all `index` arguments passed to
@@ -1086,6 +1258,10 @@ class SqliteStore(BaseSqliteStore, BaseStore):
                         "INSERT INTO vector_migrations (v) VALUES (?)", (v,)
                     )
 
+                if ann_query := self._get_ann_create_query():
+                    self.conn.execute(ann_query)
+                    self._index_ann_vectors(self.conn.cursor())
+
             self.is_setup = True
 
     def sweep_ttl(self) -> int:
@@ -1095,12 +1271,8 @@ class SqliteStore(BaseSqliteStore, BaseStore):
             int: The number of deleted items.
         """
         with self._cursor() as cur:
-            cur.execute(
-                """
-                DELETE FROM store
-                WHERE expires_at IS NOT NULL AND expires_at < CURRENT_TIMESTAMP
-                """
-            )
+            for query, params in self._get_sweep_ttl_queries():
+                cur.execute(query, params)
             deleted_count = cur.rowcount
             return deleted_count
 
@@ -1325,6 +1497,23 @@ class SqliteStore(BaseSqliteStore, BaseStore):
         for query, params in queries:
             cur.execute(query, params)
 
+        if embedding_request:
+            self._index_ann_vectors(cur, txt_params)
+
+    def _index_ann_vectors(
+        self,
+        cur: sqlite3.Cursor,
+        vector_keys: Sequence[tuple[str, str, str, Any]] | None = None,
+    ) -> None:
+        """Add stored vectors to the ANN index, if one is configured."""
+        if not (missing_query := self._get_ann_missing_query(vector_keys)):
+            return
+        insert_query = self._get_ann_insert_query()
+        cur.execute(*missing_query)
+        with closing(self.conn.cursor()) as write_cur:
+            while rows := cur.fetchmany(_ANN_INDEX_BATCH_SIZE):
+                write_cur.executemany(insert_query, rows)
+
     def _batch_search_ops(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
@@ -1431,10 +1620,40 @@ def _ensure_index_config(
             tot += len(toks)
     index_config["__tokenized_fields"] = tokenized
     index_config["__estimated_num_vectors"] = tot
+    if ann_config := index_config.get("ann_index_config"):
+        kind = ann_config.get("kind", "flat")
+        if kind not in ("vec0", "flat"):
+            raise ValueError(f"ANN index kind must be 'vec0' or 'flat', got {kind}")
+        vector_type = ann_config.get("vector_type", "float")
+        if vector_type not in _VEC0_VECTOR_EXPRS:
+            raise ValueError(
+                f"Vector type must be 'float', 'int8' or 'bit', got {vector_type}"
+            )
+        if vector_type == "bit" and index_config["dims"] % 8:
+            raise ValueError(
+                f"Vector type 'bit' requires dims to be a multiple of 8, got {index_config['dims']}"
+            )
+        if ann_config.get("oversample", 1) < 1:
+            raise ValueError(
+                f"oversample must be at least 1, got {ann_config['oversample']}"
+            )
     embeddings = ensure_embeddings(
         index_config.get("embed"),
+        cache=index_config.get("cache"),
     )
     return embeddings, index_config
 
 
 _PLACEHOLDER = object()
+
+_VEC0_VECTOR_EXPRS = {
+    "float": "{}",
+    "int8": "vec_quantize_int8({}, 'unit')",
+    "bit": "vec_quantize_binary({})",
+}
+# Match the ordering of the exact scores computed in _prepare_batch_search_queries
+_VEC0_DISTANCE_METRICS = {"cosine": "cosine", "l2": "l2", "inner_product": "l1"}
+_DEFAULT_OVERSAMPLE = {"float": 2, "int8": 4, "bit": 16}
+# Largest `k` accepted by vec0 KNN queries
+_VEC0_MAX_K = 4096
+_ANN_INDEX_BATCH_SIZE = 1000
@@ -1,3 +1,5 @@
+import asyncio
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -114,3 +116,71 @@ class TestAsyncSqliteSaver:
             } == {"", "inner"}
 
             # TODO: test before and limit params
+
+    async def test_read_pool(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "checkpoints.db")
+        async with AsyncSqliteSaver.from_conn_string(
+            db_path, read_pool_size=2
+        ) as saver:
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            assert saver.readers is not None
+            assert saver.readers.qsize() == 2
+
+            # reads go through the pool and see committed writes
+            tup = await saver.aget_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert tup is not None
+            assert tup.checkpoint["id"] == self.chkpnt_1["id"]
+
+            # concurrent reads, including more than the pool size, and a write
+            results = await asyncio.gather(
+                *(
+                    saver.aget_tuple({"configurable": {"thread_id": "thread-2"}})
+                    for _ in range(5)
+                ),
+                saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {}),
+            )
+            assert all(r.checkpoint["id"] == self.chkpnt_2["id"] for r in results[:5])
+            assert len([c async for c in saver.alist(None)]) == 3
+            assert saver.readers.qsize() == 2
+
+            readers = saver.readers
+        assert saver.readers is None
+        assert readers.empty()
+
+    async def test_read_pool_in_memory(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(
+            ":memory:", read_pool_size=2
+        ) as saver:
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert saver.readers is None
+            assert await saver.aget_tuple({"configurable": {"thread_id": "thread-1"}})
+
+    async def test_export_import_threads(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            stream = [chunk async for chunk in saver.aexport_threads(["thread-2"])]
+            thread_2: RunnableConfig = {"configurable": {"thread_id": "thread-2"}}
+            expected = [c async for c in saver.alist(thread_2)]
+
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            assert await saver.aimport_threads(stream) == 2
+            assert [c async for c in saver.alist(None)] == expected
+            assert await saver.aimport_threads(stream) == 0
+
+    async def test_list_thread_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("langgraph.checkpoint.sqlite.aio.THREAD_IDS_PAGE_SIZE", 1)
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            await saver.aput(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            await saver.aput(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert [t async for t in saver.alist_thread_ids()] == [
+                "thread-1",
+                "thread-2",
+            ]
+            # threads can be deleted while paging through them
+            async for thread_id in saver.alist_thread_ids():
+                await saver.adelete_thread(thread_id)
+            assert [t async for t in saver.alist_thread_ids()] == []
@@ -17,7 +17,7 @@ from langgraph.store.base import (
     SearchOp,
 )
 from langgraph.store.sqlite import AsyncSqliteStore
-from langgraph.store.sqlite.base import SqliteIndexConfig
+from langgraph.store.sqlite.base import ANNIndexConfig, SqliteIndexConfig
 from tests.test_store import CharacterEmbeddings
 
 
@@ -52,6 +52,7 @@ async def create_vector_store(
     fake_embeddings: CharacterEmbeddings,
     conn_string: str = ":memory:",
     text_fields: Optional[list[str]] = None,
+    ann_index_config: Optional[ANNIndexConfig] = None,
 ) -> AsyncIterator[AsyncSqliteStore]:
     """Create an AsyncSqliteStore with vector search capabilities."""
     index_config: SqliteIndexConfig = {
@@ -59,6 +60,8 @@ async def create_vector_store(
         "embed": fake_embeddings,
         "text_fields": text_fields,
     }
+    if ann_index_config is not None:
+        index_config["ann_index_config"] = ann_index_config
 
     async with AsyncSqliteStore.from_conn_string(
         conn_string, index=index_config
@@ -449,6 +452,29 @@ async def test_vector_search_edge_cases(fake_embeddings: CharacterEmbeddings) ->
         assert len(results) == 1
 
 
+async def test_vec0_index_search(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test vector search through the vec0 index stays in sync with writes."""
+    async with (
+        create_vector_store(fake_embeddings) as flat,
+        create_vector_store(
+            fake_embeddings, ann_index_config={"kind": "vec0", "vector_type": "int8"}
+        ) as ann,
+    ):
+        for store in (flat, ann):
+            for i, text in enumerate(["red apple", "red car", "green apple"]):
+                await store.aput(("test",), f"doc{i}", {"text": text})
+            await store.aput(("test",), "doc0", {"text": "blue car"})
+            await store.adelete(("test",), "doc2")
+
+        expected = await flat.asearch(("test",), query="car")
+        results = await ann.asearch(("test",), query="car")
+        assert [r.key for r in results] == [r.key for r in expected]
+        assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+        async with ann.conn.execute(f"SELECT count(*) FROM {ann._ann_table}") as cur:
+            assert await cur.fetchone() == (2,)
+
+
 async def test_embed_with_path(
     fake_embeddings: CharacterEmbeddings,
 ) -> None:
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from langgraph.cache.sqlite import SqliteCache
+
+
+def test_get_set_clear(tmp_path: Path) -> None:
+    cache: SqliteCache = SqliteCache(path=str(tmp_path / "cache.db"))
+    cache.set({(("a", "b"), "k1"): ({"v": 1}, None), (("c",), "k2"): ([2], None)})
+    assert cache.get([(("a", "b"), "k1"), (("c",), "k2"), (("c",), "missing")]) == {
+        (("a", "b"), "k1"): {"v": 1},
+        (("c",), "k2"): [2],
+    }
+    cache.clear([("a", "b")])
+    assert cache.get([(("a", "b"), "k1"), (("c",), "k2")]) == {(("c",), "k2"): [2]}
+    cache.clear()
+    assert cache.get([(("c",), "k2")]) == {}
+
+
+def test_expired_entries_purged_in_bulk(tmp_path: Path) -> None:
+    cache: SqliteCache = SqliteCache(path=str(tmp_path / "cache.db"))
+    cache.set({(("ns",), f"k{i}"): (i, 1) for i in range(5)})
+    cache.set({(("ns",), "forever"): ("v", None)})
+    time.sleep(1.1)
+    # expired entries are not returned, but reads don't delete them
+    assert cache.get([(("ns",), "k0"), (("ns",), "forever")]) == {
+        (("ns",), "forever"): "v"
+    }
+    assert cache._conn.execute("SELECT count(*) FROM cache").fetchone() == (6,)
+    # the next write purges all of them at once
+    cache.set({(("ns",), "new"): ("v", None)})
+    assert cache._conn.execute("SELECT count(*) FROM cache").fetchone() == (2,)
+
+
+def test_max_entries(tmp_path: Path) -> None:
+    cache: SqliteCache = SqliteCache(path=str(tmp_path / "cache.db"), max_entries=10)
+    for i in range(25):
+        cache.set({(("ns",), f"k{i}"): (i, None)})
+        # overwriting a key doesn't grow the cache
+        cache.set({(("ns",), f"k{i}"): (i, None)})
+    (count,) = cache._conn.execute("SELECT count(*) FROM cache").fetchone()
+    assert 0 < count <= 10
+    # the most recently written entries are kept
+    assert cache.get([(("ns",), "k24"), (("ns",), "k0")]) == {(("ns",), "k24"): 24}
+
+    # the size estimate is restored from the database
+    reopened: SqliteCache = SqliteCache(path=str(tmp_path / "cache.db"), max_entries=5)
+    reopened.set({(("ns",), "other"): (0, None)})
+    (count,) = reopened._conn.execute("SELECT count(*) FROM cache").fetchone()
+    assert count <= 5
+
+    with pytest.raises(ValueError, match="max_entries"):
+        SqliteCache(path=str(tmp_path / "cache.db"), max_entries=0)
+
+
+async def test_async_methods_run_on_io_thread(tmp_path: Path) -> None:
+    cache: SqliteCache = SqliteCache(path=str(tmp_path / "cache.db"))
+    threads = set()
+    get = cache.get
+
+    def recording_get(keys):  # type: ignore[no-untyped-def]
+        threads.add(threading.current_thread().name)
+        return get(keys)
+
+    cache.get = recording_get  # type: ignore[method-assign]
+
+    await cache.aset({(("ns",), f"k{i}"): (i, None) for i in range(10)})
+    results = await asyncio.gather(
+        *(cache.aget([(("ns",), f"k{i}")]) for i in range(10))
+    )
+    assert results == [{(("ns",), f"k{i}"): i} for i in range(10)]
+    assert len(threads) == 1
+    assert threads.pop().startswith("sqlite-cache")
+    await cache.aclear()
+    assert await cache.aget([(("ns",), "k0")]) == {}
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -9,6 +12,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
+from langgraph.checkpoint.sharded import ShardedCheckpointSaver
 from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.checkpoint.sqlite.utils import _metadata_predicate, search_where
 
@@ -172,3 +176,127 @@ class TestSqliteSaver:
             with pytest.raises(NotImplementedError, match="AsyncSqliteSaver"):
                 async for _ in saver.alist(self.config_1):
                     pass
+
+    def test_read_pool(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "checkpoints.db")
+        with SqliteSaver.from_conn_string(db_path, read_pool_size=2) as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            write_config: RunnableConfig = {
+                "configurable": {
+                    **self.config_1["configurable"],
+                    "checkpoint_id": self.chkpnt_1["id"],
+                }
+            }
+            saver.put_writes(write_config, [("channel", "value")], "task-1")
+            assert saver.readers is not None
+            assert saver.readers.qsize() == 2
+
+            # reads go through the pool and see committed writes
+            tup = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+            assert tup is not None
+            assert tup.checkpoint["id"] == self.chkpnt_1["id"]
+            assert tup.pending_writes == [("task-1", "channel", "value")]
+            assert saver.readers.qsize() == 2
+
+            # nested reads fall back to the main connection once the pool is empty
+            nested = [
+                [t.config for t in saver.list(None)]
+                for _ in saver.list(None)
+                for _ in saver.list(None)
+            ]
+            assert len(nested) == 1
+
+            def read(_: int) -> str | None:
+                tup = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+                return tup.checkpoint["id"] if tup else None
+
+            with ThreadPoolExecutor(4) as pool:
+                assert set(pool.map(read, range(20))) == {self.chkpnt_1["id"]}
+
+            readers = saver.readers
+        assert saver.readers is None
+        assert readers.empty()
+
+    def test_read_pool_in_memory(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:", read_pool_size=2) as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert saver.readers is None
+            assert saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+
+    def test_export_import_threads(self, tmp_path: Path) -> None:
+        export_path = tmp_path / "threads.export"
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            write_config: RunnableConfig = {
+                "configurable": {
+                    **self.config_1["configurable"],
+                    "checkpoint_id": self.chkpnt_1["id"],
+                }
+            }
+            saver.put_writes(write_config, [("channel", "value")], "task-1")
+            with open(export_path, "wb") as f:
+                for chunk in saver.export_threads(["thread-1", "thread-2"]):
+                    f.write(chunk)
+            expected = list(saver.list(None))
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            # read back in small chunks, not aligned with frame boundaries
+            with open(export_path, "rb") as f:
+                assert saver.import_threads(iter(lambda: f.read(7), b"")) == 3
+            assert list(saver.list(None)) == expected
+            # importing again leaves existing checkpoints alone
+            assert saver.import_threads([export_path.read_bytes()]) == 0
+            assert list(saver.list(None)) == expected
+
+            with pytest.raises(ValueError, match="truncated"):
+                saver.import_threads([export_path.read_bytes()[:-1]])
+            assert list(saver.list(None)) == expected
+
+    def test_list_thread_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("langgraph.checkpoint.sqlite.THREAD_IDS_PAGE_SIZE", 1)
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert list(saver.list_thread_ids()) == ["thread-1", "thread-2"]
+            # threads can be deleted while paging through them
+            for thread_id in saver.list_thread_ids():
+                saver.delete_thread(thread_id)
+            assert list(saver.list_thread_ids()) == []
+
+    def test_sharded_savers(self, tmp_path: Path) -> None:
+        paths = [str(tmp_path / f"shard-{i}.db") for i in range(3)]
+        with ExitStack() as stack:
+            shards = {
+                f"shard-{i}": stack.enter_context(SqliteSaver.from_conn_string(path))
+                for i, path in enumerate(paths[:2])
+            }
+            saver = ShardedCheckpointSaver(shards)
+            checkpoint = empty_checkpoint()
+            for i in range(10):
+                checkpoint = create_checkpoint(checkpoint, {}, i)
+                saver.put(
+                    {"configurable": {"thread_id": f"thread-{i}", "checkpoint_ns": ""}},
+                    checkpoint,
+                    {"step": i},
+                    {},
+                )
+            # all shards are merged by descending checkpoint ID
+            expected = [f"thread-{i}" for i in reversed(range(10))]
+            threads = [c.config["configurable"]["thread_id"] for c in saver.list(None)]
+            assert threads == expected
+            assert all(len(list(s.list(None))) < 10 for s in shards.values())
+            before = {"configurable": {"checkpoint_id": checkpoint["id"]}}
+            assert [
+                c.config["configurable"]["thread_id"]
+                for c in saver.list(None, before=before, limit=3)
+            ] == expected[1:4]
+
+            shards["shard-2"] = stack.enter_context(
+                SqliteSaver.from_conn_string(paths[2])
+            )
+            assert saver.rebalance(shards) > 0
+            threads = [c.config["configurable"]["thread_id"] for c in saver.list(None)]
+            assert threads == expected
@@ -19,7 +19,7 @@ from langgraph.store.base import (
     SearchOp,
 )
 from langgraph.store.sqlite import SqliteStore
-from langgraph.store.sqlite.base import SqliteIndexConfig
+from langgraph.store.sqlite.base import ANNIndexConfig, SqliteIndexConfig
 
 
 # Local embeddings implementation for testing vector search
@@ -113,6 +113,7 @@ def create_vector_store(
     text_fields: Optional[list[str]] = None,
     distance_type: str = "cosine",
     conn_type: Literal["memory", "file"] = "memory",
+    ann_index_config: Optional[ANNIndexConfig] = None,
 ) -> Generator[SqliteStore, None, None]:
     """Create a SqliteStore with vector search enabled."""
     index_config: SqliteIndexConfig = {
@@ -121,6 +122,8 @@ def create_vector_store(
         "text_fields": text_fields,
         "distance_type": distance_type,  # This is for API consistency but SQLite only supports cosine
     }
+    if ann_index_config is not None:
+        index_config["ann_index_config"] = ann_index_config
     if conn_type == "memory":
         conn_str = ":memory:"
     else:
@@ -629,6 +632,94 @@ def test_vector_search_pagination(
         )  # First page vs second page start
 
 
+@pytest.mark.parametrize(
+    "vector_type,distance_type",
+    [
+        ("float", "cosine"),
+        ("int8", "cosine"),
+        ("bit", "cosine"),
+        ("float", "l2"),
+        ("float", "inner_product"),
+    ],
+)
+def test_vec0_index_matches_flat_search(
+    vector_type: Literal["float", "int8", "bit"],
+    distance_type: str,
+) -> None:
+    """The vec0 index only selects candidates, so small stores rank exactly."""
+    fake_embeddings = CharacterEmbeddings(dims=512)
+    ann_index_config: ANNIndexConfig = {"kind": "vec0", "vector_type": vector_type}
+    with (
+        create_vector_store(fake_embeddings, distance_type=distance_type) as flat,
+        create_vector_store(
+            fake_embeddings,
+            distance_type=distance_type,
+            ann_index_config=ann_index_config,
+        ) as ann,
+    ):
+        for store in (flat, ann):
+            for i, text in enumerate(
+                ["red apple", "red car", "green apple", "blue car"]
+            ):
+                store.put(("test", str(i % 2)), f"doc{i}", {"text": text, "score": i})
+            store.put(("test", "0"), "doc0", {"text": "yellow banana", "score": 0})
+            store.delete(("test", "1"), "doc1")
+
+        for kwargs in [
+            {"query": "apple"},
+            {"query": "red apple", "limit": 1},
+            {"query": "car", "limit": 2, "offset": 1},
+            {"query": "banana", "filter": {"score": {"$gte": 2}}},
+        ]:
+            expected = flat.search(("test",), **kwargs)
+            results = ann.search(("test",), **kwargs)
+            assert [r.key for r in results] == [r.key for r in expected]
+            assert [r.score for r in results] == pytest.approx(
+                [r.score for r in expected]
+            )
+        assert [r.key for r in ann.search(("test", "1"), query="car")] == ["doc3"]
+
+        table = ann._ann_table
+        (indexed,) = ann.conn.execute(f"SELECT count(*) FROM {table}").fetchone()
+        (stored,) = ann.conn.execute("SELECT count(*) FROM store_vectors").fetchone()
+        assert indexed == stored == 3
+
+
+def test_vec0_index_backfilled_on_setup(fake_embeddings: CharacterEmbeddings) -> None:
+    temp_file = tempfile.NamedTemporaryFile(delete=False)
+    temp_file.close()
+    index_config: SqliteIndexConfig = {
+        "dims": fake_embeddings.dims,
+        "embed": fake_embeddings,
+    }
+    try:
+        with SqliteStore.from_conn_string(temp_file.name, index=index_config) as store:
+            store.put(("docs",), "doc1", {"text": "zany zebra"})
+            store.put(("docs",), "doc2", {"text": "text about birds"})
+
+        with SqliteStore.from_conn_string(
+            temp_file.name,
+            index={**index_config, "ann_index_config": {"kind": "vec0"}},
+        ) as store:
+            store.setup()
+            results = store.search(("docs",), query="zany zebra")
+            assert [r.key for r in results] == ["doc1", "doc2"]
+    finally:
+        os.unlink(temp_file.name)
+
+
+def test_vec0_index_config_validation(fake_embeddings: CharacterEmbeddings) -> None:
+    with pytest.raises(ValueError, match="multiple of 8"):
+        SqliteStore(
+            None,  # type: ignore[arg-type]
+            index={
+                "dims": 12,
+                "embed": fake_embeddings,
+                "ann_index_config": {"kind": "vec0", "vector_type": "bit"},
+            },
+        )
+
+
 @pytest.mark.parametrize("distance_type", VECTOR_TYPES)
 def test_vector_search_edge_cases(
     fake_embeddings: CharacterEmbeddings,
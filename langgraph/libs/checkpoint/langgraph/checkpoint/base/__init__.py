@@ -245,6 +245,22 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints.
+
+        The default implementation scans all checkpoints with `list(None)`. Savers
+        backed by a database override it to only read thread IDs, a page at a time.
+        Threads can be deleted while iterating.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs, each yielded once.
+        """
+        return iter(
+            dict.fromkeys(
+                str(c.config["configurable"]["thread_id"]) for c in self.list(None)
+            )
+        )
+
     async def aget(self, config: RunnableConfig) -> Checkpoint | None:
         """Asynchronously fetch a checkpoint using the given configuration.
 
@@ -350,6 +366,18 @@ class BaseCheckpointSaver(Generic[V]):
         """
         raise NotImplementedError
 
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """Asynchronously list the IDs of the threads that have checkpoints.
+
+        Returns:
+            AsyncIterator[str]: Async iterator of thread IDs, each yielded once.
+        """
+        thread_ids = dict.fromkeys(
+            [str(c.config["configurable"]["thread_id"]) async for c in self.alist(None)]
+        )
+        for thread_id in thread_ids:
+            yield thread_id
+
     def get_next_version(self, current: V | None, channel: None) -> V:
         """Generate the next version ID for a channel.
 
@@ -0,0 +1,144 @@
+"""Framed stream format used to bulk export and import checkpoint threads.
+
+A stream starts with a header (magic bytes, format version and the name of the
+saver that produced it), followed by frames. Each frame is a 1-byte kind, a
+4-byte big-endian payload length and the payload. What a payload contains is
+up to the saver: raw `COPY ... BINARY` data for Postgres, msgpack-encoded rows
+for SQLite. Streams can be split into chunks at arbitrary boundaries, e.g. when
+written to and read back from a file.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import AsyncIterable, Iterable, Iterator, Sequence
+from typing import Any
+
+import ormsgpack
+
+MAGIC = b"LGCKPT"
+FORMAT_VERSION = 1
+# Size of the chunks yielded by export streams
+CHUNK_SIZE = 1 << 16
+
+_FRAME_HEADER = struct.Struct(">BI")
+_SOURCE_LENGTH = struct.Struct(">BB")
+
+
+def encode_header(source: str) -> bytes:
+    """Encode the header of a stream produced by the `source` saver."""
+    name = source.encode()
+    return MAGIC + _SOURCE_LENGTH.pack(FORMAT_VERSION, len(name)) + name
+
+
+def encode_frame(kind: int, payload: bytes | bytearray | memoryview) -> bytes:
+    """Encode a single frame."""
+    return _FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+def encode_row(row: Sequence[Any]) -> bytes:
+    """Encode a database row (str, bytes, int or None values) as a frame payload."""
+    return ormsgpack.packb(row)
+
+
+def decode_row(payload: bytes) -> list[Any]:
+    """Decode a frame payload created with `encode_row`."""
+    return ormsgpack.unpackb(payload)
+
+
+class FrameDecoder:
+    """Incrementally decode frames from the chunks of a stream.
+
+    Args:
+        source: Name of the saver importing the stream. Streams produced by a
+            different saver are rejected, since their payloads are not compatible.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._buffer = bytearray()
+        self._header_read = False
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[tuple[int, bytes]]:
+        """Add a chunk of the stream, returning the (kind, payload) frames it completes."""
+        self._buffer += data
+        if not self._header_read and not self._read_header():
+            return []
+        frames: list[tuple[int, bytes]] = []
+        buffer = self._buffer
+        pos = 0
+        while len(buffer) - pos >= _FRAME_HEADER.size:
+            kind, length = _FRAME_HEADER.unpack_from(buffer, pos)
+            end = pos + _FRAME_HEADER.size + length
+            if end > len(buffer):
+                break
+            frames.append((kind, bytes(buffer[pos + _FRAME_HEADER.size : end])))
+            pos = end
+        del buffer[:pos]
+        return frames
+
+    def close(self) -> None:
+        """Check that the stream ended on a frame boundary."""
+        if not self._header_read or self._buffer:
+            raise ValueError("Checkpoint export stream is truncated")
+
+    def _read_header(self) -> bool:
+        prefix_size = len(MAGIC) + _SOURCE_LENGTH.size
+        if len(self._buffer) < prefix_size:
+            return False
+        if not self._buffer.startswith(MAGIC):
+            raise ValueError("Not a checkpoint export stream")
+        version, name_length = _SOURCE_LENGTH.unpack_from(self._buffer, len(MAGIC))
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint export format version {version}, "
+                f"expected {FORMAT_VERSION}"
+            )
+        if len(self._buffer) < prefix_size + name_length:
+            return False
+        source = self._buffer[prefix_size : prefix_size + name_length].decode()
+        if source != self.source:
+            raise ValueError(
+                f"Cannot import a stream exported by the {source} saver "
+                f"into the {self.source} saver"
+            )
+        del self._buffer[: prefix_size + name_length]
+        self._header_read = True
+        return True
+
+
+def read_frames(stream: Iterable[bytes], source: str) -> Iterator[tuple[int, bytes]]:
+    """Yield the (kind, payload) frames of a stream exported by `source`."""
+    decoder = FrameDecoder(source)
+    for chunk in stream:
+        yield from decoder.feed(chunk)
+    decoder.close()
+
+
+async def aread_frames(
+    stream: AsyncIterable[bytes] | Iterable[bytes], source: str
+) -> AsyncIterable[tuple[int, bytes]]:
+    """Asynchronously yield the (kind, payload) frames of a stream exported by `source`."""
+    decoder = FrameDecoder(source)
+    if isinstance(stream, AsyncIterable):
+        async for chunk in stream:
+            for frame in decoder.feed(chunk):
+                yield frame
+    else:
+        for chunk in stream:
+            for frame in decoder.feed(chunk):
+                yield frame
+    decoder.close()
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "FORMAT_VERSION",
+    "FrameDecoder",
+    "aread_frames",
+    "decode_row",
+    "encode_frame",
+    "encode_header",
+    "encode_row",
+    "read_frames",
+]
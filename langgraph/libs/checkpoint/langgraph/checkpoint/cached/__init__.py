@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any, NamedTuple
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    V,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+# (thread ID, checkpoint NS)
+_CacheKey = tuple[str, str]
+# (sender ID, thread ID, checkpoint NS or None for the whole thread)
+InvalidationCallback = Callable[[str, str, "str | None"], None]
+
+
+class InvalidationBus:
+    """Broadcasts cache invalidations between CachedCheckpointSavers.
+
+    This implementation delivers messages to the subscribers of the current process
+    only. To share invalidations between processes, subclass it, override `publish`
+    to send messages to a broker (e.g. Redis pub/sub) and call `deliver` for each
+    message received from the broker.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: list[InvalidationCallback] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: InvalidationCallback) -> Callable[[], None]:
+        """Register a callback for invalidations, returning a function to unregister it."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, sender: str, thread_id: str, checkpoint_ns: str | None) -> None:
+        """Invalidate the latest checkpoint of a thread in all subscribed caches.
+
+        Args:
+            sender: ID of the publishing saver, which ignores its own messages.
+            thread_id: The thread whose latest checkpoint changed.
+            checkpoint_ns: The namespace that changed, or None for all namespaces.
+        """
+        self.deliver(sender, thread_id, checkpoint_ns)
+
+    def deliver(self, sender: str, thread_id: str, checkpoint_ns: str | None) -> None:
+        """Call the subscribed callbacks with an invalidation."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(sender, thread_id, checkpoint_ns)
+
+
+class _CacheEntry(NamedTuple):
+    config: RunnableConfig
+    checkpoint: tuple[str, bytes]
+    metadata: tuple[str, bytes]
+    parent_config: RunnableConfig | None
+    # (task ID, write index) -> (task ID, channel, serialized value)
+    writes: dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]]
+
+
+class CachedCheckpointSaver(BaseCheckpointSaver[V]):
+    """A checkpoint saver that caches the latest checkpoint of each thread in memory.
+
+    Every run on an existing thread starts by reading its latest checkpoint, and the
+    state of a thread is often read again right after a run. This wrapper keeps the
+    latest checkpoint tuple of the most recently used (thread, namespace) pairs in a
+    bounded LRU cache, updated on `put` and `put_writes`, so that these reads don't
+    reach the wrapped saver. Reads of other checkpoints, `list` and all writes are
+    passed through to the wrapped saver.
+
+    Cache entries are stored serialized, so the returned checkpoints can be mutated
+    freely. When several processes write to the same threads, pass the same `bus` to
+    all of them (see `InvalidationBus`), otherwise a process may serve a checkpoint
+    that was superseded by another process.
+
+    Args:
+        saver: The checkpoint saver to wrap, e.g. a PostgresSaver.
+        maxsize: Maximum number of (thread, namespace) pairs to cache. Defaults to 1024.
+        bus: Optional bus to broadcast and receive invalidations.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.cached import CachedCheckpointSaver
+        >>> from langgraph.checkpoint.postgres import PostgresSaver
+        >>> with PostgresSaver.from_conn_string(DB_URI) as saver:
+        ...     checkpointer = CachedCheckpointSaver(saver, maxsize=10_000)
+        ...     graph = builder.compile(checkpointer=checkpointer)
+    """
+
+    def __init__(
+        self,
+        saver: BaseCheckpointSaver[V],
+        *,
+        maxsize: int = 1024,
+        bus: InvalidationBus | None = None,
+    ) -> None:
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+        self.maxsize = maxsize
+        self.bus = bus
+        self.id = uuid.uuid4().hex
+        self.cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self.lock = threading.Lock()
+        # incremented on every invalidation, so that reads which raced with one
+        # don't populate the cache with an outdated checkpoint
+        self._epoch = 0
+        self._unsubscribe = bus.subscribe(self._on_invalidation) if bus else None
+
+    @property
+    def config_specs(self) -> list:
+        return self.saver.config_specs
+
+    def close(self) -> None:
+        """Stop receiving invalidations from the bus."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple from the cache, or from the wrapped saver on a miss.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        checkpoint_tuple, epoch = self._lookup(config)
+        if checkpoint_tuple is not None:
+            return checkpoint_tuple
+        checkpoint_tuple = self.saver.get_tuple(config)
+        if checkpoint_tuple is not None and not get_checkpoint_id(config):
+            self._store(checkpoint_tuple, epoch)
+        return checkpoint_tuple
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints from the wrapped saver.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
+        """
+        yield from self.saver.list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint in the wrapped saver and cache it as the latest.
+
+        Args:
+            config: Configuration for the checkpoint.
+            checkpoint: The checkpoint to store.
+            metadata: Additional metadata for the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            RunnableConfig: Updated configuration after storing the checkpoint.
+        """
+        next_config = self.saver.put(config, checkpoint, metadata, new_versions)
+        self._cache_put(config, next_config, checkpoint, metadata)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes in the wrapped saver and add them to the cache.
+
+        Args:
+            config: Configuration of the related checkpoint.
+            writes: List of writes to store.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        self.saver.put_writes(config, writes, task_id, task_path)
+        self._cache_put_writes(config, writes, task_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, and drop it from the cache.
+
+        Args:
+            thread_id: The thread ID whose checkpoints should be deleted.
+        """
+        self.saver.delete_thread(thread_id)
+        self._invalidate(thread_id, None)
+        self._publish(thread_id, None)
+
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints in the wrapped saver.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs.
+        """
+        return self.saver.list_thread_ids()
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Asynchronous version of `get_tuple`."""
+        checkpoint_tuple, epoch = self._lookup(config)
+        if checkpoint_tuple is not None:
+            return checkpoint_tuple
+        checkpoint_tuple = await self.saver.aget_tuple(config)
+        if checkpoint_tuple is not None and not get_checkpoint_id(config):
+            self._store(checkpoint_tuple, epoch)
+        return checkpoint_tuple
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Asynchronous version of `list`."""
+        async for checkpoint_tuple in self.saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Asynchronous version of `put`."""
+        next_config = await self.saver.aput(config, checkpoint, metadata, new_versions)
+        self._cache_put(config, next_config, checkpoint, metadata)
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Asynchronous version of `put_writes`."""
+        await self.saver.aput_writes(config, writes, task_id, task_path)
+        self._cache_put_writes(config, writes, task_id)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronous version of `delete_thread`."""
+        await self.saver.adelete_thread(thread_id)
+        self._invalidate(thread_id, None)
+        self._publish(thread_id, None)
+
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """Asynchronous version of `list_thread_ids`."""
+        async for thread_id in self.saver.alist_thread_ids():
+            yield thread_id
+
+    def get_next_version(self, current: V | None, channel: None) -> V:
+        return self.saver.get_next_version(current, channel)
+
+    def _lookup(self, config: RunnableConfig) -> tuple[CheckpointTuple | None, int]:
+        """Get a cached checkpoint tuple, along with the current cache epoch."""
+        key = (
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""),
+        )
+        checkpoint_id = get_checkpoint_id(config)
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None or (
+                checkpoint_id
+                and entry.config["configurable"]["checkpoint_id"] != checkpoint_id
+            ):
+                return None, self._epoch
+            self.cache.move_to_end(key)
+            return self._load(entry), self._epoch
+
+    def _store(self, checkpoint_tuple: CheckpointTuple, epoch: int) -> None:
+        """Cache a checkpoint tuple read from the wrapped saver."""
+        writes: dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]] = {}
+        # pending writes are returned in order of task and index
+        task_sizes: dict[str, int] = {}
+        for task_id, channel, value in checkpoint_tuple.pending_writes or []:
+            idx = task_sizes.get(task_id, 0)
+            task_sizes[task_id] = idx + 1
+            writes[(task_id, WRITES_IDX_MAP.get(channel, idx))] = (
+                task_id,
+                channel,
+                self.serde.dumps_typed(value),
+            )
+        entry = _CacheEntry(
+            checkpoint_tuple.config,
+            self.serde.dumps_typed(checkpoint_tuple.checkpoint),
+            self.serde.dumps_typed(checkpoint_tuple.metadata),
+            checkpoint_tuple.parent_config,
+            writes,
+        )
+        with self.lock:
+            # skip if the thread was updated or invalidated while reading it
+            if epoch == self._epoch:
+                self._set(_entry_key(entry), entry)
+
+    def _cache_put(
+        self,
+        config: RunnableConfig,
+        next_config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+    ) -> None:
+        entry = _CacheEntry(
+            next_config,
+            self.serde.dumps_typed(checkpoint),
+            self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+            (
+                {
+                    "configurable": {
+                        "thread_id": next_config["configurable"]["thread_id"],
+                        "checkpoint_ns": next_config["configurable"]["checkpoint_ns"],
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if (parent_checkpoint_id := get_checkpoint_id(config))
+                else None
+            ),
+            {},
+        )
+        key = _entry_key(entry)
+        with self.lock:
+            self._epoch += 1
+            current = self.cache.get(key)
+            # the latest checkpoint is the one with the highest ID
+            if current is None or (
+                current.config["configurable"]["checkpoint_id"]
+                <= next_config["configurable"]["checkpoint_id"]
+            ):
+                self._set(key, entry)
+            else:
+                del self.cache[key]
+        self._publish(*key)
+
+    def _cache_put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        key = (
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""),
+        )
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        serialized = [
+            (WRITES_IDX_MAP.get(channel, idx), channel, self.serde.dumps_typed(value))
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        with self.lock:
+            self._epoch += 1
+            entry = self.cache.get(key)
+            if (
+                entry is not None
+                and entry.config["configurable"]["checkpoint_id"] == checkpoint_id
+            ):
+                # same semantics as the savers: regular writes are only stored once
+                # per task and index, special writes (e.g. errors) replace earlier ones
+                for idx, channel, value in serialized:
+                    if idx >= 0 and (task_id, idx) in entry.writes:
+                        continue
+                    entry.writes[(task_id, idx)] = (task_id, channel, value)
+        self._publish(*key)
+
+    def _load(self, entry: _CacheEntry) -> CheckpointTuple:
+        return CheckpointTuple(
+            entry.config,
+            self.serde.loads_typed(entry.checkpoint),
+            self.serde.loads_typed(entry.metadata),
+            entry.parent_config,
+            [
+                (task_id, channel, self.serde.loads_typed(value))
+                for task_id, channel, value in entry.writes.values()
+            ],
+        )
+
+    def _set(self, key: _CacheKey, entry: _CacheEntry) -> None:
+        self.cache[key] = entry
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+    def _invalidate(self, thread_id: str, checkpoint_ns: str | None) -> None:
+        with self.lock:
+            self._epoch += 1
+            if checkpoint_ns is not None:
+                self.cache.pop((thread_id, checkpoint_ns), None)
+            else:
+                for key in [k for k in self.cache if k[0] == thread_id]:
+                    del self.cache[key]
+
+    def _publish(self, thread_id: str, checkpoint_ns: str | None) -> None:
+        if self.bus is not None:
+            self.bus.publish(self.id, thread_id, checkpoint_ns)
+
+    def _on_invalidation(
+        self, sender: str, thread_id: str, checkpoint_ns: str | None
+    ) -> None:
+        if sender != self.id:
+            self._invalidate(thread_id, checkpoint_ns)
+
+
+def _entry_key(entry: _CacheEntry) -> _CacheKey:
+    configurable = entry.config["configurable"]
+    return (configurable["thread_id"], configurable["checkpoint_ns"])
+
+
+__all__ = ["CachedCheckpointSaver", "InvalidationBus"]
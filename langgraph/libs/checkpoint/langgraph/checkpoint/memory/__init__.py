@@ -422,6 +422,16 @@ class InMemorySaver(
             if k[0] == thread_id:
                 del self.blobs[k]
 
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints, in ascending order.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs.
+        """
+        for thread_id in sorted(self.storage):
+            if any(self.storage.get(thread_id, {}).values()):
+                yield thread_id
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Asynchronous version of get_tuple.
 
@@ -512,6 +522,11 @@ class InMemorySaver(
         """
         return self.delete_thread(thread_id)
 
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """Asynchronous version of `list_thread_ids`."""
+        for thread_id in self.list_thread_ids():
+            yield thread_id
+
     def get_next_version(self, current: str | None, channel: None) -> str:
         if current is None:
             current_v = 0
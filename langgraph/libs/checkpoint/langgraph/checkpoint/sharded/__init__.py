@@ -0,0 +1,519 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+from bisect import bisect
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    V,
+)
+
+# (thread ID, checkpoint NS, checkpoint ID)
+_CheckpointKey = tuple[str, str, str]
+
+
+class HashRing:
+    """Consistent hash ring mapping keys to named nodes.
+
+    Each node is placed on the ring `replicas` times. Adding or removing a node only
+    remaps the keys that hash next to its points, about 1/N of all keys.
+    """
+
+    def __init__(self, nodes: Iterable[str], *, replicas: int = 128) -> None:
+        points = sorted(
+            (_hash(f"{node}:{i}"), node) for node in nodes for i in range(replicas)
+        )
+        if not points:
+            raise ValueError("A hash ring needs at least one node")
+        self._hashes = [h for h, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def get(self, key: str) -> str:
+        """Get the node owning a key."""
+        idx = bisect(self._hashes, _hash(key))
+        return self._nodes[idx % len(self._nodes)]
+
+
+class ShardedCheckpointSaver(BaseCheckpointSaver[V]):
+    """A checkpoint saver that spreads threads across several checkpoint savers.
+
+    Each thread lives on a single shard, picked by consistent hashing of its thread
+    ID, so any mix of savers (e.g. several PostgresSaver or SqliteSaver instances)
+    can be used to scale checkpoint writes. `list(None, ...)` queries all shards and
+    merges their results by descending checkpoint ID, which assumes that each shard
+    lists checkpoints in that order, as the SQL savers do.
+
+    `rebalance()` switches to a new set of shards while the saver is in use. Threads
+    whose shard changed are copied to their new shard, then deleted from the old one.
+    While a thread is being moved, reads query both its old and new shard, and new
+    checkpoints are written to the new shard. Pending writes attached to a checkpoint
+    that was not copied yet only become visible once it is.
+
+    Args:
+        shards: The checkpoint savers to use, by name. Threads are assigned to names,
+            so a shard must keep its name across restarts and rebalances.
+        replicas: Number of points per shard on the hash ring.
+        serde: The serializer, only used for `config_specs`. Defaults to the
+            serializer of the first shard.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.sharded import ShardedCheckpointSaver
+        >>> from langgraph.checkpoint.sqlite import SqliteSaver
+        >>> checkpointer = ShardedCheckpointSaver(
+        ...     {
+        ...         "shard-0": SqliteSaver(sqlite3.connect("shard-0.db", check_same_thread=False)),
+        ...         "shard-1": SqliteSaver(sqlite3.connect("shard-1.db", check_same_thread=False)),
+        ...     }
+        ... )
+        >>> graph = builder.compile(checkpointer=checkpointer)
+    """
+
+    def __init__(
+        self,
+        shards: Mapping[str, BaseCheckpointSaver[V]],
+        *,
+        replicas: int = 128,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        if not shards:
+            raise ValueError("ShardedCheckpointSaver needs at least one shard")
+        super().__init__(serde=serde or next(iter(shards.values())).serde)
+        self.replicas = replicas
+        self.shards = dict(shards)
+        self.ring = HashRing(self.shards, replicas=replicas)
+        # set while rebalancing: the shards and ring before the rebalance, and the
+        # threads that were already moved
+        self._previous: tuple[dict[str, BaseCheckpointSaver[V]], HashRing] | None = None
+        self._moved: set[str] = set()
+
+    @property
+    def config_specs(self) -> list:
+        return next(iter(self.shards.values())).config_specs
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple from the shard of its thread.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        return _latest(s.get_tuple(config) for s in self._owners(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints of a thread, or of all shards if no config is given.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples, newest first.
+        """
+        savers = self._owners(config) if config is not None else self._all_shards()
+        yield from islice(
+            _dedupe(
+                heapq.merge(
+                    *(
+                        s.list(config, filter=filter, before=before, limit=limit)
+                        for s in savers
+                    ),
+                    key=_checkpoint_id,
+                    reverse=True,
+                ),
+                self._previous is not None,
+            ),
+            limit,
+        )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint in the shard of its thread.
+
+        Args:
+            config: Configuration for the checkpoint.
+            checkpoint: The checkpoint to store.
+            metadata: Additional metadata for the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            RunnableConfig: Updated configuration after storing the checkpoint.
+        """
+        return self._shard(config).put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes in the shard of their thread.
+
+        Args:
+            config: Configuration of the related checkpoint.
+            writes: List of writes to store.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        self._shard(config).put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread.
+
+        Args:
+            thread_id: The thread ID whose checkpoints should be deleted.
+        """
+        for saver in self._owners(_thread_config(thread_id)):
+            saver.delete_thread(thread_id)
+
+    def list_thread_ids(self) -> Iterator[str]:
+        """List the IDs of the threads that have checkpoints, shard by shard.
+
+        Returns:
+            Iterator[str]: Iterator of thread IDs.
+        """
+        thread_ids = (t for s in self._all_shards() for t in s.list_thread_ids())
+        if self._previous is None:
+            yield from thread_ids
+            return
+        # threads being moved are listed by both their old and new shard
+        yield from dict.fromkeys(thread_ids)
+
+    def rebalance(self, shards: Mapping[str, BaseCheckpointSaver[V]]) -> int:
+        """Switch to a new set of shards, moving threads to their new shard.
+
+        Shards are matched by name: a saver kept under the same name keeps its
+        threads, except those now assigned to another shard. Only one rebalance
+        can run at a time.
+
+        Args:
+            shards: The new checkpoint savers, by name.
+
+        Returns:
+            int: The number of moved threads.
+        """
+        moves = self._start_rebalance(shards)
+        try:
+            for name, thread_ids in moves.items():
+                source = self._previous[0][name]  # type: ignore[index]
+                for thread_id in thread_ids:
+                    target = self.shards[self.ring.get(thread_id)]
+                    _copy_thread(source, target, thread_id)
+                    self._moved.add(thread_id)
+                    source.delete_thread(thread_id)
+        finally:
+            self._previous = None
+            self._moved = set()
+        return sum(len(thread_ids) for thread_ids in moves.values())
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Asynchronous version of `get_tuple`."""
+        return _latest(
+            await asyncio.gather(*(s.aget_tuple(config) for s in self._owners(config)))
+        )
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Asynchronous version of `list`."""
+        savers = self._owners(config) if config is not None else self._all_shards()
+        iterators = [
+            s.alist(config, filter=filter, before=before, limit=limit).__aiter__()
+            for s in savers
+        ]
+        # k-way merge of the shards, fetching the next result of each concurrently
+        heads = await asyncio.gather(*(_anext(it) for it in iterators))
+        heap = [
+            (_SortKey(head), idx, head)
+            for idx, head in enumerate(heads)
+            if head is not None
+        ]
+        heapq.heapify(heap)
+        seen: set[_CheckpointKey] | None = set() if self._previous else None
+        count = 0
+        while heap and (limit is None or count < limit):
+            _, idx, checkpoint_tuple = heapq.heappop(heap)
+            if (head := await _anext(iterators[idx])) is not None:
+                heapq.heappush(heap, (_SortKey(head), idx, head))
+            if seen is not None:
+                if (key := _key(checkpoint_tuple)) in seen:
+                    continue
+                seen.add(key)
+            count += 1
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Asynchronous version of `put`."""
+        return await self._shard(config).aput(
+            config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Asynchronous version of `put_writes`."""
+        await self._shard(config).aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronous version of `delete_thread`."""
+        for saver in self._owners(_thread_config(thread_id)):
+            await saver.adelete_thread(thread_id)
+
+    async def alist_thread_ids(self) -> AsyncIterator[str]:
+        """Asynchronous version of `list_thread_ids`."""
+        rebalancing = self._previous is not None
+        seen: set[str] = set()
+        for saver in self._all_shards():
+            async for thread_id in saver.alist_thread_ids():
+                if rebalancing:
+                    if thread_id in seen:
+                        continue
+                    seen.add(thread_id)
+                yield thread_id
+
+    async def arebalance(self, shards: Mapping[str, BaseCheckpointSaver[V]]) -> int:
+        """Asynchronous version of `rebalance`."""
+        moves = await self._astart_rebalance(shards)
+        try:
+            for name, thread_ids in moves.items():
+                source = self._previous[0][name]  # type: ignore[index]
+                for thread_id in thread_ids:
+                    target = self.shards[self.ring.get(thread_id)]
+                    await _acopy_thread(source, target, thread_id)
+                    self._moved.add(thread_id)
+                    await source.adelete_thread(thread_id)
+        finally:
+            self._previous = None
+            self._moved = set()
+        return sum(len(thread_ids) for thread_ids in moves.values())
+
+    def get_next_version(self, current: V | None, channel: None) -> V:
+        return next(iter(self.shards.values())).get_next_version(current, channel)
+
+    def _shard(self, config: RunnableConfig) -> BaseCheckpointSaver[V]:
+        """Get the shard owning the thread of a config."""
+        return self.shards[self.ring.get(str(config["configurable"]["thread_id"]))]
+
+    def _owners(self, config: RunnableConfig) -> list[BaseCheckpointSaver[V]]:
+        """Get the shards holding checkpoints of a thread, its current shard first."""
+        thread_id = str(config["configurable"]["thread_id"])
+        owner = self.shards[self.ring.get(thread_id)]
+        if (previous := self._previous) is None or thread_id in self._moved:
+            return [owner]
+        previous_owner = previous[0][previous[1].get(thread_id)]
+        return [owner] if previous_owner is owner else [owner, previous_owner]
+
+    def _all_shards(self) -> list[BaseCheckpointSaver[V]]:
+        savers = list(self.shards.values())
+        if self._previous is not None:
+            savers.extend(
+                s for s in self._previous[0].values() if all(s is not o for o in savers)
+            )
+        return savers
+
+    def _switch_shards(self, shards: Mapping[str, BaseCheckpointSaver[V]]) -> None:
+        if self._previous is not None:
+            raise RuntimeError("A rebalance is already in progress")
+        if not shards:
+            raise ValueError("ShardedCheckpointSaver needs at least one shard")
+        self._previous = (self.shards, self.ring)
+        self.shards = dict(shards)
+        self.ring = HashRing(self.shards, replicas=self.replicas)
+
+    def _start_rebalance(
+        self, shards: Mapping[str, BaseCheckpointSaver[V]]
+    ) -> dict[str, list[str]]:
+        """Switch to the new shards, returning the threads to move by source shard."""
+        self._switch_shards(shards)
+        try:
+            return {
+                name: self._misplaced(saver, saver.list_thread_ids())
+                for name, saver in self._previous[0].items()  # type: ignore[index]
+            }
+        except BaseException:
+            self.shards, self.ring = self._previous  # type: ignore[misc]
+            self._previous = None
+            raise
+
+    async def _astart_rebalance(
+        self, shards: Mapping[str, BaseCheckpointSaver[V]]
+    ) -> dict[str, list[str]]:
+        self._switch_shards(shards)
+        try:
+            moves = {}
+            for name, saver in self._previous[0].items():  # type: ignore[index]
+                thread_ids = [t async for t in saver.alist_thread_ids()]
+                moves[name] = self._misplaced(saver, thread_ids)
+            return moves
+        except BaseException:
+            self.shards, self.ring = self._previous  # type: ignore[misc]
+            self._previous = None
+            raise
+
+    def _misplaced(
+        self, saver: BaseCheckpointSaver[V], thread_ids: Iterable[str]
+    ) -> list[str]:
+        return [t for t in thread_ids if self.shards[self.ring.get(t)] is not saver]
+
+
+class _SortKey:
+    """Heap key ordering checkpoint tuples by descending checkpoint ID."""
+
+    __slots__ = ("checkpoint_id",)
+
+    def __init__(self, checkpoint_tuple: CheckpointTuple) -> None:
+        self.checkpoint_id = _checkpoint_id(checkpoint_tuple)
+
+    def __lt__(self, other: _SortKey) -> bool:
+        return self.checkpoint_id > other.checkpoint_id
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def _checkpoint_id(checkpoint_tuple: CheckpointTuple) -> str:
+    return checkpoint_tuple.config["configurable"]["checkpoint_id"]
+
+
+def _key(checkpoint_tuple: CheckpointTuple) -> _CheckpointKey:
+    configurable = checkpoint_tuple.config["configurable"]
+    return (
+        str(configurable["thread_id"]),
+        configurable["checkpoint_ns"],
+        configurable["checkpoint_id"],
+    )
+
+
+def _thread_config(thread_id: str) -> RunnableConfig:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _latest(
+    checkpoint_tuples: Iterable[CheckpointTuple | None],
+) -> CheckpointTuple | None:
+    return max(
+        (c for c in checkpoint_tuples if c is not None),
+        key=_checkpoint_id,
+        default=None,
+    )
+
+
+def _dedupe(
+    checkpoint_tuples: Iterator[CheckpointTuple], enabled: bool
+) -> Iterator[CheckpointTuple]:
+    """Skip checkpoints listed twice, when they were copied to another shard."""
+    if not enabled:
+        yield from checkpoint_tuples
+        return
+    seen: set[_CheckpointKey] = set()
+    for checkpoint_tuple in checkpoint_tuples:
+        if (key := _key(checkpoint_tuple)) not in seen:
+            seen.add(key)
+            yield checkpoint_tuple
+
+
+def _group_writes(
+    pending_writes: list[tuple[str, str, Any]] | None,
+) -> dict[str, list[tuple[str, Any]]]:
+    grouped: dict[str, list[tuple[str, Any]]] = {}
+    for task_id, channel, value in pending_writes or []:
+        grouped.setdefault(task_id, []).append((channel, value))
+    return grouped
+
+
+def _copy_config(checkpoint_tuple: CheckpointTuple) -> RunnableConfig:
+    """Config to pass to `put` to store a checkpoint with its original parent."""
+    if checkpoint_tuple.parent_config is not None:
+        return checkpoint_tuple.parent_config
+    configurable = checkpoint_tuple.config["configurable"]
+    return {
+        "configurable": {
+            "thread_id": configurable["thread_id"],
+            "checkpoint_ns": configurable["checkpoint_ns"],
+        }
+    }
+
+
+def _copy_thread(
+    source: BaseCheckpointSaver, target: BaseCheckpointSaver, thread_id: str
+) -> None:
+    """Copy all checkpoints and pending writes of a thread, oldest first."""
+    for checkpoint_tuple in reversed(list(source.list(_thread_config(thread_id)))):
+        config = target.put(
+            _copy_config(checkpoint_tuple),
+            checkpoint_tuple.checkpoint,
+            checkpoint_tuple.metadata,
+            checkpoint_tuple.checkpoint["channel_versions"],
+        )
+        for task_id, writes in _group_writes(checkpoint_tuple.pending_writes).items():
+            target.put_writes(config, writes, task_id)
+
+
+async def _acopy_thread(
+    source: BaseCheckpointSaver, target: BaseCheckpointSaver, thread_id: str
+) -> None:
+    checkpoint_tuples = [c async for c in source.alist(_thread_config(thread_id))]
+    for checkpoint_tuple in reversed(checkpoint_tuples):
+        config = await target.aput(
+            _copy_config(checkpoint_tuple),
+            checkpoint_tuple.checkpoint,
+            checkpoint_tuple.metadata,
+            checkpoint_tuple.checkpoint["channel_versions"],
+        )
+        for task_id, writes in _group_writes(checkpoint_tuple.pending_writes).items():
+            await target.aput_writes(config, writes, task_id)
+
+
+async def _anext(iterator: AsyncIterator[CheckpointTuple]) -> CheckpointTuple | None:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+__all__ = ["HashRing", "ShardedCheckpointSaver"]
@@ -0,0 +1,683 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    V,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.base.export import decode_row, encode_row
+
+# (thread ID, checkpoint NS, checkpoint ID)
+_CheckpointKey = tuple[str, str, str]
+
+
+class _Location(NamedTuple):
+    """Location of an archived checkpoint record in the segment files."""
+
+    segment: int
+    offset: int
+    length: int
+    digest: str | None
+
+
+class TieredCheckpointSaver(BaseCheckpointSaver[V]):
+    """A checkpoint saver that archives idle threads from a hot saver to local files.
+
+    New checkpoints and writes always go to the `hot` saver. `archive()` moves threads
+    whose latest checkpoint is older than `max_age` to the cold tier: compressed,
+    append-only segment files, with an index file per thread. Reads are served from
+    the hot saver, falling back to the cold tier on a miss. When the latest
+    checkpoint of an archived thread is read, e.g. to resume the thread, it is copied
+    back to the hot saver, so that new writes attach to it.
+
+    Threads are archived whole, since checkpoint savers can only delete whole threads.
+    Archiving is meant to run periodically from a single process (e.g. a cron job).
+    The latest checkpoint of a thread is checked again after it's archived, and the
+    thread is only deleted from the hot saver if it didn't change in the meantime.
+    Checkpoints that are already archived unchanged, e.g. restored by a read, are not
+    appended again. `compact()` reclaims the space of records no longer referenced.
+
+    Args:
+        hot: The checkpoint saver for recent checkpoints, e.g. a PostgresSaver.
+        path: Directory of the cold tier. It is created if it doesn't exist.
+        max_age: Threads whose latest checkpoint is older than this are archived.
+            Defaults to one day.
+        segment_size: Size in bytes after which a new segment file is started.
+            Defaults to 64 MiB.
+        compression_level: zlib compression level of archived checkpoints.
+        serde: The serializer for archived checkpoints. Defaults to the serializer of
+            the hot saver.
+
+    Examples:
+
+        >>> from langgraph.checkpoint.postgres import PostgresSaver
+        >>> from langgraph.checkpoint.tiered import TieredCheckpointSaver
+        >>> with PostgresSaver.from_conn_string(DB_URI) as hot:
+        ...     checkpointer = TieredCheckpointSaver(hot, "/var/lib/checkpoints")
+        ...     graph = builder.compile(checkpointer=checkpointer)
+        ...     # periodically
+        ...     checkpointer.archive()
+    """
+
+    def __init__(
+        self,
+        hot: BaseCheckpointSaver[V],
+        path: str | os.PathLike[str],
+        *,
+        max_age: timedelta = timedelta(days=1),
+        segment_size: int = 64 * 1024 * 1024,
+        compression_level: int = 6,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        super().__init__(serde=serde or hot.serde)
+        self.hot = hot
+        self.max_age = max_age
+        self.cold = SegmentStore(
+            path,
+            self.serde,
+            segment_size=segment_size,
+            compression_level=compression_level,
+        )
+
+    @property
+    def config_specs(self) -> list:
+        return self.hot.config_specs
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple from the hot saver, or from the cold tier on a miss.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            Optional[CheckpointTuple]: The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        if checkpoint_tuple := self.hot.get_tuple(config):
+            return checkpoint_tuple
+        checkpoint_tuple = self.cold.get(config)
+        if checkpoint_tuple is not None and not get_checkpoint_id(config):
+            self._restore(checkpoint_tuple)
+        return checkpoint_tuple
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints from the hot saver, followed by archived checkpoints.
+
+        Args:
+            config: Base configuration for filtering checkpoints.
+            filter: Additional filtering criteria for metadata.
+            before: If provided, only checkpoints before the specified checkpoint ID are returned.
+            limit: Maximum number of checkpoints to return.
+
+        Yields:
+            Iterator[CheckpointTuple]: An iterator of matching checkpoint tuples.
+        """
+        seen: set[_CheckpointKey] = set()
+        for checkpoint_tuple in self.hot.list(
+            config, filter=filter, before=before, limit=limit
+        ):
+            seen.add(_key(checkpoint_tuple))
+            yield checkpoint_tuple
+        if limit is not None and len(seen) >= limit:
+            return
+        yield from islice(
+            self.cold.search(config, filter=filter, before=before, exclude=seen),
+            limit - len(seen) if limit is not None else None,
+        )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint in the hot saver.
+
+        Args:
+            config: Configuration for the checkpoint.
+            checkpoint: The checkpoint to store.
+            metadata: Additional metadata for the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            RunnableConfig: Updated configuration after storing the checkpoint.
+        """
+        return self.hot.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes linked to a checkpoint in the hot saver.
+
+        Args:
+            config: Configuration of the related checkpoint.
+            writes: List of writes to store.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        self.hot.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread, in both tiers.
+
+        Args:
+            thread_id: The thread ID whose checkpoints should be deleted.
+        """
+        self.hot.delete_thread(thread_id)
+        self.cold.delete(thread_id)
+
+    def compact(self) -> int:
+        """Rewrite the segment files of the cold tier without unreferenced records.
+
+        Returns:
+            int: The number of bytes reclaimed.
+        """
+        return self.cold.compact()
+
+    def archive(self, thread_ids: Iterable[str] | None = None) -> int:
+        """Move idle threads from the hot saver to the cold tier.
+
+        Args:
+            thread_ids: The threads to consider. Defaults to None, which considers
+                every thread listed by `list_thread_ids` of the hot saver.
+
+        Returns:
+            int: The number of archived threads.
+        """
+        cutoff = datetime.now(timezone.utc) - self.max_age
+        if thread_ids is None:
+            thread_ids = self.hot.list_thread_ids()
+        archived = 0
+        for thread_id in thread_ids:
+            thread_config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+            # check the latest checkpoint before loading the whole thread
+            latest = next(iter(self.hot.list(thread_config, limit=1)), None)
+            if latest is None or not _is_idle([latest], cutoff):
+                continue
+            checkpoint_tuples = list(self.hot.list(thread_config))
+            if not _is_idle(checkpoint_tuples, cutoff):
+                continue
+            self.cold.append(thread_id, checkpoint_tuples)
+            # skip deleting the thread if it was resumed in the meantime
+            latest = next(iter(self.hot.list(thread_config, limit=1)), None)
+            if latest is not None and _key(latest) == _key(checkpoint_tuples[0]):
+                self.hot.delete_thread(thread_id)
+                archived += 1
+        return archived
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Asynchronous version of `get_tuple`."""
+        if checkpoint_tuple := await self.hot.aget_tuple(config):
+            return checkpoint_tuple
+        checkpoint_tuple = await asyncio.get_running_loop().run_in_executor(
+            None, self.cold.get, config
+        )
+        if checkpoint_tuple is not None and not get_checkpoint_id(config):
+            await self._arestore(checkpoint_tuple)
+        return checkpoint_tuple
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Asynchronous version of `list`."""
+        seen: set[_CheckpointKey] = set()
+        async for checkpoint_tuple in self.hot.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            seen.add(_key(checkpoint_tuple))
+            yield checkpoint_tuple
+        if limit is not None and len(seen) >= limit:
+            return
+        archived = await asyncio.get_running_loop().run_in_executor(
+            None,
+            lambda: list(
+                islice(
+                    self.cold.search(
+                        config, filter=filter, before=before, exclude=seen
+                    ),
+                    limit - len(seen) if limit is not None else None,
+                )
+            ),
+        )
+        for checkpoint_tuple in archived:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Asynchronous version of `put`."""
+        return await self.hot.aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Asynchronous version of `put_writes`."""
+        await self.hot.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Asynchronous version of `delete_thread`."""
+        await self.hot.adelete_thread(thread_id)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.cold.delete, thread_id
+        )
+
+    async def acompact(self) -> int:
+        """Asynchronous version of `compact`."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.cold.compact)
+
+    async def aarchive(self, thread_ids: Iterable[str] | None = None) -> int:
+        """Asynchronous version of `archive`."""
+        cutoff = datetime.now(timezone.utc) - self.max_age
+        if thread_ids is None:
+            thread_ids = [t async for t in self.hot.alist_thread_ids()]
+        loop = asyncio.get_running_loop()
+        archived = 0
+        for thread_id in thread_ids:
+            thread_config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+            latest = [c async for c in self.hot.alist(thread_config, limit=1)]
+            if not _is_idle(latest, cutoff):
+                continue
+            checkpoint_tuples = [c async for c in self.hot.alist(thread_config)]
+            if not _is_idle(checkpoint_tuples, cutoff):
+                continue
+            await loop.run_in_executor(
+                None, self.cold.append, thread_id, checkpoint_tuples
+            )
+            # skip deleting the thread if it was resumed in the meantime
+            latest = [c async for c in self.hot.alist(thread_config, limit=1)]
+            if latest and _key(latest[0]) == _key(checkpoint_tuples[0]):
+                await self.hot.adelete_thread(thread_id)
+                archived += 1
+        return archived
+
+    def get_next_version(self, current: V | None, channel: None) -> V:
+        return self.hot.get_next_version(current, channel)
+
+    def _restore(self, checkpoint_tuple: CheckpointTuple) -> None:
+        """Copy an archived checkpoint and its pending writes back to the hot saver."""
+        config = self.hot.put(
+            checkpoint_tuple.parent_config or _thread_config(checkpoint_tuple),
+            checkpoint_tuple.checkpoint,
+            checkpoint_tuple.metadata,
+            checkpoint_tuple.checkpoint["channel_versions"],
+        )
+        for task_id, writes in _group_writes(checkpoint_tuple.pending_writes).items():
+            self.hot.put_writes(config, writes, task_id)
+
+    async def _arestore(self, checkpoint_tuple: CheckpointTuple) -> None:
+        config = await self.hot.aput(
+            checkpoint_tuple.parent_config or _thread_config(checkpoint_tuple),
+            checkpoint_tuple.checkpoint,
+            checkpoint_tuple.metadata,
+            checkpoint_tuple.checkpoint["channel_versions"],
+        )
+        for task_id, writes in _group_writes(checkpoint_tuple.pending_writes).items():
+            await self.hot.aput_writes(config, writes, task_id)
+
+
+class SegmentStore:
+    """Cold tier of a TieredCheckpointSaver.
+
+    Checkpoint tuples are serialized, compressed with zlib and appended to numbered
+    segment files in `<path>/segments`. For each thread, an append-only index file in
+    `<path>/threads` maps checkpoint IDs to the segment, offset, length and digest
+    of their record. Segment files are only rewritten by compaction, which copies
+    the records still referenced by an index to new segments. Deleting a thread
+    compacts the segments holding its records, so that its data is removed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        serde: SerializerProtocol,
+        *,
+        segment_size: int = 64 * 1024 * 1024,
+        compression_level: int = 6,
+    ) -> None:
+        self.path = Path(path)
+        self.serde = serde
+        self.segment_size = segment_size
+        self.compression_level = compression_level
+        self.lock = threading.Lock()
+        (self.path / "segments").mkdir(parents=True, exist_ok=True)
+        (self.path / "threads").mkdir(parents=True, exist_ok=True)
+        segments = [int(p.stem) for p in (self.path / "segments").glob("*.seg")]
+        self.segment = max(segments, default=0)
+
+    def append(
+        self, thread_id: str, checkpoint_tuples: Sequence[CheckpointTuple]
+    ) -> None:
+        """Archive checkpoint tuples of a thread.
+
+        Checkpoints already archived with the same content are skipped.
+        """
+        records = [self._dump(c) for c in checkpoint_tuples]
+        with self.lock:
+            index = self._read_index(self._index_path(thread_id))
+            new = []
+            for checkpoint_tuple, record in zip(checkpoint_tuples, records):
+                configurable = checkpoint_tuple.config["configurable"]
+                location = index.get(
+                    (configurable["checkpoint_ns"], configurable["checkpoint_id"])
+                )
+                if location is None or location.digest != _digest(record):
+                    new.append((checkpoint_tuple, record))
+            if not new:
+                return
+            segment_path = self._segment_path(self.segment)
+            if (
+                segment_path.exists()
+                and segment_path.stat().st_size >= self.segment_size
+            ):
+                self.segment += 1
+                segment_path = self._segment_path(self.segment)
+            entries = []
+            with open(segment_path, "ab") as f:
+                offset = f.tell()
+                for checkpoint_tuple, record in new:
+                    f.write(record)
+                    entries.append(
+                        [
+                            checkpoint_tuple.config["configurable"]["checkpoint_ns"],
+                            checkpoint_tuple.config["configurable"]["checkpoint_id"],
+                            self.segment,
+                            offset,
+                            len(record),
+                            _digest(record),
+                        ]
+                    )
+                    offset += len(record)
+                f.flush()
+                os.fsync(f.fileno())
+            # the index is only updated once the records are durable
+            with open(self._index_path(thread_id), "a") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in entries)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def get(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get an archived checkpoint tuple, or the latest one if no checkpoint ID is given."""
+        index = self._read_index(self._index_path(config["configurable"]["thread_id"]))
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if checkpoint_id := get_checkpoint_id(config):
+            location = index.get((checkpoint_ns, checkpoint_id))
+        else:
+            latest = max((k for k in index if k[0] == checkpoint_ns), default=None)
+            location = index[latest] if latest is not None else None
+        return self._load(location) if location is not None else None
+
+    def search(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        exclude: set[_CheckpointKey] | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """Yield archived checkpoint tuples, newest first within each thread."""
+        if config is not None:
+            index_paths = [self._index_path(config["configurable"]["thread_id"])]
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            config_checkpoint_id = get_checkpoint_id(config)
+        else:
+            index_paths = sorted((self.path / "threads").glob("*.idx"))
+            checkpoint_ns = config_checkpoint_id = None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        for index_path in index_paths:
+            index = self._read_index(index_path)
+            for (ns, checkpoint_id), location in sorted(
+                index.items(), key=lambda item: item[0][1], reverse=True
+            ):
+                if checkpoint_ns is not None and ns != checkpoint_ns:
+                    continue
+                if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
+                    continue
+                if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
+                    continue
+                checkpoint_tuple = self._load(location)
+                if exclude and _key(checkpoint_tuple) in exclude:
+                    continue
+                if filter and not all(
+                    checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()
+                ):
+                    continue
+                yield checkpoint_tuple
+
+    def delete(self, thread_id: str) -> None:
+        """Remove a thread from the cold tier, compacting the segments holding it."""
+        with self.lock:
+            index_path = self._index_path(thread_id)
+            segments = {
+                location.segment for _, location in self._read_entries(index_path)
+            }
+            index_path.unlink(missing_ok=True)
+            if segments:
+                self._compact(segments)
+
+    def compact(self) -> int:
+        """Rewrite all segments without the records no index refers to.
+
+        Returns:
+            int: The number of bytes reclaimed.
+        """
+        with self.lock:
+            return self._compact(None)
+
+    def _compact(self, segments: set[int] | None) -> int:
+        """Copy the referenced records of `segments` (None for all) to new segments.
+
+        Index files are replaced atomically once the new segments are durable, then
+        the old segments are removed. A crash in between only leaves unreferenced
+        records behind, which the next compaction removes.
+        """
+        segment_paths = {int(p.stem): p for p in (self.path / "segments").glob("*.seg")}
+        if segments is not None:
+            segment_paths = {
+                segment: p
+                for segment, p in segment_paths.items()
+                if segment in segments
+            }
+        if not segment_paths:
+            return 0
+        before = sum(p.stat().st_size for p in segment_paths.values())
+        # index files referring to the compacted segments
+        indexes = {}
+        for index_path in (self.path / "threads").glob("*.idx"):
+            index = self._read_index(index_path)
+            if any(location.segment in segment_paths for location in index.values()):
+                indexes[index_path] = index
+        output = max(self.segment, *segment_paths) + 1
+        output_path = self._segment_path(output)
+        after = 0
+        f: BinaryIO | None = None
+        try:
+            for index in indexes.values():
+                for key, location in index.items():
+                    if location.segment not in segment_paths:
+                        continue
+                    record = self._read_record(location)
+                    if f is None or f.tell() >= self.segment_size:
+                        if f is not None:
+                            _close_durably(f)
+                            output += 1
+                            output_path = self._segment_path(output)
+                        f = open(output_path, "ab")
+                    index[key] = _Location(
+                        output, f.tell(), len(record), _digest(record)
+                    )
+                    f.write(record)
+                    after += len(record)
+        finally:
+            if f is not None:
+                _close_durably(f)
+        for index_path, index in indexes.items():
+            tmp_path = index_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as tmp:
+                tmp.writelines(
+                    json.dumps([ns, checkpoint_id, *location]) + "\n"
+                    for (ns, checkpoint_id), location in index.items()
+                )
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, index_path)
+        for p in segment_paths.values():
+            p.unlink()
+        self.segment = max(self.segment, output)
+        return before - after
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.path / "segments" / f"{segment:08d}.seg"
+
+    def _index_path(self, thread_id: str) -> Path:
+        # thread IDs are arbitrary strings, so they can't be used as file names
+        digest = hashlib.sha256(str(thread_id).encode()).hexdigest()
+        return self.path / "threads" / f"{digest}.idx"
+
+    def _read_entries(
+        self, index_path: Path
+    ) -> list[tuple[tuple[str, str], _Location]]:
+        try:
+            with open(index_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            # a line without newline is a partial write, ignore it
+            if not line.endswith("\n"):
+                break
+            ns, checkpoint_id, segment, offset, length, *digest = json.loads(line)
+            entries.append(
+                (
+                    (ns, checkpoint_id),
+                    _Location(segment, offset, length, digest[0] if digest else None),
+                )
+            )
+        return entries
+
+    def _read_index(self, index_path: Path) -> dict[tuple[str, str], _Location]:
+        # checkpoints archived more than once keep the latest record
+        return dict(self._read_entries(index_path))
+
+    def _read_record(self, location: _Location) -> bytes:
+        with open(self._segment_path(location.segment), "rb") as f:
+            f.seek(location.offset)
+            return f.read(location.length)
+
+    def _dump(self, checkpoint_tuple: CheckpointTuple) -> bytes:
+        type_, data = self.serde.dumps_typed(
+            {
+                "config": checkpoint_tuple.config,
+                "checkpoint": checkpoint_tuple.checkpoint,
+                "metadata": checkpoint_tuple.metadata,
+                "parent_config": checkpoint_tuple.parent_config,
+                "pending_writes": checkpoint_tuple.pending_writes,
+            }
+        )
+        return zlib.compress(encode_row((type_, data)), self.compression_level)
+
+    def _load(self, location: _Location) -> CheckpointTuple:
+        record = self._read_record(location)
+        type_, data = decode_row(zlib.decompress(record))
+        value = self.serde.loads_typed((type_, data))
+        return CheckpointTuple(
+            value["config"],
+            value["checkpoint"],
+            value["metadata"],
+            value["parent_config"],
+            [tuple(w) for w in value["pending_writes"] or []],
+        )
+
+
+def _digest(record: bytes) -> str:
+    return hashlib.blake2b(record, digest_size=16).hexdigest()
+
+
+def _close_durably(f: BinaryIO) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+
+
+def _key(checkpoint_tuple: CheckpointTuple) -> _CheckpointKey:
+    configurable = checkpoint_tuple.config["configurable"]
+    return (
+        configurable["thread_id"],
+        configurable["checkpoint_ns"],
+        configurable["checkpoint_id"],
+    )
+
+
+def _thread_config(checkpoint_tuple: CheckpointTuple) -> RunnableConfig:
+    configurable = checkpoint_tuple.config["configurable"]
+    return {
+        "configurable": {
+            "thread_id": configurable["thread_id"],
+            "checkpoint_ns": configurable["checkpoint_ns"],
+        }
+    }
+
+
+def _group_writes(
+    pending_writes: list[tuple[str, str, Any]] | None,
+) -> dict[str, list[tuple[str, Any]]]:
+    grouped: dict[str, list[tuple[str, Any]]] = {}
+    for task_id, channel, value in pending_writes or []:
+        grouped.setdefault(task_id, []).append((channel, value))
+    return grouped
+
+
+def _checkpoint_time(checkpoint_tuple: CheckpointTuple) -> datetime:
+    return datetime.fromisoformat(checkpoint_tuple.checkpoint["ts"])
+
+
+def _is_idle(checkpoint_tuples: Sequence[CheckpointTuple], cutoff: datetime) -> bool:
+    return bool(checkpoint_tuples) and all(
+        _checkpoint_time(c) < cutoff for c in checkpoint_tuples
+    )
+
+
+__all__ = ["TieredCheckpointSaver", "SegmentStore"]
@@ -28,6 +28,8 @@ from typing_extensions import override
 
 from langgraph.store.base.embed import (
     AEmbeddingsFunc,
+    CachedEmbeddings,
+    EmbeddingsCacheConfig,
     EmbeddingsFunc,
     ensure_embeddings,
     get_text_at_path,
@@ -670,6 +672,26 @@ class IndexConfig(TypedDict, total=False):
         - Complex nested paths are supported (e.g., "a.b[*].c.d")
     """
 
+    cache: EmbeddingsCacheConfig
+    """Optional cache for computed embeddings.
+    
+    When set, the store wraps `embed` in a
+    [CachedEmbeddings][langgraph.store.base.embed.CachedEmbeddings], so that
+    re-putting unchanged text or repeating a search query does not call the
+    embedding model again.
+    
+    ???+ example "Examples"
+        ```python
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": "openai:text-embedding-3-small",
+                "cache": {"max_size": 50_000, "path": "embeddings.sqlite"},
+            }
+        )
+        ```
+    """
+
 
 class BaseStore(ABC):
     """Abstract base class for persistent key-value stores.
@@ -1259,6 +1281,8 @@ __all__ = [
     "NamespacePath",
     "NamespaceMatchType",
     "Embeddings",
+    "CachedEmbeddings",
+    "EmbeddingsCacheConfig",
     "ensure_embeddings",
     "tokenize_path",
     "get_text_at_path",
@@ -9,10 +9,16 @@ asynchronous operations.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures as cf
 import functools
+import hashlib
 import json
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
 from collections.abc import Awaitable, Sequence
-from typing import Any, Callable
+from typing import Any, Callable, Literal, TypedDict
 
 from langchain_core.embeddings import Embeddings
 
@@ -31,8 +37,27 @@ Similar to EmbeddingsFunc, but returns an awaitable that resolves to the embeddi
 """
 
 
+class EmbeddingsCacheConfig(TypedDict, total=False):
+    """Configuration for caching embeddings by text.
+
+    See [CachedEmbeddings][langgraph.store.base.embed.CachedEmbeddings].
+    """
+
+    max_size: int
+    """Maximum number of vectors kept in memory. Defaults to 10,000."""
+
+    path: str
+    """Optional SQLite database file used to persist vectors across restarts."""
+
+    namespace: str
+    """Key prefix separating the vectors of different embedding models
+    sharing the same persisted cache. Defaults to the empty string."""
+
+
 def ensure_embeddings(
     embed: Embeddings | EmbeddingsFunc | AEmbeddingsFunc | str | None,
+    *,
+    cache: EmbeddingsCacheConfig | None = None,
 ) -> Embeddings:
     """Ensure that an embedding function conforms to LangChain's Embeddings interface.
 
@@ -44,6 +69,8 @@ def ensure_embeddings(
         embed: Either an existing Embeddings instance, or a function that converts
             text to embeddings. If the function is async, it will be used for both
             sync and async operations.
+        cache: Optional cache configuration. If provided, the embeddings are
+            wrapped in a `CachedEmbeddings`.
 
     Returns:
         An Embeddings instance that wraps the provided function(s).
@@ -74,6 +101,11 @@ def ensure_embeddings(
         result = embeddings.embed_query("hello")
         ```
     """
+    if cache is not None:
+        embeddings = ensure_embeddings(embed)
+        if isinstance(embeddings, CachedEmbeddings):
+            return embeddings
+        return CachedEmbeddings(embeddings, **cache)
     if embed is None:
         raise ValueError("embed must be provided")
     if isinstance(embed, str):
@@ -223,6 +255,228 @@ class EmbeddingsLambda(Embeddings):
         return (await afunc([text]))[0]
 
 
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that caches vectors by text and coalesces concurrent requests.
+
+    Vectors are kept in a bounded LRU keyed by a hash of the text, optionally
+    backed by a SQLite file so they survive restarts. Texts that are already being
+    embedded by another thread or task are awaited instead of being sent to the
+    model again. Document and query embeddings are cached separately, since some
+    models embed them differently.
+
+    Args:
+        embeddings: The embeddings to wrap.
+        max_size: Maximum number of vectors kept in memory.
+        path: Optional SQLite database file used to persist vectors.
+        namespace: Key prefix separating models that share a persisted cache.
+
+    ??? example "Examples"
+        Share one cache between stores:
+        ```python
+        from langchain.embeddings import init_embeddings
+        from langgraph.store.base.embed import CachedEmbeddings
+        from langgraph.store.memory import InMemoryStore
+
+        embeddings = CachedEmbeddings(
+            init_embeddings("openai:text-embedding-3-small"),
+            path="embeddings.sqlite",
+            namespace="text-embedding-3-small",
+        )
+        store = InMemoryStore(index={"dims": 1536, "embed": embeddings})
+        ```
+
+        Or let the store wrap its embeddings:
+        ```python
+        store = InMemoryStore(
+            index={
+                "dims": 1536,
+                "embed": "openai:text-embedding-3-small",
+                "cache": {"max_size": 50_000},
+            }
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        *,
+        max_size: int = 10_000,
+        path: str | None = None,
+        namespace: str = "",
+    ) -> None:
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        # Texts being embedded right now, with the thread that is embedding them
+        self._inflight: dict[bytes, tuple[cf.Future[list[float]], int]] = {}
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB)"
+            )
+            self._conn.commit()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of texts, only calling the wrapped embeddings on cache misses."""
+        keys, found, owned, waiting = self._claim("d", texts, sync=True)
+        if owned:
+            vectors = self._resolve(
+                owned, self.embeddings.embed_documents, list(owned.values())
+            )
+            found.update(zip(owned, vectors))
+        for key, future in waiting.items():
+            found[key] = future.result()
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, only calling the wrapped embeddings on a cache miss."""
+        keys, found, owned, waiting = self._claim("q", [text], sync=True)
+        if owned:
+            vectors = self._resolve(
+                owned, lambda texts: [self.embeddings.embed_query(texts[0])], [text]
+            )
+            found.update(zip(owned, vectors))
+        for key, future in waiting.items():
+            found[key] = future.result()
+        return found[keys[0]]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously embed a list of texts, only embedding cache misses."""
+        keys, found, owned, waiting = self._claim("d", texts, sync=False)
+        if owned:
+            vectors = await self._aresolve(
+                owned, self.embeddings.aembed_documents(list(owned.values()))
+            )
+            found.update(zip(owned, vectors))
+        for key, future in waiting.items():
+            found[key] = await asyncio.wrap_future(future)
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Asynchronously embed a query, only calling the wrapped embeddings on a miss."""
+        keys, found, owned, waiting = self._claim("q", [text], sync=False)
+        if owned:
+
+            async def embed() -> list[list[float]]:
+                return [await self.embeddings.aembed_query(text)]
+
+            found.update(zip(owned, await self._aresolve(owned, embed())))
+        for key, future in waiting.items():
+            found[key] = await asyncio.wrap_future(future)
+        return found[keys[0]]
+
+    def _key(self, kind: Literal["d", "q"], text: str) -> bytes:
+        return hashlib.sha256(
+            f"{kind}\0{self.namespace}\0{text}".encode("utf-8", "surrogatepass")
+        ).digest()
+
+    def _claim(
+        self, kind: Literal["d", "q"], texts: list[str], *, sync: bool
+    ) -> tuple[
+        list[bytes],
+        dict[bytes, list[float]],
+        dict[bytes, str],
+        dict[bytes, cf.Future[list[float]]],
+    ]:
+        """Split texts into cached vectors, texts to embed and texts to wait for."""
+        keys = [self._key(kind, text) for text in texts]
+        found: dict[bytes, list[float]] = {}
+        owned: dict[bytes, str] = {}
+        waiting: dict[bytes, cf.Future[list[float]]] = {}
+        thread = threading.get_ident()
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in owned or key in waiting:
+                    continue
+                if (vector := self._cache.get(key)) is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = vector
+                elif (inflight := self._inflight.get(key)) is not None and (
+                    # A sync caller must not block on a task running on its own
+                    # thread's event loop, so it embeds the text itself instead.
+                    not sync or inflight[1] != thread
+                ):
+                    waiting[key] = inflight[0]
+                else:
+                    owned[key] = text
+                    if inflight is None:
+                        self._inflight[key] = (cf.Future(), thread)
+        if owned and self._conn is not None:
+            for key, vector in self._load(list(owned)).items():
+                found[key] = vector
+                del owned[key]
+                self._finish({key: vector})
+        return keys, found, owned, waiting
+
+    def _resolve(
+        self,
+        owned: dict[bytes, str],
+        embed: Callable[[list[str]], list[list[float]]],
+        texts: list[str],
+    ) -> list[list[float]]:
+        try:
+            vectors = embed(texts)
+        except BaseException as exc:
+            self._fail(owned, exc)
+            raise
+        self._finish(dict(zip(owned, vectors)), persist=True)
+        return vectors
+
+    async def _aresolve(
+        self, owned: dict[bytes, str], embed: Awaitable[list[list[float]]]
+    ) -> list[list[float]]:
+        try:
+            vectors = await embed
+        except BaseException as exc:
+            self._fail(owned, exc)
+            raise
+        self._finish(dict(zip(owned, vectors)), persist=True)
+        return vectors
+
+    def _finish(
+        self, vectors: dict[bytes, list[float]], *, persist: bool = False
+    ) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._cache[key] = vector
+                self._cache.move_to_end(key)
+                if (inflight := self._inflight.pop(key, None)) is not None:
+                    inflight[0].set_result(vector)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+            if persist and self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(k, array("d", v).tobytes()) for k, v in vectors.items()],
+                )
+                self._conn.commit()
+
+    def _fail(self, owned: dict[bytes, str], exc: BaseException) -> None:
+        with self._lock:
+            for key in owned:
+                if (inflight := self._inflight.pop(key, None)) is not None:
+                    inflight[0].set_exception(exc)
+
+    def _load(self, keys: list[bytes]) -> dict[bytes, list[float]]:
+        assert self._conn is not None
+        found: dict[bytes, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                for key, blob in self._conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN ("
+                    + ",".join("?" * len(chunk))
+                    + ")",
+                    chunk,
+                ):
+                    found[key] = array("d", blob).tolist()
+        return found
+
+
 def get_text_at_path(obj: Any, path: str | list[str]) -> list[str]:
     """Extract text from an object using a path expression or pre-tokenized path.
 
@@ -417,6 +671,8 @@ def _get_init_embeddings() -> Callable[[str], Embeddings] | None:
 
 __all__ = [
     "ensure_embeddings",
+    "CachedEmbeddings",
+    "EmbeddingsCacheConfig",
     "EmbeddingsFunc",
     "AEmbeddingsFunc",
 ]
@@ -102,13 +102,15 @@ Tip:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import concurrent.futures as cf
 import functools
 import logging
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from importlib import util
+from itertools import islice
 from typing import Any
 
 from langchain_core.embeddings import Embeddings
@@ -162,6 +164,19 @@ class InMemoryStore(BaseStore):
         when creating the store. Without this configuration, all `index` arguments passed to
         `put` or `aput`will have no effect.
 
+    Note:
+        Filtered searches scan every item under the namespace prefix by default. Pass
+        `indexed_fields` to maintain inverted indexes on top-level value fields: equality
+        and `$in` filters on those fields are answered from a hash index, and `$gt`, `$gte`,
+        `$lt` and `$lte` from a sorted index, before any vector scoring happens.
+            store = InMemoryStore(indexed_fields=["status", "priority"])
+            store.search(("tasks",), filter={"status": "open", "priority": {"$gte": 2}})
+
+    Note:
+        Search results are ordered by namespace, then by insertion order within each
+        namespace, which `offset` and `limit` page through. Range filters (`$gt`,
+        `$gte`, `$lt`, `$lte`) never match missing, None or non-numeric values.
+
     Warning:
         This store keeps all data in memory. Data is lost when the process exits.
         For persistence, use a database-backed store like PostgresStore.
@@ -176,23 +191,36 @@ class InMemoryStore(BaseStore):
     __slots__ = (
         "_data",
         "_vectors",
+        "_namespaces",
+        "_indexed_version",
+        "_fields",
         "index_config",
         "embeddings",
     )
 
-    def __init__(self, *, index: IndexConfig | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        index: IndexConfig | None = None,
+        indexed_fields: Sequence[str] | None = None,
+    ) -> None:
         # Both _data and _vectors are wrapped in the In-memory API
         # Do not change their names
-        self._data: dict[tuple[str, ...], dict[str, Item]] = defaultdict(dict)
+        self._data: dict[tuple[str, ...], dict[str, Item]] = _NamespaceDict(dict)
         # [ns][key][path]
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        # Prefix tree over the keys of _data, see _namespace_index
+        self._namespaces = _NamespaceTrie()
+        self._indexed_version = self._data.version
+        self._fields = _FieldIndex(indexed_fields) if indexed_fields else None
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
             self.embeddings: Embeddings | None = ensure_embeddings(
                 self.index_config.get("embed"),
+                cache=self.index_config.get("cache"),
             )
             self.index_config["__tokenized_fields"] = [
                 (p, tokenize_path(p)) if p != "$" else (p, p)
@@ -235,9 +263,61 @@ class InMemoryStore(BaseStore):
 
     # Helpers
 
+    def _namespace_index(self) -> _NamespaceTrie:
+        """Return the namespace trie, rebuilding indexes if namespaces were added,
+        removed or replaced in _data directly."""
+        if self._indexed_version != self._data.version:
+            self._namespaces = _NamespaceTrie.from_data(self._data)
+            if self._fields is not None:
+                self._fields = _FieldIndex.from_data(self._fields.fields, self._data)
+            self._indexed_version = self._data.version
+        return self._namespaces
+
+    def _put_item(self, item: Item) -> None:
+        trie = self._namespace_index()
+        items = self._data.get(item.namespace)
+        if items is None:
+            items = self._data[item.namespace] = {}
+            trie.add_namespace(item.namespace)
+            self._indexed_version = self._data.version
+        previous = items.get(item.key)
+        if previous is None:
+            trie.add_items(item.namespace, 1)
+        if self._fields is not None:
+            if previous is not None:
+                self._fields.remove(previous)
+            self._fields.add(item)
+        items[item.key] = item
+
+    def _delete_item(self, namespace: tuple[str, ...], key: str) -> None:
+        trie = self._namespace_index()
+        if (vectors := self._vectors.get(namespace)) is not None:
+            vectors.pop(key, None)
+        items = self._data.get(namespace)
+        if items is not None and (previous := items.pop(key, None)) is not None:
+            trie.add_items(namespace, -1)
+            if self._fields is not None:
+                self._fields.remove(previous, forget=True)
+
+    def _candidate_items(self, op: SearchOp) -> Iterator[Item]:
+        """Yield items under the namespace prefix, narrowed by the field indexes."""
+        trie = self._namespace_index()
+        refs = (
+            self._fields.lookup(op.filter)
+            if self._fields is not None and op.filter
+            else None
+        )
+        if refs is None:
+            for namespace, _ in trie.walk(op.namespace_prefix):
+                yield from self._data[namespace].values()
+            return
+        depth = len(op.namespace_prefix)
+        for namespace, key in self._fields.ordered(refs):
+            if namespace[:depth] == op.namespace_prefix:
+                yield self._data[namespace][key]
+
     def _filter_items(self, op: SearchOp) -> list[tuple[Item, list[list[float]]]]:
         """Filter items by namespace and filter function, return items with their embeddings."""
-        namespace_prefix = op.namespace_prefix
 
         def filter_func(item: Item) -> bool:
             if not op.filter:
@@ -249,22 +329,40 @@ class InMemoryStore(BaseStore):
             )
 
         filtered = []
-        for namespace in self._data:
-            if not (
-                namespace[: len(namespace_prefix)] == namespace_prefix
-                if len(namespace) >= len(namespace_prefix)
-                else False
-            ):
-                continue
-
-            for key, item in self._data[namespace].items():
-                if filter_func(item):
-                    if op.query and (embeddings := self._vectors[namespace].get(key)):
-                        filtered.append((item, list(embeddings.values())))
-                    else:
-                        filtered.append((item, []))
+        for item in self._candidate_items(op):
+            if filter_func(item):
+                if op.query and (
+                    embeddings := self._vectors.get(item.namespace, {}).get(item.key)
+                ):
+                    filtered.append((item, list(embeddings.values())))
+                else:
+                    filtered.append((item, []))
         return filtered
 
+    def _page_items(self, op: SearchOp) -> list[SearchItem]:
+        """Return one page of an unfiltered, unscored search.
+
+        Whole namespaces before `op.offset` are skipped using the trie's item counts.
+        """
+        page: list[SearchItem] = []
+        for namespace, start in self._namespace_index().seek(
+            op.namespace_prefix, op.offset
+        ):
+            if len(page) >= op.limit:
+                break
+            items = self._data[namespace].values()
+            for item in islice(items, start, start + op.limit - len(page)):
+                page.append(
+                    SearchItem(
+                        namespace=item.namespace,
+                        key=item.key,
+                        value=item.value,
+                        created_at=item.created_at,
+                        updated_at=item.updated_at,
+                    )
+                )
+        return page
+
     def _embed_search_queries(
         self,
         search_ops: dict[int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]],
@@ -273,14 +371,16 @@ class InMemoryStore(BaseStore):
         if self.index_config and self.embeddings and search_ops:
             queries = {op.query for (op, _) in search_ops.values() if op.query}
 
-            if queries:
-                with cf.ThreadPoolExecutor() as executor:
-                    futures = {
-                        q: executor.submit(self.embeddings.embed_query, q)
-                        for q in list(queries)
-                    }
-                    for query, future in futures.items():
-                        queryinmem_store[query] = future.result()
+            if len(queries) == 1:
+                query = queries.pop()
+                queryinmem_store[query] = self.embeddings.embed_query(query)
+            elif queries:
+                futures = {
+                    q: _get_executor().submit(self.embeddings.embed_query, q)
+                    for q in queries
+                }
+                for query, future in futures.items():
+                    queryinmem_store[query] = future.result()
 
         return queryinmem_store
 
@@ -305,41 +405,53 @@ class InMemoryStore(BaseStore):
         queryinmem_store: dict[str, list[float]],
         results: list[Result],
     ) -> None:
-        """Perform batch similarity search for multiple queries."""
+        """Perform batch similarity search for multiple queries.
+
+        Searches sharing the same candidates (see `_prepare_ops`) are scored together,
+        so the candidate vectors and their norms are only materialized once per group.
+        """
+        groups: dict[int, list[int]] = defaultdict(list)
         for i, (op, candidates) in ops.items():
             if not candidates:
                 results[i] = []
-                continue
-            if op.query and queryinmem_store:
-                query_embedding = queryinmem_store[op.query]
-                flat_items, flat_vectors = [], []
-                scoreless = []
-                for item, vectors in candidates:
-                    for vector in vectors:
-                        flat_items.append(item)
-                        flat_vectors.append(vector)
-                    if not vectors:
-                        scoreless.append(item)
-
-                scores = _cosine_similarity(query_embedding, flat_vectors)
-                sorted_results = sorted(
-                    zip(scores, flat_items), key=lambda x: x[0], reverse=True
-                )
-                # max pooling
-                seen: set[tuple[tuple[str, ...], str]] = set()
-                kept: list[tuple[float | None, Item]] = []
-                for score, item in sorted_results:
-                    key = (item.namespace, item.key)
-                    if key in seen:
-                        continue
-                    ix = len(seen)
-                    seen.add(key)
-                    if ix >= op.offset + op.limit:
-                        break
-                    if ix < op.offset:
-                        continue
+            elif op.query and queryinmem_store:
+                groups[id(candidates)].append(i)
+            else:
+                results[i] = [
+                    SearchItem(
+                        namespace=item.namespace,
+                        key=item.key,
+                        value=item.value,
+                        created_at=item.created_at,
+                        updated_at=item.updated_at,
+                    )
+                    for (item, _) in candidates[op.offset : op.offset + op.limit]
+                ]
 
-                    kept.append((score, item))
+        for indices in groups.values():
+            candidates = ops[indices[0]][1]
+            owners: list[int] = []
+            flat_vectors: list[list[float]] = []
+            scoreless: list[Item] = []
+            for ix, (item, vectors) in enumerate(candidates):
+                for vector in vectors:
+                    owners.append(ix)
+                    flat_vectors.append(vector)
+                if not vectors:
+                    scoreless.append(item)
+
+            search_ops = [ops[i][0] for i in indices]
+            rankings = _rank_candidates(
+                [queryinmem_store[op.query] for op in search_ops],  # type: ignore[index]
+                flat_vectors,
+                owners,
+                max(op.offset + op.limit for op in search_ops),
+            )
+            for i, op, ranking in zip(indices, search_ops, rankings):
+                kept: list[tuple[float | None, Item]] = [
+                    (score, candidates[ix][0])
+                    for score, ix in ranking[op.offset : op.offset + op.limit]
+                ]
                 if scoreless and len(kept) < op.limit:
                     # Corner case: if we request more items than what we have embedded,
                     # fill the rest with non-scored items
@@ -358,17 +470,6 @@ class InMemoryStore(BaseStore):
                     )
                     for score, item in kept
                 ]
-            else:
-                results[i] = [
-                    SearchItem(
-                        namespace=item.namespace,
-                        key=item.key,
-                        value=item.value,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at,
-                    )
-                    for (item, _) in candidates[op.offset : op.offset + op.limit]
-                ]
 
     def _prepare_ops(
         self, ops: Iterable[Op]
@@ -382,13 +483,22 @@ class InMemoryStore(BaseStore):
         search_ops: dict[
             int, tuple[SearchOp, list[tuple[Item, list[list[float]]]]]
         ] = {}
+        # Searches over the same namespace prefix and filter share one candidate
+        # list, which lets _batch_search score them with a single matrix product.
+        candidates: dict[tuple, list[tuple[Item, list[list[float]]]]] = {}
         for i, op in enumerate(ops):
             if isinstance(op, GetOp):
-                item = self._data[op.namespace].get(op.key)
+                item = self._data.get(op.namespace, {}).get(op.key)
                 results.append(item)
             elif isinstance(op, SearchOp):
-                search_ops[i] = (op, self._filter_items(op))
-                results.append(None)
+                if op.filter or (op.query and self.embeddings):
+                    group = (op.namespace_prefix, repr(op.filter), bool(op.query))
+                    if group not in candidates:
+                        candidates[group] = self._filter_items(op)
+                    search_ops[i] = (op, candidates[group])
+                    results.append(None)
+                else:
+                    results.append(self._page_items(op))
             elif isinstance(op, ListNamespacesOp):
                 results.append(self._handle_list_namespaces(op))
             elif isinstance(op, PutOp):
@@ -402,15 +512,16 @@ class InMemoryStore(BaseStore):
     def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
         for (namespace, key), op in put_ops.items():
             if op.value is None:
-                self._data[namespace].pop(key, None)
-                self._vectors[namespace].pop(key, None)
+                self._delete_item(namespace, key)
             else:
-                self._data[namespace][key] = Item(
-                    value=op.value,
-                    key=key,
-                    namespace=namespace,
-                    created_at=datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc),
+                self._put_item(
+                    Item(
+                        value=op.value,
+                        key=key,
+                        namespace=namespace,
+                        created_at=datetime.now(timezone.utc),
+                        updated_at=datetime.now(timezone.utc),
+                    )
                 )
 
     def _extract_texts(
@@ -456,22 +567,425 @@ class InMemoryStore(BaseStore):
             self._vectors[ns][key][path] = embedding
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
-        all_namespaces = list(
-            self._data.keys()
-        )  # Avoid collection size changing while iterating
-        namespaces = all_namespaces
-        if op.match_conditions:
-            namespaces = [
-                ns
-                for ns in namespaces
-                if all(_does_match(condition, ns) for condition in op.match_conditions)
-            ]
+        conditions = list(op.match_conditions or ())
+        # The first prefix condition narrows the walk to the matching subtrees,
+        # any other condition is checked against each namespace found there.
+        prefix = next((c for c in conditions if c.match_type == "prefix"), None)
+        if prefix is not None:
+            conditions.remove(prefix)
+        namespaces = self._namespace_index().list(
+            prefix.path if prefix is not None else (),
+            conditions,
+            max_depth=op.max_depth,
+            offset=op.offset,
+        )
+        return list(islice(namespaces, op.limit))
+
+
+_Ref = tuple[tuple[str, ...], str]
+_RANGE_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
 
-        if op.max_depth is not None:
-            namespaces = sorted({ns[: op.max_depth] for ns in namespaces})
+
+class _FieldIndex:
+    """Inverted indexes over top-level value fields, used to plan filtered searches.
+
+    Each field has a hash index over scalar values for equality and `$in`, and a
+    sorted index over values coercible to float for range operators. Lookups only
+    narrow the candidates: every candidate is still checked with `_compare_values`.
+    """
+
+    __slots__ = (
+        "fields",
+        "_hash",
+        "_numbers",
+        "_sorted",
+        "_seq",
+        "_next",
+    )
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        self.fields = tuple(fields)
+        self._hash: dict[str, defaultdict[Any, set[_Ref]]] = {
+            f: defaultdict(set) for f in self.fields
+        }
+        self._numbers: dict[str, defaultdict[float, set[_Ref]]] = {
+            f: defaultdict(set) for f in self.fields
+        }
+        # Sorted keys of _numbers[field]
+        self._sorted: dict[str, list[float]] = {f: [] for f in self.fields}
+        # Insertion order of each item, mirroring the order of _data[namespace]
+        self._seq: dict[_Ref, int] = {}
+        self._next = 0
+
+    @classmethod
+    def from_data(
+        cls, fields: Iterable[str], data: dict[tuple[str, ...], dict[str, Item]]
+    ) -> _FieldIndex:
+        index = cls(fields)
+        for items in list(data.values()):
+            for item in items.values():
+                index.add(item)
+        return index
+
+    def add(self, item: Item) -> None:
+        ref = (item.namespace, item.key)
+        if ref not in self._seq:
+            self._seq[ref] = self._next
+            self._next += 1
+        for field in self.fields:
+            value = item.value.get(field)
+            if value is None:
+                continue
+            if _is_scalar(value):
+                self._hash[field][value].add(ref)
+            if (number := _as_number(value)) is None:
+                continue
+            refs = self._numbers[field][number]
+            if not refs:
+                bisect.insort(self._sorted[field], number)
+            refs.add(ref)
+
+    def remove(self, item: Item, *, forget: bool = False) -> None:
+        ref = (item.namespace, item.key)
+        if forget:
+            self._seq.pop(ref, None)
+        for field in self.fields:
+            value = item.value.get(field)
+            if value is None:
+                continue
+            if _is_scalar(value):
+                _discard(self._hash[field], value, ref)
+            number = _as_number(value)
+            if number is not None and _discard(self._numbers[field], number, ref):
+                keys = self._sorted[field]
+                del keys[bisect.bisect_left(keys, number)]
+
+    def lookup(self, filter: dict[str, Any]) -> set[_Ref] | None:
+        """Return the candidate items for a filter, or None if no index applies."""
+        result: set[_Ref] | None = None
+        # Intersect the smallest sets first
+        for refs in sorted(
+            (
+                refs
+                for field, condition in filter.items()
+                if field in self._hash
+                for refs in self._lookup_field(field, condition)
+            ),
+            key=len,
+        ):
+            result = set(refs) if result is None else result & refs
+            if not result:
+                break
+        return result
+
+    def ordered(self, refs: Iterable[_Ref]) -> list[_Ref]:
+        """Sort items by namespace, then by insertion order within the namespace."""
+        return sorted(refs, key=lambda ref: (ref[0], self._seq[ref]))
+
+    def _lookup_field(self, field: str, condition: Any) -> Iterator[set[_Ref]]:
+        if not isinstance(condition, dict):
+            if _is_scalar(condition) and condition is not None:
+                yield self._hash[field].get(condition, set())
+            return
+        if not any(k.startswith("$") for k in condition):
+            return
+        for operator, operand in condition.items():
+            if operator == "$eq" and _is_scalar(operand) and operand is not None:
+                yield self._hash[field].get(operand, set())
+            elif operator == "$in" and all(
+                _is_scalar(v) and v is not None for v in operand
+            ):
+                yield set().union(*(self._hash[field].get(v, ()) for v in operand))
+            elif operator in _RANGE_OPERATORS and (
+                (bound := _as_number(operand)) is not None
+            ):
+                yield self._range(field, operator, bound)
+
+    def _range(self, field: str, operator: str, bound: float) -> set[_Ref]:
+        keys = self._sorted[field]
+        if operator == "$gt":
+            selected = keys[bisect.bisect_right(keys, bound) :]
+        elif operator == "$gte":
+            selected = keys[bisect.bisect_left(keys, bound) :]
+        elif operator == "$lt":
+            selected = keys[: bisect.bisect_left(keys, bound)]
         else:
-            namespaces = sorted(namespaces)
-        return namespaces[op.offset : op.offset + op.limit]
+            selected = keys[: bisect.bisect_right(keys, bound)]
+        numbers = self._numbers[field]
+        return set().union(*(numbers[k] for k in selected))
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _as_number(value: Any) -> float | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    # NaN has no place in a sorted index
+    return number if number == number else None
+
+
+def _discard(index: dict[Any, set[_Ref]], value: Any, ref: _Ref) -> bool:
+    """Remove ref from index[value], returning True if no refs are left."""
+    refs = index.get(value)
+    if refs is None:
+        return False
+    refs.discard(ref)
+    if refs:
+        return False
+    del index[value]
+    return True
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal", "namespaces", "items", "_order")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # Whether the path to this node is itself a namespace in the store
+        self.terminal = False
+        # Number of namespaces and items at or below this node
+        self.namespaces = 0
+        self.items = 0
+        self._order: list[str] | None = None
+
+    def sorted_children(self) -> Iterator[tuple[str, _TrieNode]]:
+        if self._order is None:
+            self._order = sorted(self.children)
+        for label in self._order:
+            yield label, self.children[label]
+
+
+class _NamespaceDict(defaultdict):
+    """The namespaces of an InMemoryStore, counting the changes to its keys.
+
+    Lets the store notice namespaces that were added, removed or replaced without
+    going through its API, and rebuild its indexes.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Any:
+        self.version += 1
+        return super().popitem()
+
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().update(*args, **kwargs)
+
+
+class _NamespaceTrie:
+    """Prefix tree over store namespaces with per-node namespace and item counts.
+
+    Walks visit namespaces in sorted order, so lookups, pagination and listing are
+    proportional to the matching subtree rather than to the whole store.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    @classmethod
+    def from_data(cls, data: dict[tuple[str, ...], dict[str, Item]]) -> _NamespaceTrie:
+        trie = cls()
+        for namespace, items in list(data.items()):
+            trie.add_namespace(namespace)
+            trie.add_items(namespace, len(items))
+        return trie
+
+    def _path(self, namespace: tuple[str, ...]) -> list[_TrieNode]:
+        nodes = [self.root]
+        for label in namespace:
+            node = nodes[-1]
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = _TrieNode()
+                node._order = None
+            nodes.append(child)
+        return nodes
+
+    def add_namespace(self, namespace: tuple[str, ...]) -> None:
+        nodes = self._path(namespace)
+        if not nodes[-1].terminal:
+            nodes[-1].terminal = True
+            for node in nodes:
+                node.namespaces += 1
+
+    def add_items(self, namespace: tuple[str, ...], delta: int) -> None:
+        for node in self._path(namespace):
+            node.items += delta
+
+    def find(self, prefix: tuple[str, ...]) -> _TrieNode | None:
+        node: _TrieNode | None = self.root
+        for label in prefix:
+            node = node.children.get(label)
+            if node is None:
+                return None
+        return node
+
+    def walk(
+        self, prefix: tuple[str, ...]
+    ) -> Iterator[tuple[tuple[str, ...], _TrieNode]]:
+        """Yield every namespace starting with `prefix` along with its node."""
+        if (node := self.find(prefix)) is not None:
+            yield from _walk(node, prefix)
+
+    def seek(
+        self, prefix: tuple[str, ...], offset: int
+    ) -> Iterator[tuple[tuple[str, ...], int]]:
+        """Yield namespaces under `prefix` from the `offset`-th item on.
+
+        Each namespace is paired with the number of its own items to skip.
+        """
+        stack: list[tuple[tuple[str, ...], _TrieNode]] = []
+        if (node := self.find(prefix)) is not None:
+            stack.append((prefix, node))
+        while stack:
+            path, node = stack.pop()
+            if node.items <= offset:
+                offset -= node.items
+                continue
+            own = node.items - sum(c.items for c in node.children.values())
+            if node.terminal and own:
+                if own > offset:
+                    yield path, offset
+                    offset = 0
+                else:
+                    offset -= own
+            stack.extend(
+                (path + (label,), child)
+                for label, child in reversed(list(node.sorted_children()))
+            )
+
+    def match(
+        self, pattern: tuple[str, ...]
+    ) -> Iterator[tuple[tuple[str, ...], _TrieNode]]:
+        """Yield the nodes whose paths match a prefix pattern with `*` wildcards."""
+        frontier = [((), self.root)]
+        for label in pattern:
+            if label == "*":
+                frontier = [
+                    (path + (child_label,), child)
+                    for path, node in frontier
+                    for child_label, child in node.sorted_children()
+                ]
+            else:
+                frontier = [
+                    (path + (label,), node.children[label])
+                    for path, node in frontier
+                    if label in node.children
+                ]
+        return iter(frontier)
+
+    def list(
+        self,
+        pattern: tuple[str, ...],
+        conditions: list[MatchCondition],
+        *,
+        max_depth: int | None = None,
+        offset: int = 0,
+    ) -> Iterator[tuple[str, ...]]:
+        """Yield sorted, de-duplicated namespaces for a list_namespaces request."""
+        if not conditions and max_depth is None:
+            # Fast path: skip whole subtrees before the offset using the counts
+            for path, node in self.match(pattern):
+                if node.namespaces <= offset:
+                    offset -= node.namespaces
+                    continue
+                for namespace, _ in _walk(node, path):
+                    if offset:
+                        offset -= 1
+                        continue
+                    yield namespace
+            return
+
+        def candidates() -> Iterator[tuple[str, ...]]:
+            for path, node in self.match(pattern):
+                if conditions:
+                    for namespace, _ in _walk(node, path):
+                        if all(_does_match(c, namespace) for c in conditions):
+                            yield namespace[:max_depth]
+                else:
+                    yield from _walk_truncated(node, path, max_depth)
+
+        # Candidates arrive sorted, so truncated duplicates are adjacent
+        previous = None
+        for namespace in candidates():
+            if namespace == previous:
+                continue
+            previous = namespace
+            if offset:
+                offset -= 1
+                continue
+            yield namespace
+
+
+def _walk(
+    node: _TrieNode, path: tuple[str, ...]
+) -> Iterator[tuple[tuple[str, ...], _TrieNode]]:
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        if not node.namespaces:
+            continue
+        if node.terminal:
+            yield path, node
+        stack.extend(
+            (path + (label,), child)
+            for label, child in reversed(list(node.sorted_children()))
+        )
+
+
+def _walk_truncated(
+    node: _TrieNode, path: tuple[str, ...], max_depth: int | None
+) -> Iterator[tuple[str, ...]]:
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        if not node.namespaces:
+            continue
+        if max_depth is not None and len(path) >= max_depth:
+            yield path[:max_depth]
+            continue
+        if node.terminal:
+            yield path
+        stack.extend(
+            (path + (label,), child)
+            for label, child in reversed(list(node.sorted_children()))
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> cf.ThreadPoolExecutor:
+    """Executor shared by all stores for embedding concurrent search queries."""
+    return cf.ThreadPoolExecutor(thread_name_prefix="InMemoryStore")
 
 
 @functools.lru_cache(maxsize=1)
@@ -520,6 +1034,60 @@ def _cosine_similarity(X: list[float], Y: list[list[float]]) -> list[float]:
     return similarities
 
 
+def _rank_candidates(
+    queries: list[list[float]],
+    vectors: list[list[float]],
+    owners: list[int],
+    k: int,
+) -> list[list[tuple[float, int]]]:
+    """Rank candidates by cosine similarity to each query.
+
+    `owners[j]` is the (non-decreasing) candidate index that `vectors[j]` belongs to.
+    A candidate's score is the best score among its vectors. Returns, for every query,
+    the top `k` candidates as `(score, candidate index)` in descending score order.
+    """
+    if not vectors:
+        return [[] for _ in queries]
+    if _check_numpy():
+        import numpy as np
+
+        Q = np.asarray(queries, dtype=float)
+        Y = np.asarray(vectors, dtype=float)
+        Q_norm = np.linalg.norm(Q, axis=1)
+        Y_norm = np.linalg.norm(Y, axis=1)
+        norms = np.outer(Q_norm, Y_norm)
+        # Avoid division by zero
+        mask = norms != 0
+        similarities = np.zeros_like(norms)
+        np.divide(Q @ Y.T, norms, out=similarities, where=mask)
+
+        candidate_ids, starts = np.unique(np.asarray(owners), return_index=True)
+        pooled = np.maximum.reduceat(similarities, starts, axis=1)
+        rankings = []
+        for row in pooled:
+            if k < len(row):
+                top = np.argpartition(-row, k - 1)[:k]
+            else:
+                top = np.arange(len(row))
+            # Highest score first, earliest candidate first on ties
+            top = top[np.lexsort((top, -row[top]))]
+            rankings.append(
+                [(float(row[j]), int(candidate_ids[j])) for j in top.tolist()]
+            )
+        return rankings
+
+    rankings = []
+    for query in queries:
+        best: dict[int, float] = {}
+        for owner, score in zip(owners, _cosine_similarity(query, vectors)):
+            if owner not in best or score > best[owner]:
+                best[owner] = score
+        rankings.append(
+            sorted(((s, ix) for ix, s in best.items()), key=lambda x: (-x[0], x[1]))[:k]
+        )
+    return rankings
+
+
 def _does_match(match_condition: MatchCondition, key: tuple[str, ...]) -> bool:
     """Whether a namespace key matches a match condition."""
     match_type = match_condition.match_type
@@ -573,6 +1141,9 @@ def _apply_operator(value: Any, operator: str, op_value: Any) -> bool:
     """Apply a comparison operator, matching PostgreSQL's JSONB behavior."""
     if operator == "$eq":
         return value == op_value
+    elif operator in _RANGE_OPERATORS and _as_number(value) is None:
+        # like NULL in PostgreSQL, missing and non-numeric values never match
+        return False
     elif operator == "$gt":
         return float(value) > float(op_value)
     elif operator == "$gte":
@@ -583,5 +1154,7 @@ def _apply_operator(value: Any, operator: str, op_value: Any) -> bool:
         return float(value) <= float(op_value)
     elif operator == "$ne":
         return value != op_value
+    elif operator == "$in":
+        return value in op_value
     else:
         raise ValueError(f"Unsupported operator: {operator}")
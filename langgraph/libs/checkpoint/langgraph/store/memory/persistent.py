@@ -0,0 +1,419 @@
+"""In-memory store backed by an append-only operation log and compacted snapshots.
+
+!!! example "Examples"
+    ```python
+    from langgraph.store.memory.persistent import PersistentInMemoryStore
+
+    with PersistentInMemoryStore("./memories") as store:
+        store.put(("users", "123"), "prefs", {"theme": "dark"})
+
+    # Later, in a new process
+    with PersistentInMemoryStore("./memories") as store:
+        item = store.get(("users", "123"), "prefs")
+    ```
+
+The store keeps the exact same in-memory layout as
+[InMemoryStore][langgraph.store.memory.InMemoryStore], so reads and searches
+run at the same speed. Every applied write is additionally appended to
+`store.log` in the target directory. Once the log grows past `snapshot_every`
+records, the full state is compacted into `store.snapshot` (msgpack-encoded
+items) plus a `store.vectors.<generation>` file holding the embeddings as
+contiguous float32 rows, which is memory-mapped on load when numpy is available.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import Any, BinaryIO, Literal
+
+import ormsgpack
+
+from langgraph.store.base import IndexConfig, Item, PutOp
+from langgraph.store.memory import InMemoryStore, _check_numpy
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["always", "interval", "never"]
+
+SNAPSHOT_FILENAME = "store.snapshot"
+LOG_FILENAME = "store.log"
+VECTORS_PREFIX = "store.vectors."
+
+# Each log record is framed as <payload length><crc32 of payload><payload>
+_RECORD_HEADER = struct.Struct("<II")
+_SNAPSHOT_VERSION = 1
+
+
+class PersistentInMemoryStore(InMemoryStore):
+    """In-memory store that survives restarts via an append-only log and snapshots.
+
+    Args:
+        path: Directory holding the log and snapshot files. Created if missing.
+        index: Optional vector search configuration, as for `InMemoryStore`.
+            The same configuration (in particular `dims`) must be passed when
+            re-opening a directory that contains embeddings.
+        indexed_fields: Top-level value fields to index for filtered search,
+            as for `InMemoryStore`.
+        fsync: When to `fsync` the log after a batch of writes.
+            `"always"` syncs after every batch that modified the store,
+            `"interval"` syncs at most once every `fsync_interval` seconds,
+            and `"never"` leaves flushing to the operating system.
+        fsync_interval: Minimum number of seconds between syncs when
+            `fsync="interval"`.
+        snapshot_every: Number of log records after which the log is compacted
+            into a new snapshot. Set to `None` to only snapshot on `close()` or
+            explicit calls to `snapshot()`.
+
+    Note:
+        Writes are logged as the final state of each affected key, so
+        replaying a log on top of a snapshot that already contains some of its
+        records is idempotent. A record truncated by a crash at the tail of the
+        log is discarded on load.
+    """
+
+    __slots__ = (
+        "path",
+        "fsync",
+        "fsync_interval",
+        "snapshot_every",
+        "_lock",
+        "_log",
+        "_log_records",
+        "_last_fsync",
+        "_generation",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        index: IndexConfig | None = None,
+        indexed_fields: Sequence[str] | None = None,
+        fsync: FsyncPolicy = "always",
+        fsync_interval: float = 1.0,
+        snapshot_every: int | None = 10_000,
+    ) -> None:
+        super().__init__(index=index, indexed_fields=indexed_fields)
+        if fsync not in ("always", "interval", "never"):
+            raise ValueError(f"Unsupported fsync policy: {fsync}")
+        self.path = os.fspath(path)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self._lock = threading.RLock()
+        self._log_records = 0
+        self._last_fsync = time.monotonic()
+        self._generation = 0
+        os.makedirs(self.path, exist_ok=True)
+        self._load_snapshot()
+        self._replay_log()
+        self._log = open(os.path.join(self.path, LOG_FILENAME), "ab")
+
+    def __enter__(self) -> PersistentInMemoryStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> PersistentInMemoryStore:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def sync(self) -> None:
+        """Flush the log and fsync it to disk."""
+        with self._lock:
+            if self._log.closed:
+                return
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._last_fsync = time.monotonic()
+
+    def snapshot(self) -> None:
+        """Compact the current state into a new snapshot and truncate the log."""
+        with self._lock:
+            generation = self._generation + 1
+            vectors_name = f"{VECTORS_PREFIX}{generation}"
+            items: list[list[Any]] = []
+            vector_rows: list[list[Any]] = []
+            with _atomic_write(os.path.join(self.path, vectors_name)) as vf:
+                for namespace, entries in list(self._data.items()):
+                    ns = list(namespace)
+                    for key, item in list(entries.items()):
+                        items.append(
+                            [
+                                ns,
+                                key,
+                                item.value,
+                                item.created_at.timestamp(),
+                                item.updated_at.timestamp(),
+                            ]
+                        )
+                        for field, vector in (
+                            self._vectors.get(namespace, {}).get(key, {}).items()
+                        ):
+                            vf.write(self._pack_vector(vector))
+                            vector_rows.append([ns, key, field])
+            payload = ormsgpack.packb(
+                {
+                    "version": _SNAPSHOT_VERSION,
+                    "generation": generation,
+                    "dims": self._dims,
+                    "vectors": vectors_name,
+                    "items": items,
+                    "vector_rows": vector_rows,
+                },
+                option=ormsgpack.OPT_NON_STR_KEYS,
+            )
+            with _atomic_write(os.path.join(self.path, SNAPSHOT_FILENAME)) as sf:
+                sf.write(payload)
+            _fsync_dir(self.path)
+            # The snapshot now reflects every logged write, so the log can be
+            # dropped. If we crash before this point, replaying it is harmless.
+            self._log.truncate(0)
+            self._log.seek(0)
+            self.sync()
+            self._log_records = 0
+            self._generation = generation
+            self._remove_stale_vectors()
+
+    def close(self) -> None:
+        """Write a final snapshot and close the log file."""
+        with self._lock:
+            if self._log.closed:
+                return
+            if self._log_records:
+                self.snapshot()
+            self._log.close()
+
+    # Hooks
+
+    def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
+        super()._apply_put_ops(put_ops)
+        if not put_ops:
+            return
+        with self._lock:
+            for namespace, key in put_ops:
+                self._log.write(_frame(self._encode_record(namespace, key)))
+            self._log_records += len(put_ops)
+            if self.fsync == "always" or (
+                self.fsync == "interval"
+                and time.monotonic() - self._last_fsync >= self.fsync_interval
+            ):
+                self.sync()
+            else:
+                self._log.flush()
+            if self.snapshot_every and self._log_records >= self.snapshot_every:
+                self.snapshot()
+
+    # Helpers
+
+    @property
+    def _dims(self) -> int | None:
+        return self.index_config["dims"] if self.index_config else None
+
+    def _encode_record(self, namespace: tuple[str, ...], key: str) -> bytes:
+        item = self._data.get(namespace, {}).get(key)
+        if item is None:
+            return ormsgpack.packb(["d", list(namespace), key])
+        vectors = {
+            field: self._pack_vector(vector)
+            for field, vector in self._vectors.get(namespace, {}).get(key, {}).items()
+        }
+        return ormsgpack.packb(
+            [
+                "p",
+                list(namespace),
+                key,
+                item.value,
+                item.created_at.timestamp(),
+                item.updated_at.timestamp(),
+                vectors,
+            ],
+            option=ormsgpack.OPT_NON_STR_KEYS,
+        )
+
+    def _pack_vector(self, vector: Any) -> bytes:
+        if len(vector) != self._dims:
+            raise ValueError(
+                f"Embedding has {len(vector)} dimensions, expected {self._dims}"
+            )
+        if _check_numpy():
+            import numpy as np
+
+            return np.asarray(vector, dtype="<f4").tobytes()
+        return _to_little_endian(array("f", vector)).tobytes()
+
+    def _unpack_vector(self, data: bytes) -> Any:
+        if _check_numpy():
+            import numpy as np
+
+            return np.frombuffer(data, dtype="<f4")
+        return _to_little_endian(array("f", data)).tolist()
+
+    def _set_item(
+        self,
+        namespace: tuple[str, ...],
+        key: str,
+        value: dict[str, Any],
+        created_at: float,
+        updated_at: float,
+    ) -> None:
+        self._put_item(
+            Item(
+                value=value,
+                key=key,
+                namespace=namespace,
+                created_at=datetime.fromtimestamp(created_at, timezone.utc),
+                updated_at=datetime.fromtimestamp(updated_at, timezone.utc),
+            )
+        )
+
+    def _load_snapshot(self) -> None:
+        snapshot_path = os.path.join(self.path, SNAPSHOT_FILENAME)
+        if not os.path.exists(snapshot_path):
+            return
+        with open(snapshot_path, "rb") as f:
+            snapshot = ormsgpack.unpackb(f.read(), option=ormsgpack.OPT_NON_STR_KEYS)
+        if snapshot["version"] != _SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {snapshot['version']} in {snapshot_path}"
+            )
+        self._generation = snapshot["generation"]
+        for ns, key, value, created_at, updated_at in snapshot["items"]:
+            self._set_item(tuple(ns), key, value, created_at, updated_at)
+        if not snapshot["vector_rows"]:
+            return
+        dims = snapshot["dims"]
+        if self._dims is not None and dims != self._dims:
+            raise ValueError(
+                f"Snapshot in {self.path} has {dims}-dimensional embeddings,"
+                f" but the index is configured with {self._dims} dims"
+            )
+        for (ns, key, field), vector in zip(
+            snapshot["vector_rows"],
+            self._read_vectors(os.path.join(self.path, snapshot["vectors"]), dims),
+        ):
+            self._vectors[tuple(ns)][key][field] = vector
+
+    def _read_vectors(self, path: str, dims: int) -> Iterator[Any]:
+        if _check_numpy():
+            import numpy as np
+
+            matrix = np.memmap(path, dtype="<f4", mode="r").reshape(-1, dims)
+            yield from matrix
+            return
+        with open(path, "rb") as f:
+            flat = _to_little_endian(array("f", f.read()))
+        for start in range(0, len(flat), dims):
+            yield flat[start : start + dims].tolist()
+
+    def _replay_log(self) -> None:
+        log_path = os.path.join(self.path, LOG_FILENAME)
+        if not os.path.exists(log_path):
+            return
+        with open(log_path, "rb") as f:
+            data = f.read()
+        good = 0
+        for end, payload in _iter_records(data):
+            record = ormsgpack.unpackb(payload, option=ormsgpack.OPT_NON_STR_KEYS)
+            namespace, key = tuple(record[1]), record[2]
+            if record[0] == "d":
+                self._delete_item(namespace, key)
+            else:
+                _, _, _, value, created_at, updated_at, vectors = record
+                self._set_item(namespace, key, value, created_at, updated_at)
+                self._vectors[namespace].pop(key, None)
+                for field, vector in vectors.items():
+                    self._vectors[namespace][key][field] = self._unpack_vector(vector)
+            self._log_records += 1
+            good = end
+        if good < len(data):
+            logger.warning(
+                f"Discarding {len(data) - good} bytes of incomplete records at the end of {log_path}"
+            )
+            with open(log_path, "r+b") as f:
+                f.truncate(good)
+
+    def _remove_stale_vectors(self) -> None:
+        current = f"{VECTORS_PREFIX}{self._generation}"
+        for name in os.listdir(self.path):
+            if name.startswith(VECTORS_PREFIX) and name != current:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    # Still memory-mapped on platforms that lock mapped files;
+                    # it will be cleaned up by a later snapshot.
+                    pass
+
+
+@contextmanager
+def _atomic_write(path: str) -> Iterator[BinaryIO]:
+    """Write to `<path>.tmp`, then fsync and atomically move it to `path`."""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+def _frame(payload: bytes) -> bytes:
+    return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _iter_records(data: bytes) -> Iterable[tuple[int, bytes]]:
+    """Yield (end offset, payload) for each intact record in a log buffer."""
+    pos = 0
+    while pos + _RECORD_HEADER.size <= len(data):
+        length, crc = _RECORD_HEADER.unpack_from(data, pos)
+        start = pos + _RECORD_HEADER.size
+        payload = data[start : start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        pos = start + length
+        yield pos, payload
+
+
+def _to_little_endian(arr: array) -> array:
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        arr.byteswap()
+    return arr
+
+
+def _fsync_dir(path: str) -> None:
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+__all__ = ["PersistentInMemoryStore"]
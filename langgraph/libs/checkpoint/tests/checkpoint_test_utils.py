@@ -0,0 +1,44 @@
+"""Checkpoint utilities for testing."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    Checkpoint,
+    create_checkpoint,
+    empty_checkpoint,
+)
+
+
+def put_steps(
+    saver: BaseCheckpointSaver,
+    thread_id: str,
+    steps: int,
+    age: Optional[timedelta] = None,
+) -> list[RunnableConfig]:
+    """Put `steps` checkpoints of a thread, each with one pending write.
+
+    If `age` is given, the first checkpoint is that old and the following ones
+    are one second apart.
+    """
+    config: RunnableConfig = {
+        "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+    }
+    ts = datetime.now(timezone.utc) - age if age is not None else None
+    checkpoint: Checkpoint = empty_checkpoint()
+    configs = []
+    for step in range(steps):
+        checkpoint = create_checkpoint(checkpoint, {}, step)
+        if ts is not None:
+            checkpoint["ts"] = (ts + timedelta(seconds=step)).isoformat()
+        checkpoint["channel_values"] = {"messages": [f"{thread_id}-{step}"]}
+        checkpoint["channel_versions"] = {"messages": step + 1}
+        config = saver.put(
+            config, checkpoint, {"step": step}, checkpoint["channel_versions"]
+        )
+        saver.put_writes(config, [("messages", f"write-{step}")], task_id="task")
+        configs.append(config)
+    return configs
@@ -0,0 +1,124 @@
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from langgraph.checkpoint.base import (
+    ERROR,
+    CheckpointTuple,
+    create_checkpoint,
+    empty_checkpoint,
+)
+from langgraph.checkpoint.cached import CachedCheckpointSaver, InvalidationBus
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class CountingSaver(InMemorySaver):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        self.reads += 1
+        return super().get_tuple(config)
+
+
+def _put(
+    saver: CachedCheckpointSaver, config: RunnableConfig, step: int
+) -> RunnableConfig:
+    checkpoint = create_checkpoint(empty_checkpoint(), {}, step)
+    checkpoint["channel_values"] = {"messages": [step]}
+    checkpoint["channel_versions"] = {"messages": step + 1}
+    return saver.put(config, checkpoint, {"step": step}, checkpoint["channel_versions"])
+
+
+def test_cached_reads() -> None:
+    inner = CountingSaver()
+    saver = CachedCheckpointSaver(inner)
+    thread: RunnableConfig = {
+        "configurable": {"thread_id": "1", "checkpoint_ns": "", "user": "bob"}
+    }
+    config_1 = _put(saver, thread, 1)
+    config_2 = _put(saver, config_1, 2)
+    saver.put_writes(config_2, [("messages", 3), ("other", 4)], task_id="a")
+    saver.put_writes(config_2, [("messages", 5)], task_id="a")
+    saver.put_writes(config_2, [(ERROR, "first")], task_id="b")
+    saver.put_writes(config_2, [(ERROR, "second")], task_id="b")
+
+    cached = saver.get_tuple(thread)
+    assert inner.reads == 0
+    assert cached == inner.get_tuple(thread)
+    assert saver.get_tuple(config_2) == cached
+    inner.reads = 0
+
+    # the cached checkpoint can't be mutated by callers
+    cached.checkpoint["channel_values"]["messages"].append(6)
+    assert saver.get_tuple(thread).checkpoint["channel_values"] == {"messages": [2]}
+    # older checkpoints are read from the wrapped saver
+    assert saver.get_tuple(config_1) == inner.get_tuple(config_1)
+    assert inner.reads == 2
+
+    # misses populate the cache
+    other: RunnableConfig = {"configurable": {"thread_id": "2", "checkpoint_ns": ""}}
+    _put(CachedCheckpointSaver(inner), other, 1)
+    inner.reads = 0
+    assert saver.get_tuple(other) is not None
+    assert saver.get_tuple(other) is not None
+    assert inner.reads == 1
+
+    saver.delete_thread("1")
+    assert saver.get_tuple(thread) is None
+
+
+def test_cache_eviction() -> None:
+    inner = CountingSaver()
+    saver = CachedCheckpointSaver(inner, maxsize=2)
+    configs: list[dict[str, Any]] = [
+        {"configurable": {"thread_id": str(i), "checkpoint_ns": ""}} for i in range(3)
+    ]
+    for config in configs:
+        _put(saver, config, 1)
+    assert list(saver.cache) == [("1", ""), ("2", "")]
+    saver.get_tuple(configs[1])
+    _put(saver, configs[0], 2)
+    assert list(saver.cache) == [("1", ""), ("0", "")]
+    assert inner.reads == 0
+
+
+def test_bus_invalidation() -> None:
+    bus = InvalidationBus()
+    inner = InMemorySaver()
+    saver_1 = CachedCheckpointSaver(inner, bus=bus)
+    saver_2 = CachedCheckpointSaver(inner, bus=bus)
+    thread: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+
+    config = _put(saver_1, thread, 1)
+    assert saver_2.get_tuple(thread).config == config
+    config = _put(saver_1, config, 2)
+    assert ("1", "") in saver_1.cache
+    assert ("1", "") not in saver_2.cache
+    assert saver_2.get_tuple(thread).config == config
+
+    saver_1.put_writes(config, [("messages", 3)], task_id="a")
+    assert saver_2.get_tuple(thread).pending_writes == [("a", "messages", 3)]
+
+    saver_2.close()
+    saver_1.delete_thread("1")
+    assert saver_1.get_tuple(thread) is None
+    assert saver_2.get_tuple(thread) is not None
+
+
+async def test_async_cached_reads() -> None:
+    inner = InMemorySaver()
+    saver = CachedCheckpointSaver(inner)
+    thread: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+    config = await saver.aput(thread, checkpoint, {"step": 1}, {})
+    await saver.aput_writes(config, [("messages", 1)], task_id="a")
+
+    assert await saver.aget_tuple(thread) == await inner.aget_tuple(thread)
+    assert [c async for c in saver.alist(thread)] == [
+        c async for c in inner.alist(thread)
+    ]
+
+    await saver.adelete_thread("1")
+    assert await saver.aget_tuple(thread) is None
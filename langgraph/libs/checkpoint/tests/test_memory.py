@@ -187,6 +187,17 @@ class TestMemorySaver:
         ]
         assert len(search_results_4) == 0
 
+    async def test_list_thread_ids(self) -> None:
+        self.memory_saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+        self.memory_saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
+        self.memory_saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+        assert list(self.memory_saver.list_thread_ids()) == ["thread-1", "thread-2"]
+
+        # threads can be deleted while iterating
+        for thread_id in self.memory_saver.list_thread_ids():
+            self.memory_saver.delete_thread(thread_id)
+        assert [t async for t in self.memory_saver.alist_thread_ids()] == []
+
 
 def test_memory_saver() -> None:
     from langgraph.checkpoint.memory import InMemorySaver
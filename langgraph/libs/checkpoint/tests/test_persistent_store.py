@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from langgraph.store.memory.persistent import (
+    LOG_FILENAME,
+    SNAPSHOT_FILENAME,
+    PersistentInMemoryStore,
+)
+from tests.embed_test_utils import CharacterEmbeddings
+
+
+@pytest.fixture
+def fake_embeddings() -> CharacterEmbeddings:
+    return CharacterEmbeddings(dims=32)
+
+
+def test_reload_from_log(tmp_path: Path) -> None:
+    store = PersistentInMemoryStore(tmp_path, snapshot_every=None)
+    store.put(("users", "1"), "prefs", {"theme": "dark"})
+    store.put(("users", "2"), "prefs", {"theme": "light"})
+    store.put(("users", "1"), "prefs", {"theme": "solarized"})
+    store.delete(("users", "2"), "prefs")
+    created_at = store.get(("users", "1"), "prefs").created_at
+    # Simulate a crash: nothing is snapshotted, only the log exists
+    store._log.close()
+    assert not os.path.exists(tmp_path / SNAPSHOT_FILENAME)
+
+    reloaded = PersistentInMemoryStore(tmp_path)
+    item = reloaded.get(("users", "1"), "prefs")
+    assert item is not None
+    assert item.value == {"theme": "solarized"}
+    assert item.created_at == created_at
+    assert reloaded.get(("users", "2"), "prefs") is None
+    reloaded.close()
+
+
+def test_snapshot_compacts_log(tmp_path: Path) -> None:
+    with PersistentInMemoryStore(tmp_path, snapshot_every=3) as store:
+        for i in range(5):
+            store.put(("docs",), f"doc{i}", {"i": i})
+        # The third write triggered a snapshot, leaving two records in the log
+        assert store._log_records == 2
+    assert os.path.getsize(tmp_path / LOG_FILENAME) == 0
+
+    with PersistentInMemoryStore(tmp_path) as store:
+        assert [r.value["i"] for r in store.search(("docs",), limit=10)] == list(
+            range(5)
+        )
+
+
+def test_vectors_survive_reload(
+    tmp_path: Path, fake_embeddings: CharacterEmbeddings
+) -> None:
+    index = {"dims": fake_embeddings.dims, "embed": fake_embeddings}
+    with PersistentInMemoryStore(tmp_path, index=index, snapshot_every=2) as store:
+        store.put(("docs",), "doc1", {"text": "zany zebra Xerxes"})
+        store.put(("docs",), "doc2", {"text": "something about dogs"})
+        store.put(("docs",), "doc3", {"text": "text about birds"})
+        expected = store.search(("docs",), query="zany xerxes")
+
+    # doc1 and doc2 come from the snapshot, doc3 from the log
+    store = PersistentInMemoryStore(tmp_path, index=index)
+    results = store.search(("docs",), query="zany xerxes")
+    assert [r.key for r in results] == [r.key for r in expected]
+    assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+    store.close()
+
+    with pytest.raises(ValueError, match="dims"):
+        PersistentInMemoryStore(tmp_path, index={**index, "dims": 8})
+
+
+def test_truncated_log_tail_is_discarded(tmp_path: Path) -> None:
+    store = PersistentInMemoryStore(tmp_path, snapshot_every=None)
+    store.put(("a",), "k1", {"v": 1})
+    store.put(("a",), "k2", {"v": 2})
+    store._log.close()
+    log_path = tmp_path / LOG_FILENAME
+    size = os.path.getsize(log_path)
+    with open(log_path, "r+b") as f:
+        f.truncate(size - 3)
+
+    with PersistentInMemoryStore(tmp_path) as reloaded:
+        assert reloaded.get(("a",), "k1").value == {"v": 1}
+        assert reloaded.get(("a",), "k2") is None
+        reloaded.put(("a",), "k3", {"v": 3})
+
+    with PersistentInMemoryStore(tmp_path) as reloaded:
+        assert sorted(r.key for r in reloaded.search(("a",))) == ["k1", "k3"]
+
+
+async def test_async_roundtrip(tmp_path: Path) -> None:
+    async with PersistentInMemoryStore(tmp_path, fsync="never") as store:
+        await store.aput(("users",), "u1", {"name": "Ada"})
+
+    async with PersistentInMemoryStore(tmp_path) as store:
+        item = await store.aget(("users",), "u1")
+        assert item is not None
+        assert item.value == {"name": "Ada"}
+
+
+def test_invalid_fsync_policy(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="fsync"):
+        PersistentInMemoryStore(tmp_path, fsync="sometimes")  # type: ignore[arg-type]
@@ -0,0 +1,130 @@
+from collections import Counter
+
+import pytest
+
+from langgraph.checkpoint.base import create_checkpoint
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sharded import HashRing, ShardedCheckpointSaver
+from tests.checkpoint_test_utils import put_steps
+
+
+def _thread_ids(saver: InMemorySaver) -> set[str]:
+    return set(saver.list_thread_ids())
+
+
+def test_hash_ring() -> None:
+    keys = [f"thread-{i}" for i in range(1000)]
+    ring = HashRing(["a", "b", "c"])
+    owners = {key: ring.get(key) for key in keys}
+    assert all(count > 200 for count in Counter(owners.values()).values())
+
+    # adding a node only moves keys to the new node
+    bigger = HashRing(["a", "b", "c", "d"])
+    moved = [key for key in keys if bigger.get(key) != owners[key]]
+    assert all(bigger.get(key) == "d" for key in moved)
+    assert 150 < len(moved) < 350
+
+    with pytest.raises(ValueError):
+        HashRing([])
+
+
+def test_routing() -> None:
+    shards = {f"shard-{i}": InMemorySaver() for i in range(3)}
+    saver = ShardedCheckpointSaver(shards)
+    thread_ids = [f"thread-{i}" for i in range(12)]
+    expected = {t: list(reversed(put_steps(saver, t, 2))) for t in thread_ids}
+
+    # each thread is stored in a single shard
+    for thread_id in thread_ids:
+        holders = [s for s in shards.values() if thread_id in _thread_ids(s)]
+        assert holders == [shards[saver.ring.get(thread_id)]]
+    assert all(_thread_ids(s) for s in shards.values())
+
+    for thread_id, configs in expected.items():
+        thread_config = {"configurable": {"thread_id": thread_id}}
+        assert saver.get_tuple(thread_config).config == configs[0]
+        assert [c.config for c in saver.list(thread_config)] == configs
+        assert saver.get_tuple(configs[1]).pending_writes == [
+            ("task", "messages", "write-0")
+        ]
+    assert len(list(saver.list(None))) == 24
+    assert len(list(saver.list(None, limit=5))) == 5
+    assert len(list(saver.list(None, filter={"step": 1}))) == 12
+
+    saver.delete_thread("thread-0")
+    assert saver.get_tuple({"configurable": {"thread_id": "thread-0"}}) is None
+    assert sorted(saver.list_thread_ids()) == sorted(thread_ids[1:])
+
+
+def test_rebalance() -> None:
+    shards = {f"shard-{i}": InMemorySaver() for i in range(2)}
+    saver = ShardedCheckpointSaver(shards)
+    thread_ids = [f"thread-{i}" for i in range(20)]
+    for thread_id in thread_ids:
+        put_steps(saver, thread_id, 3)
+    expected = {
+        t: list(saver.list({"configurable": {"thread_id": t}})) for t in thread_ids
+    }
+
+    new_shards = {**shards, "shard-2": InMemorySaver()}
+    moved = saver.rebalance(new_shards)
+    assert moved == len(_thread_ids(new_shards["shard-2"])) > 0
+    for thread_id in thread_ids:
+        owner = new_shards[saver.ring.get(thread_id)]
+        assert [s for s in new_shards.values() if thread_id in _thread_ids(s)] == [
+            owner
+        ]
+        thread_config = {"configurable": {"thread_id": thread_id}}
+        assert list(saver.list(thread_config)) == expected[thread_id]
+
+    # removing a shard moves its threads to the remaining ones
+    assert saver.rebalance(shards) == moved
+    assert not _thread_ids(new_shards["shard-2"])
+    assert len(list(saver.list(None))) == 60
+
+
+def test_reads_during_rebalance() -> None:
+    old = InMemorySaver()
+    new = InMemorySaver()
+    saver = ShardedCheckpointSaver({"old": old})
+    configs = put_steps(saver, "thread-1", 2)
+
+    # simulate a rebalance that didn't move the thread yet
+    saver._switch_shards({"new": new})
+    latest = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+    assert latest.config == configs[1]
+    checkpoint = create_checkpoint(latest.checkpoint, {}, 2)
+    next_config = saver.put(configs[1], checkpoint, {"step": 2}, {})
+    latest = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+    assert latest.config == next_config
+    assert [c.config for c in saver.list(None)] == [next_config, *reversed(configs)]
+    assert [c.config for c in new.list(None)] == [next_config]
+    # the thread is stored in both shards, but listed once
+    assert list(saver.list_thread_ids()) == ["thread-1"]
+
+
+async def test_async_sharded() -> None:
+    shards = {f"shard-{i}": InMemorySaver() for i in range(2)}
+    saver = ShardedCheckpointSaver(shards)
+    for i in range(6):
+        put_steps(saver, f"thread-{i}", 1)
+    expected = list(saver.list(None))
+
+    results = [c async for c in saver.alist(None)]
+    assert sorted(c.config["configurable"]["checkpoint_id"] for c in results) == sorted(
+        c.config["configurable"]["checkpoint_id"] for c in expected
+    )
+    assert len([c async for c in saver.alist(None, limit=4)]) == 4
+    thread_config = {"configurable": {"thread_id": "thread-1"}}
+    assert await saver.aget_tuple(thread_config) == saver.get_tuple(thread_config)
+
+    new_shards = {**shards, "shard-2": InMemorySaver()}
+    moved = await saver.arebalance(new_shards)
+    assert moved == len(_thread_ids(new_shards["shard-2"]))
+    assert await saver.aget_tuple(thread_config) == saver.get_tuple(thread_config)
+
+    await saver.adelete_thread("thread-1")
+    assert await saver.aget_tuple(thread_config) is None
+    assert sorted([t async for t in saver.alist_thread_ids()]) == [
+        f"thread-{i}" for i in range(6) if i != 1
+    ]
@@ -1,6 +1,9 @@
 # mypy: disable-error-code="operator"
 import asyncio
+import concurrent.futures
 import json
+import random
+import time
 from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
@@ -9,12 +12,15 @@ import pytest
 from pytest_mock import MockerFixture
 
 from langgraph.store.base import (
+    CachedEmbeddings,
     GetOp,
     InvalidNamespaceError,
     Item,
     Op,
     PutOp,
     Result,
+    SearchOp,
+    ensure_embeddings,
     get_text_at_path,
 )
 from langgraph.store.base.batch import AsyncBatchedBaseStore
@@ -427,6 +433,184 @@ def test_list_namespaces_empty_store() -> None:
     assert result == []
 
 
+def test_list_namespaces_matches_full_scan() -> None:
+    store = InMemoryStore()
+    rng = random.Random(0)
+    labels = ["a", "b", "c", "users", "*x"]
+    namespaces = {
+        tuple(rng.choice(labels) for _ in range(rng.randint(1, 4))) for _ in range(200)
+    }
+    for i, ns in enumerate(namespaces):
+        for j in range(rng.randint(1, 3)):
+            store.put(ns, f"id_{i}_{j}", {"i": i})
+
+    def expected(
+        prefix: tuple[str, ...] | None,
+        suffix: tuple[str, ...] | None,
+        max_depth: int | None,
+    ) -> list[tuple[str, ...]]:
+        matches = [
+            ns
+            for ns in namespaces
+            if (
+                prefix is None
+                or len(ns) >= len(prefix)
+                and all(p in ("*", n) for p, n in zip(prefix, ns))
+            )
+            and (
+                suffix is None
+                or len(ns) >= len(suffix)
+                and all(p in ("*", n) for p, n in zip(reversed(suffix), reversed(ns)))
+            )
+        ]
+        return sorted({ns[:max_depth] for ns in matches})
+
+    for prefix in (None, ("a",), ("a", "*"), ("*", "b", "c"), ("users", "a", "b")):
+        for suffix in (None, ("c",), ("*", "a")):
+            for max_depth in (None, 1, 2, 3):
+                full = expected(prefix, suffix, max_depth)
+                for offset, limit in ((0, 1000), (3, 5), (len(full) - 1, 10)):
+                    assert (
+                        store.list_namespaces(
+                            prefix=prefix,
+                            suffix=suffix,
+                            max_depth=max_depth,
+                            offset=max(offset, 0),
+                            limit=limit,
+                        )
+                        == full[max(offset, 0) : max(offset, 0) + limit]
+                    )
+
+
+def test_search_pagination_by_prefix() -> None:
+    store = InMemoryStore()
+    for user in ("u2", "u1", "u3"):
+        for thread in ("t2", "t1"):
+            for i in range(3):
+                store.put(("users", user, thread), f"m{i}", {"i": i})
+    store.put(("other",), "m0", {"i": 0})
+    store.delete(("users", "u1", "t1"), "m1")
+
+    everything = [(r.namespace, r.key) for r in store.search(("users",), limit=100)]
+    assert len(everything) == 17
+    assert [ns for ns, _ in everything] == sorted(ns for ns, _ in everything)
+    for offset in range(len(everything) + 1):
+        page = store.search(("users",), offset=offset, limit=4)
+        assert [(r.namespace, r.key) for r in page] == everything[offset : offset + 4]
+
+    assert [r.key for r in store.search(("users", "u1", "t1"))] == ["m0", "m2"]
+    assert store.search(("missing",)) == []
+
+
+def test_namespace_index_rebuilt_after_direct_writes() -> None:
+    store = InMemoryStore()
+    store.put(("a",), "k", {"v": 1})
+    store._data[("b", "c")]["k"] = Item(
+        value={"v": 2},
+        key="k",
+        namespace=("b", "c"),
+        created_at=datetime(2024, 9, 24, 17, 29, 10),
+        updated_at=datetime(2024, 9, 24, 17, 29, 10),
+    )
+    assert store.list_namespaces() == [("a",), ("b", "c")]
+    assert [r.value for r in store.search(("b",))] == [{"v": 2}]
+
+    # the number of namespaces doesn't change, the namespaces do
+    del store._data[("a",)]
+    store._data[("d",)]["k"] = Item(
+        value={"v": 3},
+        key="k",
+        namespace=("d",),
+        created_at=datetime(2024, 9, 24, 17, 29, 10),
+        updated_at=datetime(2024, 9, 24, 17, 29, 10),
+    )
+    assert store.list_namespaces() == [("b", "c"), ("d",)]
+    assert [r.value for r in store.search(())] == [{"v": 2}, {"v": 3}]
+
+
+def test_search_orders_by_namespace() -> None:
+    store = InMemoryStore()
+    store.put(("b",), "k1", {"v": 1})
+    store.put(("a", "y"), "k2", {"v": 2})
+    store.put(("a", "x"), "k3", {"v": 3})
+    store.put(("b",), "k0", {"v": 4})
+    # namespaces in sorted order, items in insertion order within a namespace
+    expected = ["k3", "k2", "k1", "k0"]
+    assert [r.key for r in store.search(())] == expected
+    assert [r.key for r in store.search((), filter={"v": {"$gt": 0}})] == expected
+    assert [r.key for r in store.search((), offset=1, limit=2)] == expected[1:3]
+
+
+def test_indexed_fields_match_full_scan() -> None:
+    rng = random.Random(0)
+    plain = InMemoryStore()
+    indexed = InMemoryStore(indexed_fields=["status", "score", "tags"])
+    statuses = ["open", "closed", "blocked", None]
+    for i in range(300):
+        value: dict[str, Any] = {"i": i, "tags": ["x"] if i % 7 else "x"}
+        if (status := rng.choice(statuses)) is not None:
+            value["status"] = status
+        score = rng.choice(
+            [rng.randint(0, 10), float(rng.randint(0, 10)), "5", "high", None, ...]
+        )
+        if score is not ...:
+            value["score"] = score
+        ns = ("tasks", rng.choice(["a", "b"]), rng.choice(["1", "2"]))
+        for store in (plain, indexed):
+            store.put(ns, f"k{i % 120}", value)
+            if i % 11 == 0:
+                store.delete(ns, f"k{(i + 1) % 120}")
+
+    filters: list[dict[str, Any]] = [
+        {"status": "open"},
+        {"status": {"$eq": "blocked"}},
+        {"status": {"$in": ["open", "closed"]}},
+        {"score": {"$gte": 5}},
+        {"score": {"$gt": 2, "$lte": 7}},
+        {"score": {"$lt": 3}, "status": "closed"},
+        {"score": 5},
+        {"status": {"$ne": "open"}, "score": {"$gt": 8}},
+        {"status": "open", "i": {"$gt": 100}},
+        {"tags": "x"},
+        {"tags": ["x"]},
+        {"status": "missing"},
+        # non-numeric, None and missing values never match range operators
+        {"status": {"$gt": 1}},
+        {"score": {"$lt": "7"}},
+        {"score": {"$gt": 2}, "status": "open"},
+    ]
+    for filter in filters:
+        for prefix in (("tasks",), ("tasks", "a"), ("tasks", "b", "2")):
+            expected = plain.search(prefix, filter=filter, limit=1000)
+            assert [(r.namespace, r.key, r.value) for r in expected] == [
+                (r.namespace, r.key, r.value)
+                for r in indexed.search(prefix, filter=filter, limit=1000)
+            ]
+            assert [r.key for r in expected[5:15]] == [
+                r.key for r in indexed.search(prefix, filter=filter, offset=5, limit=10)
+            ]
+
+
+def test_indexed_fields_with_vector_search(
+    fake_embeddings: CharacterEmbeddings,
+) -> None:
+    index = {"dims": fake_embeddings.dims, "embed": fake_embeddings}
+    plain = InMemoryStore(index=index)
+    indexed = InMemoryStore(index=index, indexed_fields=["color"])
+    for store in (plain, indexed):
+        store.put(("docs",), "a", {"text": "red apple", "color": "red"})
+        store.put(("docs",), "b", {"text": "red car", "color": "red"})
+        store.put(("docs",), "c", {"text": "blue sky", "color": "blue"})
+        store.put(("docs",), "b", {"text": "blue car", "color": "blue"})
+
+    results = indexed.search(("docs",), query="car", filter={"color": "blue"})
+    assert {r.key for r in results} == {"b", "c"}
+    assert [(r.key, r.score) for r in results] == [
+        (r.key, r.score)
+        for r in plain.search(("docs",), query="car", filter={"color": "blue"})
+    ]
+
+
 async def test_cannot_put_empty_namespace() -> None:
     store = InMemoryStore()
     doc = {"foo": "bar"}
@@ -917,6 +1101,55 @@ async def test_async_vector_search_pagination(
     assert len(all_results) == 5
 
 
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_batched_vector_search_matches_single(
+    fake_embeddings: CharacterEmbeddings, mocker: MockerFixture, use_numpy: bool
+) -> None:
+    mocker.patch("langgraph.store.memory._check_numpy", return_value=use_numpy)
+    store = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "fields": ["title", "chunks[*]"],
+        }
+    )
+    words = ["apple", "banana", "cherry", "dates", "elder", "figs", "grape"]
+    rng = random.Random(1)
+    for i in range(40):
+        store.put(
+            ("docs", str(i % 3)),
+            f"doc{i}",
+            {
+                "title": f"{' '.join(rng.sample(words, 2))} {i}",
+                "chunks": [
+                    f"{' '.join(rng.sample(words, 3))} {i}-{j}" for j in range(i % 4)
+                ],
+                "parity": i % 2,
+            },
+        )
+    store.put(("docs", "0"), "plain", {"text": "no indexed fields"})
+
+    ops = [
+        SearchOp(("docs",), query=query, limit=limit, offset=offset, filter=filter)
+        for query in ("apple pie", "grape figs", "banana")
+        for offset, limit in ((0, 5), (3, 10), (38, 10))
+        for filter in (None, {"parity": 1})
+    ]
+    batched = store.batch(ops)
+    for op, results in zip(ops, batched):
+        single = store.search(
+            op.namespace_prefix,
+            query=op.query,
+            filter=op.filter,
+            limit=op.limit,
+            offset=op.offset,
+        )
+        assert [r.key for r in results] == [r.key for r in single]
+        assert [r.score for r in results] == pytest.approx([r.score for r in single])
+        scores = [r.score for r in results if r.score is not None]
+        assert scores == sorted(scores, reverse=True)
+
+
 async def test_embed_with_path(fake_embeddings: CharacterEmbeddings) -> None:
     # Test store-level field configuration
     store = InMemoryStore(
@@ -1021,3 +1254,106 @@ async def test_embed_with_path(fake_embeddings: CharacterEmbeddings) -> None:
     assert len(results) == 3
     doc5_result = next(r for r in results if r.key == "doc5")
     assert doc5_result.score is None
+
+
+class CountingEmbeddings(CharacterEmbeddings):
+    def __init__(self, dims: int = 50, delay: float = 0) -> None:
+        super().__init__(dims=dims)
+        self.delay = delay
+        self.documents: list[str] = []
+        self.queries: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.documents.extend(texts)
+        time.sleep(self.delay)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        self.queries.append(text)
+        time.sleep(self.delay)
+        return super().embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.documents.extend(texts)
+        await asyncio.sleep(self.delay)
+        return super().embed_documents(texts)
+
+
+def test_cached_embeddings(tmp_path: Any) -> None:
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, max_size=2, path=str(tmp_path / "cache.db"))
+
+    first = cached.embed_documents(["a", "b", "a"])
+    assert first[0] == first[2]
+    assert inner.documents == ["a", "b"]
+    assert cached.embed_documents(["b", "a"]) == [first[1], first[0]]
+    assert inner.documents == ["a", "b"]
+    # Queries are cached separately from documents
+    assert cached.embed_query("a") == first[0]
+    assert cached.embed_query("a") == first[0]
+    assert inner.queries == ["a"]
+
+    # Evicted from memory ("a" and "b" documents), but persisted to disk
+    cached.embed_documents(["c", "d"])
+    assert inner.documents == ["a", "b", "c", "d"]
+    reopened = CachedEmbeddings(inner, path=str(tmp_path / "cache.db"))
+    assert reopened.embed_documents(["a", "b"]) == first[:2]
+    assert inner.documents == ["a", "b", "c", "d"]
+
+
+def test_cached_embeddings_coalesce_threads() -> None:
+    inner = CountingEmbeddings(delay=0.2)
+    cached = CachedEmbeddings(inner)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(lambda _: cached.embed_documents(["same text"]), range(4))
+        )
+    assert inner.documents == ["same text"]
+    assert all(r == results[0] for r in results)
+
+
+async def test_cached_embeddings_coalesce_tasks() -> None:
+    inner = CountingEmbeddings(delay=0.05)
+    cached = CachedEmbeddings(inner)
+    results = await asyncio.gather(
+        cached.aembed_documents(["x", "y"]),
+        cached.aembed_documents(["y", "z"]),
+        cached.aembed_documents(["x"]),
+    )
+    assert sorted(inner.documents) == ["x", "y", "z"]
+    assert results[0][1] == results[1][0]
+    assert results[2][0] == results[0][0]
+
+
+async def test_cached_embeddings_propagate_errors() -> None:
+    calls = 0
+
+    async def fail(texts: list[str]) -> list[list[float]]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    cached = CachedEmbeddings(ensure_embeddings(fail))
+    results = await asyncio.gather(
+        cached.aembed_documents(["a"]),
+        cached.aembed_documents(["a"]),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await cached.aembed_documents(["a"])
+    assert calls == 2
+
+
+def test_store_with_embeddings_cache() -> None:
+    inner = CountingEmbeddings()
+    store = InMemoryStore(index={"dims": inner.dims, "embed": inner, "cache": {}})
+    assert isinstance(store.embeddings, CachedEmbeddings)
+    store.put(("docs",), "doc1", {"text": "hello"})
+    store.put(("docs",), "doc1", {"text": "hello"})
+    store.search(("docs",), query="hi")
+    store.search(("docs",), query="hi")
+    assert inner.documents == ['{"text": "hello"}']
+    assert inner.queries == ["hi"]
@@ -0,0 +1,127 @@
+from datetime import timedelta
+from pathlib import Path
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.tiered import TieredCheckpointSaver
+from tests.checkpoint_test_utils import put_steps
+
+
+def test_archive_and_read_through(tmp_path: Path) -> None:
+    hot = InMemorySaver()
+    saver = TieredCheckpointSaver(hot, tmp_path)
+    old_configs = put_steps(saver, "old", 3, timedelta(days=2))
+    put_steps(saver, "new", 2, timedelta(minutes=5))
+    expected = list(saver.list({"configurable": {"thread_id": "old"}}))
+
+    assert saver.archive() == 1
+    assert hot.get_tuple({"configurable": {"thread_id": "old"}}) is None
+    assert hot.get_tuple({"configurable": {"thread_id": "new"}}) is not None
+
+    # archived checkpoints are served from the cold tier
+    assert saver.get_tuple(old_configs[1]) == expected[1]
+    assert list(saver.list({"configurable": {"thread_id": "old"}})) == expected
+    assert list(
+        saver.list(
+            {"configurable": {"thread_id": "old"}},
+            filter={"step": 0},
+        )
+    ) == [expected[2]]
+    assert list(saver.list(None, before=old_configs[2], limit=1)) == [expected[1]]
+    assert len(list(saver.list(None))) == 5
+
+    # reading the latest checkpoint restores it to the hot tier
+    latest = saver.get_tuple({"configurable": {"thread_id": "old"}})
+    assert latest == expected[0]
+    restored = hot.get_tuple({"configurable": {"thread_id": "old"}})
+    assert restored.checkpoint == latest.checkpoint
+    assert restored.pending_writes == latest.pending_writes
+    # listing doesn't return the restored checkpoint twice
+    assert list(saver.list({"configurable": {"thread_id": "old"}})) == [
+        restored,
+        *expected[1:],
+    ]
+
+    saver.delete_thread("old")
+    assert saver.get_tuple({"configurable": {"thread_id": "old"}}) is None
+    assert list(saver.list({"configurable": {"thread_id": "old"}})) == []
+
+
+def test_archive_survives_restart(tmp_path: Path) -> None:
+    saver = TieredCheckpointSaver(InMemorySaver(), tmp_path, segment_size=256)
+    put_steps(saver, "thread-1", 2, timedelta(days=2))
+    assert saver.archive(["thread-1"]) == 1
+    expected = list(saver.cold.search(None))
+
+    saver = TieredCheckpointSaver(InMemorySaver(), tmp_path, segment_size=256)
+    put_steps(saver, "thread-2", 2, timedelta(days=2))
+    assert saver.archive(["thread-2"]) == 1
+    # the full segment isn't appended to after the restart
+    assert len(list((tmp_path / "segments").glob("*.seg"))) == 2
+    assert list(saver.list({"configurable": {"thread_id": "thread-1"}})) == expected
+    assert len(list(saver.list(None))) == 4
+
+
+async def test_async_archive(tmp_path: Path) -> None:
+    saver = TieredCheckpointSaver(InMemorySaver(), tmp_path)
+    configs = put_steps(saver, "thread-1", 2, timedelta(days=2))
+    expected = [c async for c in saver.alist(None)]
+
+    assert await saver.aarchive() == 1
+    assert await saver.aget_tuple(configs[0]) == expected[1]
+    assert [c async for c in saver.alist(None)] == expected
+    assert [c async for c in saver.alist(None, limit=1)] == expected[:1]
+
+    await saver.adelete_thread("thread-1")
+    assert [c async for c in saver.alist(None)] == []
+
+
+def _segments_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in (path / "segments").glob("*.seg"))
+
+
+def test_restored_threads_are_not_archived_again(tmp_path: Path) -> None:
+    hot = InMemorySaver()
+    saver = TieredCheckpointSaver(hot, tmp_path)
+    configs = put_steps(saver, "thread-1", 2, timedelta(days=2))
+    assert saver.archive() == 1
+    size = _segments_size(tmp_path)
+
+    # reading the thread restores its latest checkpoint, which is still idle
+    for _ in range(3):
+        assert saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+        assert saver.archive() == 1
+    assert _segments_size(tmp_path) == size
+    assert saver.compact() == 0
+
+    # a restored checkpoint with new writes is archived again, compaction
+    # removes the record it replaces
+    saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+    saver.put_writes(configs[1], [("messages", "late")], task_id="task-2")
+    expected = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+    assert saver.archive() == 1
+    grown = _segments_size(tmp_path)
+    assert grown > size
+    reclaimed = saver.compact()
+    assert reclaimed > 0
+    assert _segments_size(tmp_path) == grown - reclaimed
+    assert saver.compact() == 0
+    assert list(saver.list({"configurable": {"thread_id": "thread-1"}})) == expected
+
+
+def test_delete_thread_removes_archived_data(tmp_path: Path) -> None:
+    saver = TieredCheckpointSaver(InMemorySaver(), tmp_path, segment_size=512)
+    put_steps(saver, "thread-1", 3, timedelta(days=2))
+    put_steps(saver, "thread-2", 3, timedelta(days=2))
+    assert saver.archive() == 2
+    expected = list(saver.list({"configurable": {"thread_id": "thread-2"}}))
+    size = _segments_size(tmp_path)
+
+    saver.delete_thread("thread-1")
+    assert _segments_size(tmp_path) < size
+    assert list(saver.list(None)) == expected
+    assert saver.compact() == 0
+
+    # new segments are appended to after compaction
+    put_steps(saver, "thread-3", 1, timedelta(days=2))
+    assert saver.archive() == 1
+    assert len(list(saver.list(None))) == 4
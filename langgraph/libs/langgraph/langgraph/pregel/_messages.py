@@ -84,6 +84,21 @@ class StreamMessagesHandler(BaseCallbackHandler, _StreamingCallbackHandler):
             self.seen.add(message.id)
             self.stream((meta[0], "messages", (message, meta[1])))
 
+    def emit_node_message(self, message: BaseMessage, metadata: dict[str, Any]) -> None:
+        """Stream a message produced by a node before the node returns.
+
+        The message is streamed like the messages in the node output, which are
+        deduped against it by ID, so it is streamed once.
+
+        Args:
+            message: The message to stream. An ID is assigned if it has none.
+            metadata: The metadata of the node's config.
+        """
+        ns = tuple(cast(str, metadata["langgraph_checkpoint_ns"]).split(NS_SEP))[:-1]
+        if not self.subgraphs and len(ns) > 0:
+            return
+        self._emit((ns, metadata), message, dedupe=True)
+
     def _find_and_emit_messages(self, meta: Meta, response: Any) -> None:
         if isinstance(response, BaseMessage):
             self._emit(meta, response, dedupe=True)
@@ -1,9 +1,11 @@
 """langgraph.prebuilt exposes a higher-level API for creating and executing agents and tools."""
 
 from langgraph.prebuilt.chat_agent_executor import create_react_agent
+from langgraph.prebuilt.history import HistoryWindow
 from langgraph.prebuilt.tool_node import (
     InjectedState,
     InjectedStore,
+    ToolCachePolicy,
     ToolNode,
     tools_condition,
 )
@@ -16,4 +18,6 @@ __all__ = [
     "ValidationNode",
     "InjectedState",
     "InjectedStore",
+    "ToolCachePolicy",
+    "HistoryWindow",
 ]
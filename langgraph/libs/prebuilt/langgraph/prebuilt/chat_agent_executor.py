@@ -354,6 +354,7 @@ def create_react_agent(
 
         pre_model_hook: An optional node to add before the `agent` node (i.e., the node that calls the LLM).
             Useful for managing long message histories (e.g., message trimming, summarization, etc.).
+            See `HistoryWindow` for a hook trimming the history to a token budget.
             Pre-model hook must be a callable or a runnable that takes in current graph state and returns a state update in the form of
                 ```python
                 # At least one of `messages` or `llm_input_messages` MUST be provided
@@ -539,6 +540,8 @@ def create_react_agent(
     else:
         # For dynamic models, we'll create the runnable at runtime
         static_model = None
+        # built once, only the model changes between calls
+        prompt_runnable = _get_prompt_runnable(prompt)
 
     # If any of the tools are configured to return_directly after running,
     # our graph needs to check if these were called
@@ -549,7 +552,7 @@ def create_react_agent(
     ) -> LanguageModelLike:
         """Resolve the model to use, handling both static and dynamic models."""
         if is_dynamic_model:
-            return _get_prompt_runnable(prompt) | model(state, runtime)  # type: ignore[operator]
+            return prompt_runnable | model(state, runtime)  # type: ignore[operator]
         else:
             return static_model
 
@@ -559,9 +562,9 @@ def create_react_agent(
         """Async resolve the model to use, handling both static and dynamic models."""
         if is_async_dynamic_model:
             resolved_model = await model(state, runtime)  # type: ignore[misc,operator]
-            return _get_prompt_runnable(prompt) | resolved_model
+            return prompt_runnable | resolved_model
         elif is_dynamic_model:
-            return _get_prompt_runnable(prompt) | model(state, runtime)  # type: ignore[operator]
+            return prompt_runnable | model(state, runtime)  # type: ignore[operator]
         else:
             return static_model
 
@@ -0,0 +1,140 @@
+"""Message history management for agents built with create_react_agent."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
+
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import AnyMessage, BaseMessage, SystemMessage
+
+
+class HistoryWindow:
+    """Pre-model hook passing the most recent messages that fit a token budget to the LLM.
+
+    Like a `pre_model_hook` calling `trim_messages(strategy="last")`, but the token
+    count of each message is cached by message ID, so only new messages are passed
+    to the token counter. The window is built backwards from the last message and
+    stops once the budget is reached, so the cost of each model call depends on the
+    size of the window, not on the length of the whole conversation.
+
+    The window is never empty: if no message of the `start_on` type fits the budget,
+    it starts on the first AIMessage that fits, along with its ToolMessages. If none
+    fits either, it keeps the last turn, from the last message that isn't a
+    ToolMessage, even though that exceeds `max_tokens`.
+
+    The messages in the state are not modified: the window is returned under the
+    `llm_input_messages` key.
+
+    Args:
+        max_tokens: Maximum number of tokens of the messages passed to the LLM.
+        token_counter: Function counting the tokens of a list of messages, or a
+            language model whose `get_num_tokens_from_messages` is used.
+        include_system: Whether to always keep the first message if it is a
+            SystemMessage. Its tokens count towards `max_tokens`.
+        start_on: Message type the window must start on, e.g. "human", so that
+            it doesn't start with a ToolMessage without its AIMessage. None to
+            allow any message type.
+        maxsize: Maximum number of token counts to cache.
+
+    Example:
+        ```python
+        from langgraph.prebuilt import HistoryWindow, create_react_agent
+
+        agent = create_react_agent(
+            model,
+            tools,
+            pre_model_hook=HistoryWindow(max_tokens=4000, token_counter=model),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        token_counter: Union[Callable[[list[BaseMessage]], int], BaseLanguageModel],
+        *,
+        include_system: bool = True,
+        start_on: Optional[str] = "human",
+        maxsize: int = 10_000,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.token_counter: Callable[[list[BaseMessage]], int] = (
+            token_counter.get_num_tokens_from_messages
+            if isinstance(token_counter, BaseLanguageModel)
+            else token_counter
+        )
+        self.include_system = include_system
+        self.start_on = start_on
+        self.maxsize = maxsize
+        # message ID -> (fingerprint of the content and tool calls, token count)
+        self.counts: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def count(self, message: BaseMessage) -> int:
+        """Count the tokens of a message, reusing the count cached for its ID.
+
+        A message replaced by another with the same ID is counted again if its
+        content or tool calls changed.
+        """
+        if message.id is None:
+            return self.token_counter([message])
+        fingerprint = _fingerprint(message)
+        with self.lock:
+            cached = self.counts.get(message.id)
+            if cached is not None and cached[0] == fingerprint:
+                self.counts.move_to_end(message.id)
+                return cached[1]
+        tokens = self.token_counter([message])
+        with self.lock:
+            self.counts[message.id] = (fingerprint, tokens)
+            self.counts.move_to_end(message.id)
+            while len(self.counts) > self.maxsize:
+                self.counts.popitem(last=False)
+        return tokens
+
+    def __call__(self, state: Any) -> dict[str, list[AnyMessage]]:
+        messages: list[AnyMessage] = (
+            state["messages"] if isinstance(state, dict) else state.messages
+        )
+        system = (
+            messages[0]
+            if self.include_system
+            and messages
+            and isinstance(messages[0], SystemMessage)
+            else None
+        )
+        budget = self.max_tokens
+        end = 0
+        if system is not None:
+            budget -= self.count(system)
+            end = 1
+        fits = len(messages)
+        while fits > end and (tokens := self.count(messages[fits - 1])) <= budget:
+            budget -= tokens
+            fits -= 1
+        start = fits
+        if self.start_on is not None:
+            while start < len(messages) and messages[start].type != self.start_on:
+                start += 1
+        if start == len(messages) > end:
+            # start on an AIMessage with its ToolMessages rather than return nothing
+            start = fits
+            while start < len(messages) and messages[start].type != "ai":
+                start += 1
+        if start == len(messages) > end:
+            # nothing fits: keep the last turn, over the budget
+            start = len(messages) - 1
+            while start > end and messages[start].type == "tool":
+                start -= 1
+        window = messages[start:]
+        return {"llm_input_messages": [system, *window] if system else window}
+
+
+def _fingerprint(message: BaseMessage) -> int:
+    return hash(
+        (
+            message.type,
+            repr(message.content),
+            repr(getattr(message, "tool_calls", None)),
+        )
+    )
@@ -7,6 +7,7 @@ APIs, databases, or perform computations.
 
 The module implements several key design patterns:
 - Parallel execution of multiple tool calls for efficiency
+- Streaming of each tool result as soon as its call completes
 - Robust error handling with customizable error messages
 - State injection for tools that need access to graph state
 - Store injection for tools that need persistent storage
@@ -34,12 +35,19 @@ Typical Usage:
 import asyncio
 import inspect
 import json
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AsyncExitStack, ExitStack
+from contextvars import copy_context
 from copy import copy, deepcopy
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from typing import (
     Any,
     Callable,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -49,6 +57,7 @@ from typing import (
     get_type_hints,
 )
 
+from langchain_core.callbacks import BaseCallbackManager
 from langchain_core.messages import (
     AIMessage,
     AnyMessage,
@@ -60,7 +69,6 @@ from langchain_core.messages import (
 from langchain_core.runnables import RunnableConfig
 from langchain_core.runnables.config import (
     get_config_list,
-    get_executor_for_config,
 )
 from langchain_core.tools import BaseTool, InjectedToolArg
 from langchain_core.tools import tool as create_tool
@@ -70,17 +78,43 @@ from langchain_core.tools.base import (
 )
 from pydantic import BaseModel
 from typing_extensions import Annotated, get_args, get_origin
+from xxhash import xxh3_128_hexdigest
 
 from langgraph._internal._runnable import RunnableCallable
+from langgraph.cache.base import BaseCache, FullKey
 from langgraph.errors import GraphBubbleUp
 from langgraph.graph.message import REMOVE_ALL_MESSAGES
+from langgraph.pregel._messages import StreamMessagesHandler
 from langgraph.store.base import BaseStore
-from langgraph.types import Command, Send
+from langgraph.types import CacheKey, CachePolicy, Command, Send
 
 INVALID_TOOL_NAME_ERROR_TEMPLATE = (
     "Error: {requested_tool} is not a valid tool, try one of [{available_tools}]."
 )
 TOOL_CALL_ERROR_TEMPLATE = "Error: {error}\n Please fix your mistakes."
+# Cache namespace of tool results, followed by the tool name (and the thread ID)
+CACHE_NS_TOOL_RESULTS = "__tool_results"
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy(CachePolicy):
+    """Configuration for reusing the results of a tool in ToolNode.
+
+    Calls with the same arguments share their result: `key_func` is called with
+    the arguments of the call, without injected state and store arguments. Only
+    successful results returned as a ToolMessage are reused, not errors or Commands.
+    """
+
+    scope: Literal["step", "thread", "global"] = "thread"
+    """Which calls can reuse a result.
+
+    - "step": identical calls made in the same step run once.
+    - "thread": results are also cached for later steps of the same thread.
+    - "global": results are cached for all threads.
+
+    The "thread" and "global" scopes require passing a `cache` to ToolNode,
+    without one they behave like "step".
+    """
 
 
 def msg_content_output(output: Any) -> Union[str, list[dict]]:
@@ -267,6 +301,24 @@ class ToolNode(RunnableCallable):
 
         messages_key: The key in the state dictionary that contains the message list.
             This same key will be used for the output ToolMessages. Defaults to "messages".
+        cache_policy: Optional ToolCachePolicy to reuse the results of identical tool
+            calls, for all tools or per tool name. Defaults to None (no caching).
+        cache: The cache storing tool results across steps, e.g. an InMemoryCache or
+            SqliteCache. Required for the "thread" and "global" cache scopes.
+        max_concurrency: Maximum number of tool calls running at once, across all
+            invocations of this node. Defaults to None (no limit).
+        tool_max_concurrency: Maximum number of concurrent calls per tool name,
+            e.g. for tools backed by a rate-limited API. Defaults to None.
+        timeout: Seconds after which a tool call is abandoned, for all tools or
+            per tool name. The time spent waiting for a concurrency slot counts
+            towards the timeout. A timed out call raises a TimeoutError, handled
+            like other tool errors according to `handle_tool_errors`. Synchronous
+            tools can't be interrupted, and keep running in the background. The
+            threads they block are replaced, so they don't hold up later calls.
+        max_workers: Number of threads running synchronous tools. The threads are
+            shared by all invocations of this node, so raise it when many graph runs
+            call synchronous tools at once. Defaults to None, the
+            ThreadPoolExecutor default.
 
     Example:
         Basic usage with simple tools:
@@ -292,6 +344,29 @@ class ToolNode(RunnableCallable):
         tool_node = ToolNode([calculator], handle_tool_errors=handle_math_errors)
         ```
 
+        Reusing tool results for an hour, across threads:
+
+        ```python
+        from langgraph.cache.memory import InMemoryCache
+        from langgraph.prebuilt.tool_node import ToolCachePolicy
+
+        tool_node = ToolNode(
+            [get_stock_quote],
+            cache_policy={"get_stock_quote": ToolCachePolicy(ttl=3600, scope="global")},
+            cache=InMemoryCache(),
+        )
+        ```
+
+        Limiting a rate-limited tool to 2 concurrent calls of at most 10 seconds:
+
+        ```python
+        tool_node = ToolNode(
+            [search, calculator],
+            tool_max_concurrency={"search": 2},
+            timeout={"search": 10},
+        )
+        ```
+
         Direct tool call execution:
 
         ```python
@@ -309,6 +384,10 @@ class ToolNode(RunnableCallable):
         tool_calls populated. The node automatically extracts and processes these
         tool calls concurrently.
 
+        With `stream_mode="messages"`, each ToolMessage is streamed as soon as its
+        tool call completes. The node output, with all messages in the order of
+        the tool calls, is written once all calls are done.
+
         For advanced use cases involving state injection or store access, tools
         can be annotated with InjectedState or InjectedStore to receive graph
         context automatically.
@@ -326,6 +405,14 @@ class ToolNode(RunnableCallable):
             bool, str, Callable[..., str], tuple[type[Exception], ...]
         ] = True,
         messages_key: str = "messages",
+        cache_policy: Optional[
+            Union[ToolCachePolicy, Mapping[str, ToolCachePolicy]]
+        ] = None,
+        cache: Optional[BaseCache] = None,
+        max_concurrency: Optional[int] = None,
+        tool_max_concurrency: Optional[Mapping[str, int]] = None,
+        timeout: Optional[Union[float, Mapping[str, float]]] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """Initialize the ToolNode with the provided tools and configuration.
 
@@ -335,6 +422,12 @@ class ToolNode(RunnableCallable):
             tags: Optional metadata tags.
             handle_tool_errors: Error handling configuration.
             messages_key: State key containing messages.
+            cache_policy: Cache policy for all tools, or per tool name.
+            cache: Cache for tool results.
+            max_concurrency: Maximum number of concurrent tool calls.
+            tool_max_concurrency: Maximum number of concurrent calls per tool name.
+            timeout: Timeout in seconds for all tools, or per tool name.
+            max_workers: Number of threads running synchronous tools.
         """
         super().__init__(self._func, self._afunc, name=name, tags=tags, trace=False)
         self.tools_by_name: dict[str, BaseTool] = {}
@@ -348,6 +441,32 @@ class ToolNode(RunnableCallable):
             self.tools_by_name[tool_.name] = tool_
             self.tool_to_state_args[tool_.name] = _get_state_args(tool_)
             self.tool_to_store_arg[tool_.name] = _get_store_arg(tool_)
+        self.cache = cache
+        self.cache_policies: dict[str, ToolCachePolicy] = (
+            dict.fromkeys(self.tools_by_name, cache_policy)
+            if isinstance(cache_policy, ToolCachePolicy)
+            else dict(cache_policy or {})
+        )
+        self.timeouts: dict[str, float] = (
+            dict.fromkeys(self.tools_by_name, timeout)
+            if isinstance(timeout, (int, float))
+            else dict(timeout or {})
+        )
+        # concurrency limits per tool name, and for all tools under the None key
+        self.max_concurrency: dict[Optional[str], int] = dict(
+            tool_max_concurrency or {}
+        )
+        if max_concurrency is not None:
+            self.max_concurrency[None] = max_concurrency
+        self._semaphores = {
+            key: threading.BoundedSemaphore(value)
+            for key, value in self.max_concurrency.items()
+        }
+        self._async_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Optional[str], asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        # threads are only started on first use, and reused across invocations
+        self._executor = _ThreadPool(max_workers, thread_name_prefix=name)
 
     def _func(
         self,
@@ -361,13 +480,33 @@ class ToolNode(RunnableCallable):
         store: Optional[BaseStore],
     ) -> Any:
         tool_calls, input_type = self._parse_input(input, store)
-        config_list = get_config_list(config, len(tool_calls))
-        input_types = [input_type] * len(tool_calls)
-        with get_executor_for_config(config) as executor:
-            outputs = [
-                *executor.map(self._run_one, tool_calls, input_types, config_list)
-            ]
-
+        if not self.cache_policies:
+            outputs = self._run_many(tool_calls, input_type, config)
+            return self._combine_tool_outputs(outputs, input_type)
+
+        plan = _CachePlan(self._cache_keys(tool_calls, config))
+        stream = _message_streamer(config)
+        if self.cache is not None and (lookups := plan.lookups()):
+            plan.hits = self.cache.get(lookups)
+            _stream_all(stream, plan.cached(tool_calls))
+        to_run = plan.to_run()
+        plan.ran = dict(
+            zip(
+                to_run,
+                self._run_many([tool_calls[i] for i in to_run], input_type, config),
+            )
+        )
+        if rerun := plan.to_rerun():
+            plan.ran.update(
+                zip(
+                    rerun,
+                    self._run_many([tool_calls[i] for i in rerun], input_type, config),
+                )
+            )
+        if self.cache is not None and (writes := plan.writes()):
+            self.cache.set(writes)
+        outputs = plan.outputs(tool_calls)
+        _stream_all(stream, plan.reused())
         return self._combine_tool_outputs(outputs, input_type)
 
     async def _afunc(
@@ -382,12 +521,221 @@ class ToolNode(RunnableCallable):
         store: Optional[BaseStore],
     ) -> Any:
         tool_calls, input_type = self._parse_input(input, store)
-        outputs = await asyncio.gather(
-            *(self._arun_one(call, input_type, config) for call in tool_calls)
+        if not self.cache_policies:
+            outputs = await self._arun_many(tool_calls, input_type, config)
+            return self._combine_tool_outputs(outputs, input_type)
+
+        plan = _CachePlan(self._cache_keys(tool_calls, config))
+        stream = _message_streamer(config)
+        if self.cache is not None and (lookups := plan.lookups()):
+            plan.hits = await self.cache.aget(lookups)
+            _stream_all(stream, plan.cached(tool_calls))
+        to_run = plan.to_run()
+        outputs = await self._arun_many(
+            [tool_calls[i] for i in to_run], input_type, config
         )
-
+        plan.ran = dict(zip(to_run, outputs))
+        if rerun := plan.to_rerun():
+            outputs = await self._arun_many(
+                [tool_calls[i] for i in rerun], input_type, config
+            )
+            plan.ran.update(zip(rerun, outputs))
+        if self.cache is not None and (writes := plan.writes()):
+            await self.cache.aset(writes)
+        outputs = plan.outputs(tool_calls)
+        _stream_all(stream, plan.reused())
         return self._combine_tool_outputs(outputs, input_type)
 
+    def _run_many(
+        self,
+        tool_calls: list[ToolCall],
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+    ) -> list[ToolMessage]:
+        if not tool_calls:
+            return []
+        config_list = get_config_list(config, len(tool_calls))
+        # a max_concurrency set in the config only applies to this invocation
+        executor = (
+            self._executor
+            if config.get("max_concurrency") is None
+            else _ThreadPool(config["max_concurrency"])
+        )
+        started = time.monotonic()
+        deadlines = [
+            None
+            if (timeout := self.timeouts.get(c["name"])) is None
+            else started + timeout
+            for c in tool_calls
+        ]
+        try:
+            futures = [
+                executor.submit(self._run_limited, call, input_type, cfg, deadline)
+                for call, cfg, deadline in zip(tool_calls, config_list, deadlines)
+            ]
+            return self._collect(
+                tool_calls, futures, deadlines, executor, _message_streamer(config)
+            )
+        finally:
+            if executor is not self._executor:
+                # don't wait for timed out calls
+                executor.shutdown(wait=False)
+
+    def _run_limited(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        deadline: Optional[float],
+    ) -> ToolMessage:
+        """Run a single tool call once there is a free concurrency slot."""
+        with ExitStack() as stack:
+            for semaphore in _limits(call["name"], self._semaphores):
+                timeout = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                if not semaphore.acquire(timeout=timeout):
+                    # the call already timed out, its result is discarded
+                    raise _timeout_error(call, self.timeouts[call["name"]])
+                stack.callback(semaphore.release)
+            return self._run_one(call, input_type, config)
+
+    def _collect(
+        self,
+        tool_calls: list[ToolCall],
+        futures: list[Future[ToolMessage]],
+        deadlines: list[Optional[float]],
+        executor: "_ThreadPool",
+        stream: Optional[Callable[[Any], None]],
+    ) -> list[ToolMessage]:
+        """Wait for tool calls to complete or time out, streaming their results.
+
+        When a running call times out, the threads of the pool are replaced, so the
+        thread it blocks doesn't hold up the calls queued behind it.
+        """
+        pending = {future: index for index, future in enumerate(futures)}
+        outputs: dict[int, ToolMessage] = {}
+        while pending:
+            timeout = None
+            if waiting := [
+                d for i in pending.values() if (d := deadlines[i]) is not None
+            ]:
+                timeout = max(0.0, min(waiting) - time.monotonic())
+            done, _ = wait(pending, timeout, return_when=FIRST_COMPLETED)
+            completed = [(pending.pop(future), future.result()) for future in done]
+            now = time.monotonic()
+            blocked = False
+            for future, index in list(pending.items()):
+                if (deadline := deadlines[index]) is None or deadline > now:
+                    continue
+                del pending[future]
+                blocked |= not future.cancel()
+                call = tool_calls[index]
+                error = _timeout_error(call, self.timeouts[call["name"]])
+                completed.append((index, self._handle_error(error, call)))
+            if blocked:
+                executor.replace()
+            for index, output in completed:
+                outputs[index] = output
+                if stream is not None:
+                    stream(output)
+        return [outputs[index] for index in range(len(tool_calls))]
+
+    async def _arun_many(
+        self,
+        tool_calls: list[ToolCall],
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+    ) -> list[ToolMessage]:
+        loop = asyncio.get_running_loop()
+        if (semaphores := self._async_semaphores.get(loop)) is None:
+            # asyncio semaphores can't be shared across event loops
+            semaphores = self._async_semaphores[loop] = {
+                key: asyncio.Semaphore(value)
+                for key, value in self.max_concurrency.items()
+            }
+        if config.get("max_concurrency") is not None:
+            invocation = asyncio.Semaphore(config["max_concurrency"])
+        else:
+            invocation = None
+        stream = _message_streamer(config)
+        return await asyncio.gather(
+            *(
+                self._arun_limited(
+                    call, input_type, config, semaphores, invocation, stream
+                )
+                for call in tool_calls
+            )
+        )
+
+    async def _arun_limited(
+        self,
+        call: ToolCall,
+        input_type: Literal["list", "dict", "tool_calls"],
+        config: RunnableConfig,
+        semaphores: dict[Optional[str], asyncio.Semaphore],
+        invocation: Optional[asyncio.Semaphore],
+        stream: Optional[Callable[[Any], None]],
+    ) -> ToolMessage:
+        """Run a single tool call once there is a free concurrency slot."""
+
+        async def run() -> ToolMessage:
+            async with AsyncExitStack() as stack:
+                for semaphore in _limits(call["name"], semaphores):
+                    await stack.enter_async_context(semaphore)
+                if invocation is not None:
+                    await stack.enter_async_context(invocation)
+                return await self._arun_one(call, input_type, config)
+
+        if (timeout := self.timeouts.get(call["name"])) is None:
+            output = await run()
+        else:
+            try:
+                output = await asyncio.wait_for(run(), timeout)
+            except asyncio.TimeoutError:
+                output = self._handle_error(_timeout_error(call, timeout), call)
+        if stream is not None:
+            stream(output)
+        return output
+
+    def _cache_keys(
+        self, tool_calls: list[ToolCall], config: RunnableConfig
+    ) -> list[Optional[tuple[CacheKey, bool]]]:
+        """Get the cache key of each tool call, and whether to store it in the cache.
+
+        Calls to tools without a cache policy have no key.
+        """
+        thread_id = config.get("configurable", {}).get("thread_id")
+        keys: list[Optional[tuple[CacheKey, bool]]] = []
+        for call in tool_calls:
+            policy = self.cache_policies.get(call["name"])
+            if policy is None or call["name"] not in self.tools_by_name:
+                keys.append(None)
+                continue
+            injected = {
+                *self.tool_to_state_args[call["name"]],
+                self.tool_to_store_arg[call["name"]],
+            }
+            args_key = policy.key_func(
+                {k: v for k, v in call["args"].items() if k not in injected}
+            )
+            ns: tuple[str, ...] = (CACHE_NS_TOOL_RESULTS, call["name"])
+            if policy.scope == "thread" and thread_id is not None:
+                ns = (*ns, str(thread_id))
+            key = CacheKey(
+                ns,
+                xxh3_128_hexdigest(
+                    args_key.encode() if isinstance(args_key, str) else args_key
+                ),
+                policy.ttl,
+            )
+            persist = self.cache is not None and (
+                policy.scope == "global"
+                or (policy.scope == "thread" and thread_id is not None)
+            )
+            keys.append((key, persist))
+        return keys
+
     def _combine_tool_outputs(
         self,
         outputs: list[ToolMessage],
@@ -455,26 +803,7 @@ class ToolNode(RunnableCallable):
         except GraphBubbleUp as e:
             raise e
         except Exception as e:
-            if isinstance(self.handle_tool_errors, tuple):
-                handled_types: tuple = self.handle_tool_errors
-            elif callable(self.handle_tool_errors):
-                handled_types = _infer_handled_types(self.handle_tool_errors)
-            else:
-                # default behavior is catching all exceptions
-                handled_types = (Exception,)
-
-            # Unhandled
-            if not self.handle_tool_errors or not isinstance(e, handled_types):
-                raise e
-            # Handled
-            else:
-                content = _handle_tool_error(e, flag=self.handle_tool_errors)
-            return ToolMessage(
-                content=content,
-                name=call["name"],
-                tool_call_id=call["id"],
-                status="error",
-            )
+            return self._handle_error(e, call)
 
         if isinstance(response, Command):
             return self._validate_tool_command(response, call, input_type)
@@ -512,27 +841,7 @@ class ToolNode(RunnableCallable):
         except GraphBubbleUp as e:
             raise e
         except Exception as e:
-            if isinstance(self.handle_tool_errors, tuple):
-                handled_types: tuple = self.handle_tool_errors
-            elif callable(self.handle_tool_errors):
-                handled_types = _infer_handled_types(self.handle_tool_errors)
-            else:
-                # default behavior is catching all exceptions
-                handled_types = (Exception,)
-
-            # Unhandled
-            if not self.handle_tool_errors or not isinstance(e, handled_types):
-                raise e
-            # Handled
-            else:
-                content = _handle_tool_error(e, flag=self.handle_tool_errors)
-
-            return ToolMessage(
-                content=content,
-                name=call["name"],
-                tool_call_id=call["id"],
-                status="error",
-            )
+            return self._handle_error(e, call)
 
         if isinstance(response, Command):
             return self._validate_tool_command(response, call, input_type)
@@ -546,6 +855,29 @@ class ToolNode(RunnableCallable):
                 f"Tool {call['name']} returned unexpected type: {type(response)}"
             )
 
+    def _handle_error(self, e: Exception, call: ToolCall) -> ToolMessage:
+        """Turn an error raised by a tool call into an error ToolMessage."""
+        if isinstance(self.handle_tool_errors, tuple):
+            handled_types: tuple = self.handle_tool_errors
+        elif callable(self.handle_tool_errors):
+            handled_types = _infer_handled_types(self.handle_tool_errors)
+        else:
+            # default behavior is catching all exceptions
+            handled_types = (Exception,)
+
+        # Unhandled
+        if not self.handle_tool_errors or not isinstance(e, handled_types):
+            raise e
+        # Handled
+        else:
+            content = _handle_tool_error(e, flag=self.handle_tool_errors)
+        return ToolMessage(
+            content=content,
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
+
     def _parse_input(
         self,
         input: Union[
@@ -774,6 +1106,204 @@ class ToolNode(RunnableCallable):
         return updated_command
 
 
+class _CachePlan:
+    """Decides which tool calls of a step run, and which reuse another result.
+
+    Calls with the same cache key are deduplicated: the first one not found in the
+    cache runs, the others reuse its result. If that result can't be reused (e.g.
+    an error), they run as well.
+    """
+
+    def __init__(self, keys: list[Optional[tuple[CacheKey, bool]]]) -> None:
+        self.keys = keys
+        self.hits: dict[FullKey, Any] = {}
+        self.ran: dict[int, Any] = {}
+        # outputs of the calls that reuse another result, by index
+        self.served: dict[int, Any] = {}
+        # index of the call running for each cache key
+        self.leaders: dict[FullKey, int] = {}
+
+    def lookups(self) -> list[FullKey]:
+        """Keys to read from the cache."""
+        return list(
+            dict.fromkeys(_full_key(k) for k in self.keys if k is not None and k[1])
+        )
+
+    def to_run(self) -> list[int]:
+        """Calls to run, once cache hits are known."""
+        indices = []
+        for idx, key in enumerate(self.keys):
+            if key is None:
+                indices.append(idx)
+            elif (full_key := _full_key(key)) not in self.hits and (
+                full_key not in self.leaders
+            ):
+                self.leaders[full_key] = idx
+                indices.append(idx)
+        return indices
+
+    def to_rerun(self) -> list[int]:
+        """Duplicate calls whose leader returned a result that can't be reused."""
+        return [
+            idx
+            for idx, key in enumerate(self.keys)
+            if key is not None
+            and idx not in self.ran
+            and _full_key(key) not in self.hits
+            and not _reusable(self.ran[self.leaders[_full_key(key)]])
+        ]
+
+    def writes(self) -> dict[FullKey, tuple[Any, Optional[int]]]:
+        """Results to store in the cache."""
+        writes = {}
+        for full_key, idx in self.leaders.items():
+            key, persist = cast(tuple[CacheKey, bool], self.keys[idx])
+            if persist and _reusable(self.ran[idx]):
+                writes[full_key] = (self.ran[idx], key.ttl)
+        return writes
+
+    def cached(self, tool_calls: list[ToolCall]) -> list[Any]:
+        """The outputs of the calls found in the cache, known before any call runs."""
+        for idx, (call, key) in enumerate(zip(tool_calls, self.keys)):
+            if (
+                key is not None
+                and idx not in self.served
+                and (full_key := _full_key(key)) in self.hits
+            ):
+                self.served[idx] = _reply(self.hits[full_key], call)
+        return list(self.served.values())
+
+    def outputs(self, tool_calls: list[ToolCall]) -> list[Any]:
+        """The output of each call, in order."""
+        outputs = []
+        for idx, (call, key) in enumerate(zip(tool_calls, self.keys)):
+            if idx in self.ran or key is None:
+                outputs.append(self.ran[idx])
+                continue
+            if idx not in self.served:
+                full_key = _full_key(key)
+                result = (
+                    self.hits[full_key]
+                    if full_key in self.hits
+                    else self.ran[self.leaders[full_key]]
+                )
+                self.served[idx] = _reply(result, call)
+            outputs.append(self.served[idx])
+        return outputs
+
+    def reused(self) -> list[Any]:
+        """The outputs of the calls that didn't run, once `outputs` was called."""
+        return list(self.served.values())
+
+
+class _ThreadPool:
+    """A thread pool whose threads can be replaced when timed out calls block them.
+
+    Calls that didn't start yet move to the new threads, and their futures complete
+    as usual. The blocked threads finish their call in the background, then exit.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, *, thread_name_prefix: str = ""
+    ) -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        # calls that didn't start yet, run by whichever thread picks them up first
+        self._queued: dict[Future[ToolMessage], Callable[[], None]] = {}
+
+    def submit(self, fn: Callable[..., ToolMessage], *args: Any) -> Future[ToolMessage]:
+        future: Future[ToolMessage] = Future()
+        context = copy_context()
+
+        def run() -> None:
+            with self._lock:
+                if self._queued.pop(future, None) is None:
+                    return
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = context.run(fn, *args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        with self._lock:
+            self._queued[future] = run
+            self._executor.submit(run)
+        return future
+
+    def replace(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, self._new_executor()
+            for run in self._queued.values():
+                self._executor.submit(run)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+        )
+
+
+def _reply(result: Any, call: ToolCall) -> Any:
+    """Copy a result to answer another call with the same cache key."""
+    return result.model_copy(update={"tool_call_id": call["id"], "id": None})
+
+
+def _stream_all(stream: Optional[Callable[[Any], None]], outputs: list[Any]) -> None:
+    if stream is not None:
+        for output in outputs:
+            stream(output)
+
+
+def _full_key(key: tuple[CacheKey, bool]) -> FullKey:
+    return (key[0].ns, key[0].key)
+
+
+def _limits(name: str, semaphores: Mapping[Optional[str], Any]) -> list[Any]:
+    """The semaphores to acquire for a call to a tool, in a consistent order."""
+    return [semaphores[key] for key in (name, None) if key in semaphores]
+
+
+def _message_streamer(config: RunnableConfig) -> Optional[Callable[[Any], None]]:
+    """Get a function emitting ToolMessages to the `messages` stream mode.
+
+    Messages are emitted as soon as their tool call completes, instead of once all
+    calls of the step are done. Results served from the cache are emitted once they
+    are read. Returns None when not streaming messages.
+    """
+    callbacks = config.get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        handlers = callbacks.handlers
+    else:
+        handlers = callbacks or []
+    handler = next((h for h in handlers if isinstance(h, StreamMessagesHandler)), None)
+    metadata = config.get("metadata") or {}
+    if handler is None or "langgraph_checkpoint_ns" not in metadata:
+        return None
+
+    def stream(output: Any) -> None:
+        # Commands are emitted with the node output
+        if isinstance(output, ToolMessage):
+            handler.emit_node_message(output, metadata)
+
+    return stream
+
+
+def _timeout_error(call: ToolCall, timeout: float) -> TimeoutError:
+    return TimeoutError(f"Tool {call['name']} timed out after {timeout} seconds")
+
+
+def _reusable(output: Any) -> bool:
+    return isinstance(output, ToolMessage) and output.status != "error"
+
+
 def tools_condition(
     state: Union[list[AnyMessage], dict[str, Any], BaseModel],
     messages_key: str = "messages",
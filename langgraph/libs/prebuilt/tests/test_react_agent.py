@@ -16,6 +16,7 @@ import pytest
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import (
     AIMessage,
+    BaseMessage,
     AnyMessage,
     HumanMessage,
     MessageLikeRepresentation,
@@ -36,6 +37,7 @@ from langgraph.config import get_stream_writer
 from langgraph.graph import START, MessagesState, StateGraph, add_messages
 from langgraph.graph.message import REMOVE_ALL_MESSAGES
 from langgraph.prebuilt import (
+    HistoryWindow,
     ToolNode,
     create_react_agent,
     tools_condition,
@@ -1957,6 +1959,81 @@ def test_pre_model_hook() -> None:
     }
 
 
+def test_history_window() -> None:
+    counted = []
+
+    def count_tokens(messages: list[BaseMessage]) -> int:
+        counted.extend(m.id for m in messages)
+        return len(messages)
+
+    window = HistoryWindow(max_tokens=4, token_counter=count_tokens)
+    messages = [
+        SystemMessage("system", id="0"),
+        HumanMessage("a", id="1"),
+        AIMessage("b", id="2"),
+        HumanMessage("c", id="3"),
+        AIMessage("d", id="4"),
+    ]
+    # the window starts on a human message
+    assert window({"messages": messages}) == {
+        "llm_input_messages": [messages[0], messages[3], messages[4]]
+    }
+    assert counted == ["0", "4", "3", "2", "1"]
+
+    # only new messages are counted
+    counted.clear()
+    messages += [HumanMessage("e", id="5"), AIMessage("f", id="6")]
+    assert window({"messages": messages}) == {
+        "llm_input_messages": [messages[0], messages[5], messages[6]]
+    }
+    assert counted == ["6", "5"]
+    # messages replaced with different content are counted again
+    messages[5] = HumanMessage("edited", id="5")
+    window({"messages": messages})
+    assert counted == ["6", "5", "5"]
+    # even if the length of the content is the same
+    messages[5] = HumanMessage("EDITED", id="5")
+    window({"messages": messages})
+    assert counted == ["6", "5", "5", "5"]
+    # or only the tool calls changed
+    messages[6] = AIMessage(
+        "", id="6", tool_calls=[{"name": "search", "args": {}, "id": "call-1"}]
+    )
+    window({"messages": messages})
+    messages[6] = AIMessage(
+        "", id="6", tool_calls=[{"name": "lookup", "args": {}, "id": "call-1"}]
+    )
+    window({"messages": messages})
+    assert counted == ["6", "5", "5", "5", "6", "6"]
+
+    # a tool calling loop longer than the budget starts on an AIMessage with its
+    # ToolMessages instead of returning an empty window
+    loop = [HumanMessage("question", id="h")]
+    for i in range(3):
+        tool_call = {"name": "search", "args": {}, "id": f"call-{i}"}
+        loop += [
+            AIMessage("", id=f"ai-{i}", tool_calls=[tool_call]),
+            ToolMessage("result", id=f"tool-{i}", tool_call_id=f"call-{i}"),
+        ]
+    window = HistoryWindow(max_tokens=3, token_counter=count_tokens)
+    assert window({"messages": loop}) == {"llm_input_messages": loop[-2:]}
+    # if nothing fits, the last turn is kept over the budget
+    window = HistoryWindow(max_tokens=0, token_counter=count_tokens)
+    assert window({"messages": loop}) == {"llm_input_messages": loop[-2:]}
+    assert window({"messages": loop[:1]}) == {"llm_input_messages": loop[:1]}
+    assert window({"messages": [messages[0]]}) == {"llm_input_messages": [messages[0]]}
+
+    agent = create_react_agent(
+        FakeToolCallingModel(tool_calls=[]),
+        [],
+        pre_model_hook=HistoryWindow(max_tokens=2, token_counter=count_tokens),
+    )
+    result = agent.invoke(
+        {"messages": [HumanMessage("a"), AIMessage("b"), HumanMessage("c")]}
+    )
+    assert result["messages"][-1].content == "c"
+
+
 def test_post_model_hook() -> None:
     class FlagState(AgentState):
         flag: bool
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from typing import (
     Annotated,
     Any,
@@ -15,10 +18,12 @@ from langchain_core.tools import tool as dec_tool
 from pydantic import BaseModel, ValidationError
 from pydantic.v1 import ValidationError as ValidationErrorV1
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.errors import GraphBubbleUp, GraphInterrupt
+from langgraph.graph import START, MessagesState, StateGraph
 from langgraph.graph.message import REMOVE_ALL_MESSAGES
 from langgraph.prebuilt import ToolNode
-from langgraph.prebuilt.tool_node import TOOL_CALL_ERROR_TEMPLATE
+from langgraph.prebuilt.tool_node import TOOL_CALL_ERROR_TEMPLATE, ToolCachePolicy
 from langgraph.types import Command, Send
 
 pytestmark = pytest.mark.anyio
@@ -1156,3 +1161,373 @@ async def test_tool_node_command_remove_all_messages():
     command = result[0]
     assert isinstance(command, Command)
     assert command.update == {"messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES)]}
+
+
+def _quote_calls(*symbols: str) -> dict[str, list[AIMessage]]:
+    return {
+        "messages": [
+            AIMessage(
+                "",
+                tool_calls=[
+                    {"name": "quote", "args": {"symbol": s}, "id": f"{i}-{s}"}
+                    for i, s in enumerate(symbols)
+                ],
+            )
+        ]
+    }
+
+
+def test_tool_node_cache_policy():
+    calls = []
+
+    @dec_tool
+    def quote(symbol: str) -> str:
+        """Get a stock quote."""
+        calls.append(symbol)
+        if symbol == "ERR":
+            raise ValueError("Unknown symbol")
+        return f"{symbol}: {len(calls)}"
+
+    # identical calls in a step run once
+    tool_node = ToolNode([quote], cache_policy=ToolCachePolicy(scope="step"))
+    result = tool_node.invoke(_quote_calls("AAPL", "MSFT", "AAPL"))
+    assert calls == ["AAPL", "MSFT"]
+    assert [(m.tool_call_id, m.content) for m in result["messages"]] == [
+        ("0-AAPL", "AAPL: 1"),
+        ("1-MSFT", "MSFT: 2"),
+        ("2-AAPL", "AAPL: 1"),
+    ]
+    tool_node.invoke(_quote_calls("AAPL"))
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+    # errors aren't reused
+    calls.clear()
+    result = tool_node.invoke(_quote_calls("ERR", "ERR"))
+    assert calls == ["ERR", "ERR"]
+    assert [m.status for m in result["messages"]] == ["error", "error"]
+
+    # thread results are reused in later steps of the same thread
+    calls.clear()
+    tool_node = ToolNode(
+        [quote], cache_policy={"quote": ToolCachePolicy()}, cache=InMemoryCache()
+    )
+    thread_1 = {"configurable": {"thread_id": "1"}}
+    tool_node.invoke(_quote_calls("AAPL"), thread_1)
+    result = tool_node.invoke(_quote_calls("MSFT", "AAPL"), thread_1)
+    assert [m.content for m in result["messages"]] == ["MSFT: 2", "AAPL: 1"]
+    tool_node.invoke(_quote_calls("AAPL"), {"configurable": {"thread_id": "2"}})
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+    # global results are reused across threads
+    calls.clear()
+    tool_node = ToolNode(
+        [quote], cache_policy=ToolCachePolicy(scope="global"), cache=InMemoryCache()
+    )
+    tool_node.invoke(_quote_calls("AAPL"), thread_1)
+    result = tool_node.invoke(
+        _quote_calls("AAPL"), {"configurable": {"thread_id": "2"}}
+    )
+    assert calls == ["AAPL"]
+    assert result["messages"][0].content == "AAPL: 1"
+
+
+async def test_tool_node_cache_policy_async():
+    calls = []
+
+    @dec_tool
+    async def quote(symbol: str) -> str:
+        """Get a stock quote."""
+        calls.append(symbol)
+        return f"{symbol}: {len(calls)}"
+
+    tool_node = ToolNode(
+        [quote], cache_policy=ToolCachePolicy(scope="global"), cache=InMemoryCache()
+    )
+    result = await tool_node.ainvoke(_quote_calls("AAPL", "AAPL", "MSFT"))
+    assert calls == ["AAPL", "MSFT"]
+    assert [(m.tool_call_id, m.content) for m in result["messages"]] == [
+        ("0-AAPL", "AAPL: 1"),
+        ("1-AAPL", "AAPL: 1"),
+        ("2-MSFT", "MSFT: 2"),
+    ]
+    result = await tool_node.ainvoke(_quote_calls("MSFT"))
+    assert calls == ["AAPL", "MSFT"]
+    assert result["messages"][0].content == "MSFT: 2"
+
+
+def test_tool_node_concurrency_limits():
+    lock = threading.Lock()
+    running = {"search": 0, "all": 0}
+    peak = {"search": 0, "all": 0}
+
+    def track(name: str) -> None:
+        with lock:
+            for key in (name, "all"):
+                running[key] = running.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), running[key])
+        time.sleep(0.02)
+        with lock:
+            for key in (name, "all"):
+                running[key] -= 1
+
+    @dec_tool
+    def search(query: str) -> str:
+        """Search the web."""
+        track("search")
+        return query
+
+    @dec_tool
+    def calculator(query: str) -> str:
+        """Calculate."""
+        track("calculator")
+        return query
+
+    tool_node = ToolNode(
+        [search, calculator], max_concurrency=3, tool_max_concurrency={"search": 1}
+    )
+    tool_calls = [
+        {"name": name, "args": {"query": str(i)}, "id": f"{name}-{i}"}
+        for i in range(4)
+        for name in ("search", "calculator")
+    ]
+    result = tool_node.invoke({"messages": [AIMessage("", tool_calls=tool_calls)]})
+    assert [m.tool_call_id for m in result["messages"]] == [c["id"] for c in tool_calls]
+    assert peak["search"] == 1
+    assert peak["all"] <= 3
+    # the executor is reused across invocations
+    executor = tool_node._executor
+    tool_node.invoke({"messages": [AIMessage("", tool_calls=tool_calls[:2])]})
+    assert tool_node._executor is executor
+
+
+async def test_tool_node_concurrency_limits_async():
+    running = {"search": 0, "all": 0}
+    peak = {"search": 0, "all": 0}
+
+    @dec_tool
+    async def search(query: str) -> str:
+        """Search the web."""
+        for key in ("search", "all"):
+            running[key] += 1
+            peak[key] = max(peak[key], running[key])
+        await asyncio.sleep(0.01)
+        for key in ("search", "all"):
+            running[key] -= 1
+        return query
+
+    tool_node = ToolNode([search], max_concurrency=3)
+    tool_calls = [
+        {"name": "search", "args": {"query": str(i)}, "id": str(i)} for i in range(8)
+    ]
+    result = await tool_node.ainvoke(
+        {"messages": [AIMessage("", tool_calls=tool_calls)]}
+    )
+    assert [m.content for m in result["messages"]] == [str(i) for i in range(8)]
+    assert peak["all"] == 3
+
+    peak.update(search=0, all=0)
+    tool_node = ToolNode([search], tool_max_concurrency={"search": 2})
+    await tool_node.ainvoke({"messages": [AIMessage("", tool_calls=tool_calls)]})
+    assert peak["search"] == 2
+    # a limit in the config applies to a single invocation
+    peak["all"] = 0
+    await ToolNode([search]).ainvoke(
+        {"messages": [AIMessage("", tool_calls=tool_calls)]},
+        {"configurable": {}, "max_concurrency": 1},
+    )
+    assert peak["all"] == 1
+
+
+def test_tool_node_timeout():
+    @dec_tool
+    def slow(seconds: float) -> str:
+        """Sleep."""
+        time.sleep(seconds)
+        return "done"
+
+    @dec_tool
+    async def aslow(seconds: float) -> str:
+        """Sleep."""
+        await asyncio.sleep(seconds)
+        return "done"
+
+    tool_calls = [
+        {"name": "slow", "args": {"seconds": 0}, "id": "fast"},
+        {"name": "slow", "args": {"seconds": 0.5}, "id": "slow"},
+    ]
+    tool_node = ToolNode([slow], timeout={"slow": 0.1})
+    started = time.monotonic()
+    result = tool_node.invoke({"messages": [AIMessage("", tool_calls=tool_calls)]})
+    assert time.monotonic() - started < 0.4
+    assert [m.status for m in result["messages"]] == ["success", "error"]
+    assert result["messages"][1].content == TOOL_CALL_ERROR_TEMPLATE.format(
+        error=repr(TimeoutError("Tool slow timed out after 0.1 seconds"))
+    )
+
+    with pytest.raises(TimeoutError):
+        ToolNode([slow], timeout=0.1, handle_tool_errors=False).invoke(
+            {"messages": [AIMessage("", tool_calls=tool_calls)]}
+        )
+
+    async_calls = [{**call, "name": "aslow"} for call in tool_calls]
+    result = asyncio.run(
+        ToolNode([aslow], timeout=0.1).ainvoke(
+            {"messages": [AIMessage("", tool_calls=async_calls)]}
+        )
+    )
+    assert [m.status for m in result["messages"]] == ["success", "error"]
+
+
+def test_tool_node_timeout_doesnt_block_later_calls():
+    release = threading.Event()
+
+    @dec_tool
+    def blocking() -> str:
+        """Block until released."""
+        release.wait(5)
+        return "done"
+
+    @dec_tool
+    def echo(query: str) -> str:
+        """Echo the query."""
+        return query
+
+    blocking_call = {"name": "blocking", "args": {}, "id": "blocking"}
+    echo_call = {"name": "echo", "args": {"query": "hi"}, "id": "echo"}
+    tool_node = ToolNode([blocking, echo], timeout={"blocking": 0.1}, max_workers=1)
+    try:
+        # each timed out call blocks a thread for good, the echo call is queued
+        # behind it in the single-thread pool
+        for config in [None, None, {"configurable": {}, "max_concurrency": 1}]:
+            started = time.monotonic()
+            result = tool_node.invoke(
+                {"messages": [AIMessage("", tool_calls=[blocking_call, echo_call])]},
+                config,
+            )
+            assert time.monotonic() - started < 1
+            assert [m.status for m in result["messages"]] == ["error", "success"]
+
+        # more timed out calls than threads in a single invocation
+        tool_calls = [{**blocking_call, "id": f"blocking-{i}"} for i in range(3)]
+        started = time.monotonic()
+        result = tool_node.invoke(
+            {"messages": [AIMessage("", tool_calls=[*tool_calls, echo_call])]}
+        )
+        assert time.monotonic() - started < 1
+        statuses = [m.status for m in result["messages"]]
+        assert statuses == ["error", "error", "error", "success"]
+
+        started = time.monotonic()
+        result = tool_node.invoke({"messages": [AIMessage("", tool_calls=[echo_call])]})
+        assert time.monotonic() - started < 1
+        assert result["messages"][0].content == "hi"
+    finally:
+        release.set()
+
+
+def _tool_graph(tool_node: ToolNode) -> Any:
+    return (
+        StateGraph(MessagesState)
+        .add_node("tools", tool_node)
+        .add_edge(START, "tools")
+        .compile()
+    )
+
+
+def test_tool_node_streams_messages_as_completed():
+    @dec_tool
+    def wait(seconds: float) -> str:
+        """Sleep."""
+        time.sleep(seconds)
+        return f"waited {seconds}"
+
+    tool_calls = [
+        {"name": "wait", "args": {"seconds": 0.2}, "id": "slow"},
+        {"name": "wait", "args": {"seconds": 0}, "id": "fast"},
+    ]
+    graph = _tool_graph(ToolNode([wait]))
+    chunks = list(
+        graph.stream(
+            {"messages": [AIMessage("", tool_calls=tool_calls)]},
+            stream_mode=["messages", "updates"],
+        )
+    )
+    streamed = [chunk[0] for mode, chunk in chunks if mode == "messages"]
+    assert [m.tool_call_id for m in streamed] == ["fast", "slow"]
+    # the node output still has all messages, in call order
+    [update] = [chunk for mode, chunk in chunks if mode == "updates"]
+    assert update["tools"]["messages"] == [streamed[1], streamed[0]]
+
+
+def test_tool_node_streams_cached_messages():
+    @dec_tool
+    def wait(seconds: float) -> str:
+        """Sleep."""
+        time.sleep(seconds)
+        return f"waited {seconds}"
+
+    graph = _tool_graph(
+        ToolNode(
+            [wait],
+            cache_policy=ToolCachePolicy(scope="global"),
+            cache=InMemoryCache(),
+        )
+    )
+    graph.invoke(
+        {
+            "messages": [
+                AIMessage(
+                    "",
+                    tool_calls=[{"name": "wait", "args": {"seconds": 0}, "id": "1"}],
+                )
+            ]
+        }
+    )
+    tool_calls = [
+        {"name": "wait", "args": {"seconds": 0.2}, "id": "slow"},
+        {"name": "wait", "args": {"seconds": 0}, "id": "cached"},
+        {"name": "wait", "args": {"seconds": 0.2}, "id": "duplicate"},
+    ]
+    chunks = list(
+        graph.stream(
+            {"messages": [AIMessage("", tool_calls=tool_calls)]},
+            stream_mode=["messages", "updates"],
+        )
+    )
+    streamed = [chunk[0] for mode, chunk in chunks if mode == "messages"]
+    # the cached result is streamed before the calls that run, and each message
+    # is streamed once
+    assert [m.tool_call_id for m in streamed] == ["cached", "slow", "duplicate"]
+    [update] = [chunk for mode, chunk in chunks if mode == "updates"]
+    assert update["tools"]["messages"] == [streamed[1], streamed[0], streamed[2]]
+
+
+async def test_tool_node_streams_messages_as_completed_async():
+    fast_streamed = asyncio.Event()
+
+    @dec_tool
+    async def slow() -> str:
+        """Wait for the fast tool result to be streamed."""
+        await asyncio.wait_for(fast_streamed.wait(), 1)
+        return "slow"
+
+    @dec_tool
+    async def fast() -> str:
+        """Return immediately."""
+        return "fast"
+
+    tool_calls = [
+        {"name": "slow", "args": {}, "id": "slow"},
+        {"name": "fast", "args": {}, "id": "fast"},
+    ]
+    graph = _tool_graph(ToolNode([slow, fast]))
+    streamed = []
+    async for message, _ in graph.astream(
+        {"messages": [AIMessage("", tool_calls=tool_calls)]}, stream_mode="messages"
+    ):
+        streamed.append(message)
+        fast_streamed.set()
+    assert [(m.tool_call_id, m.status) for m in streamed] == [
+        ("fast", "success"),
+        ("slow", "success"),
+    ]
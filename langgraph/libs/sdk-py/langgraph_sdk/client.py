@@ -15,7 +15,10 @@ import logging
 import os
 import re
 import sys
-from collections.abc import AsyncIterator, Iterator, Sequence
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import (
     Any,
     Callable,
@@ -35,6 +38,7 @@ from langgraph_sdk.schema import (
     Assistant,
     AssistantSortBy,
     AssistantVersion,
+    BulkRunResult,
     CancelAction,
     Checkpoint,
     Command,
@@ -142,12 +146,234 @@ def _get_run_metadata_from_response(
     return None
 
 
+# Errors after which an interrupted stream can be resumed
+_RECONNECT_ERRORS = (
+    httpx.NetworkError,
+    httpx.TimeoutException,
+    httpx.RemoteProtocolError,
+)
+
+
+def _get_reconnect_path(response: httpx.Response) -> str | None:
+    """Get the path to join the stream of the run created by a request."""
+    if (metadata := _get_run_metadata_from_response(response)) and metadata[
+        "thread_id"
+    ]:
+        return f"/threads/{metadata['thread_id']}/runs/{metadata['run_id']}/stream"
+    return None
+
+
+def _resumable_stream_options(
+    stream_resumable: bool | None, on_disconnect: DisconnectMode | None
+) -> tuple[bool, DisconnectMode]:
+    """Check that a run keeps streaming while the client reconnects."""
+    if stream_resumable is False or on_disconnect == "cancel":
+        raise ValueError(
+            "reconnect_attempts requires stream_resumable=True and "
+            "on_disconnect='continue'"
+        )
+    return True, "continue"
+
+
+def _event_id_key(event_id: str) -> tuple[int, ...] | None:
+    parts = event_id.split("-")
+    if all(part.isdigit() for part in parts):
+        return tuple(int(part) for part in parts)
+    return None
+
+
+def _is_replayed(event_id: str, yielded_id: str | None) -> bool:
+    """Check whether an event comes at or before the last yielded one.
+
+    Event IDs increase monotonically. Numeric IDs, such as `1700000000000-0`, are
+    compared by value, others only for equality.
+    """
+    if yielded_id is None:
+        return False
+    if event_id == yielded_id:
+        return True
+    key, yielded_key = _event_id_key(event_id), _event_id_key(yielded_id)
+    return key is not None and yielded_key is not None and key <= yielded_key
+
+
+def _reconnect_delay(retry: int | None, attempt: int) -> float:
+    """Seconds to wait before reconnecting, doubling the server's retry time."""
+    base = retry / 1000 if retry is not None else 0.5
+    return min(base * 2 ** (attempt - 1), 30.0)
+
+
+# Status codes after which a run submitted in bulk is retried
+_THROTTLE_STATUS_CODES = (429, 503)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds to wait before retrying, as set by the Retry-After header."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+class _Throttle:
+    """Adaptive concurrency limit of runs submitted in bulk.
+
+    Halved and paused when the server throttles requests, then increased by one
+    for every `limit` successful requests, up to `max_concurrency`.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def concurrency(self) -> int:
+        return max(1, int(self.limit))
+
+    def delay(self) -> float:
+        """Seconds to wait before sending the next request."""
+        return max(0.0, self.resume_at - time.monotonic())
+
+    def success(self) -> None:
+        with self.lock:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def throttled(self, response: httpx.Response, attempt: int) -> None:
+        delay = _retry_after(response)
+        if delay is None:
+            delay = _reconnect_delay(None, attempt)
+        with self.lock:
+            now = time.monotonic()
+            # requests throttled while already paused count once
+            if now >= self.resume_at:
+                self.limit = max(1.0, self.limit / 2)
+            self.resume_at = max(self.resume_at, now + delay)
+
+
+def _is_throttled(e: Exception) -> bool:
+    return (
+        isinstance(e, httpx.HTTPStatusError)
+        and e.response.status_code in _THROTTLE_STATUS_CODES
+    )
+
+
+async def _asubmit_many(
+    submit: Callable[[RunCreate], Any],
+    payloads: Iterable[RunCreate],
+    max_concurrency: int,
+    max_retries: int,
+) -> AsyncIterator[BulkRunResult]:
+    """Submit runs with an adaptive concurrency limit, yielding results as they complete."""
+    throttle = _Throttle(max_concurrency)
+
+    async def run(index: int, payload: RunCreate) -> BulkRunResult:
+        attempt = 0
+        while True:
+            if delay := throttle.delay():
+                await asyncio.sleep(delay)
+            try:
+                result = await submit(payload)
+            except Exception as e:
+                if _is_throttled(e) and attempt < max_retries:
+                    attempt += 1
+                    throttle.throttled(e.response, attempt)
+                    continue
+                return BulkRunResult(index=index, payload=payload, result=None, error=e)
+            throttle.success()
+            return BulkRunResult(
+                index=index, payload=payload, result=result, error=None
+            )
+
+    items = enumerate(payloads)
+    pending: set[asyncio.Task[BulkRunResult]] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < throttle.concurrency:
+                if (item := next(items, None)) is None:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(run(*item)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _submit_many(
+    submit: Callable[[RunCreate], Any],
+    payloads: Iterable[RunCreate],
+    max_concurrency: int,
+    max_retries: int,
+) -> Iterator[BulkRunResult]:
+    """Submit runs with an adaptive concurrency limit, yielding results as they complete."""
+    throttle = _Throttle(max_concurrency)
+
+    def run(index: int, payload: RunCreate) -> BulkRunResult:
+        attempt = 0
+        while True:
+            if delay := throttle.delay():
+                time.sleep(delay)
+            try:
+                result = submit(payload)
+            except Exception as e:
+                if _is_throttled(e) and attempt < max_retries:
+                    attempt += 1
+                    throttle.throttled(e.response, attempt)
+                    continue
+                return BulkRunResult(index=index, payload=payload, result=None, error=e)
+            throttle.success()
+            return BulkRunResult(
+                index=index, payload=payload, result=result, error=None
+            )
+
+    items = enumerate(payloads)
+    pending: set[Future[BulkRunResult]] = set()
+    exhausted = False
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="langgraph-sdk-runs"
+    ) as executor:
+        try:
+            while True:
+                while not exhausted and len(pending) < throttle.concurrency:
+                    if (item := next(items, None)) is None:
+                        exhausted = True
+                    else:
+                        pending.add(executor.submit(run, *item))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+def _transport_kwargs(http2: bool, limits: httpx.Limits | None) -> dict[str, Any]:
+    return {
+        "http2": http2,
+        # keep as many idle connections as can be open, for bursts of requests
+        "limits": limits
+        or httpx.Limits(max_connections=100, max_keepalive_connections=100),
+    }
+
+
 def get_client(
     *,
     url: str | None = None,
     api_key: str | None = None,
     headers: dict[str, str] | None = None,
     timeout: TimeoutTypes | None = None,
+    http2: bool = False,
+    limits: httpx.Limits | None = None,
 ) -> LangGraphClient:
     """Get a LangGraphClient instance.
 
@@ -164,6 +390,11 @@ def get_client(
             Accepts an httpx.Timeout instance, a float (seconds), or a tuple of timeouts.
             Tuple format is (connect, read, write, pool)
             If not provided, defaults to connect=5s, read=300s, write=300s, and pool=5s.
+        http2: Whether to use HTTP/2, which multiplexes concurrent requests over
+            a single connection. Requires the `h2` package (`pip install
+            "langgraph-sdk[http2]"`). Defaults to False.
+        limits: Optional connection pool limits for the HTTP client.
+            If not provided, keeps up to 100 idle connections alive for 5s.
 
     Returns:
         LangGraphClient: The top-level client for accessing AssistantsClient,
@@ -199,7 +430,9 @@ def get_client(
                 url = "http://localhost:8123"
 
     if transport is None:
-        transport = httpx.AsyncHTTPTransport(retries=5)
+        transport = httpx.AsyncHTTPTransport(
+            retries=5, **_transport_kwargs(http2, limits)
+        )
     client = httpx.AsyncClient(
         base_url=url,
         transport=transport,
@@ -382,8 +615,15 @@ class HttpClient:
         params: QueryParamTypes | None = None,
         headers: dict[str, str] | None = None,
         on_response: Callable[[httpx.Response], None] | None = None,
+        reconnect_attempts: int = 0,
+        reconnect_path: str | None = None,
     ) -> AsyncIterator[StreamPart]:
-        """Stream results using SSE."""
+        """Stream results using SSE.
+
+        With `reconnect_attempts`, a stream interrupted by a network error is resumed
+        by joining `reconnect_path` (defaults to the run the request created) with
+        the last received event ID. Events up to the last yielded one are skipped.
+        """
         request_headers, content = await _aencode_json(json)
         request_headers["Accept"] = "text/event-stream"
         request_headers["Cache-Control"] = "no-store"
@@ -391,46 +631,141 @@ class HttpClient:
         if headers:
             request_headers.update(headers)
 
-        async with self.client.stream(
-            method, path, headers=request_headers, content=content, params=params
-        ) as res:
-            if on_response:
-                on_response(res)
-            # check status
+        yielded_id: str | None = None
+        last_event_id: str | None = None
+        retry: int | None = None
+        attempt = 0
+        while True:
             try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                body = (await res.aread()).decode()
-                if sys.version_info >= (3, 11):
-                    e.add_note(body)
-                else:
-                    logger.error(f"Error from langgraph-api: {body}", exc_info=e)
-                raise e
-            # check content type
-            content_type = res.headers.get("content-type", "").partition(";")[0]
-            if "text/event-stream" not in content_type:
-                raise httpx.TransportError(
-                    "Expected response header Content-Type to contain 'text/event-stream', "
-                    f"got {content_type!r}"
-                )
-            # parse SSE
-            decoder = SSEDecoder()
-            async for line in aiter_lines_raw(res):
-                sse = decoder.decode(line=line.rstrip(b"\n"))
-                if sse is not None:
-                    yield sse
+                async with self.client.stream(
+                    method,
+                    path,
+                    headers=request_headers,
+                    content=content,
+                    params=params,
+                ) as res:
+                    if on_response:
+                        on_response(res)
+                    # check status
+                    try:
+                        res.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        body = (await res.aread()).decode()
+                        if sys.version_info >= (3, 11):
+                            e.add_note(body)
+                        else:
+                            logger.error(
+                                f"Error from langgraph-api: {body}", exc_info=e
+                            )
+                        raise e
+                    # check content type
+                    content_type = res.headers.get("content-type", "").partition(";")[0]
+                    if "text/event-stream" not in content_type:
+                        raise httpx.TransportError(
+                            "Expected response header Content-Type to contain 'text/event-stream', "
+                            f"got {content_type!r}"
+                        )
+                    if reconnect_attempts and reconnect_path is None:
+                        reconnect_path = _get_reconnect_path(res)
+                    # parse SSE
+                    decoder = SSEDecoder()
+                    async for line in aiter_lines_raw(res):
+                        sse = decoder.decode(line=line.rstrip(b"\n"))
+                        if sse is None:
+                            continue
+                        last_event_id = decoder.last_event_id or last_event_id
+                        retry = decoder.retry or retry
+                        if decoder.event_id is not None:
+                            if _is_replayed(decoder.event_id, yielded_id):
+                                continue
+                            yielded_id = decoder.event_id
+                        attempt = 0
+                        yield sse
+                    return
+            except _RECONNECT_ERRORS:
+                if attempt >= reconnect_attempts or reconnect_path is None:
+                    raise
+            attempt += 1
+            await asyncio.sleep(_reconnect_delay(retry, attempt))
+            # join the run's stream, from the last received event
+            if path != reconnect_path:
+                method, path, content, params = "GET", reconnect_path, None, None
+                request_headers = {
+                    "Accept": "text/event-stream",
+                    "Cache-Control": "no-store",
+                    **(headers or {}),
+                }
+            if last_event_id is not None:
+                request_headers["Last-Event-ID"] = last_event_id
+            on_response = None
+
+
+# JSON bodies below this size (in bytes) are encoded and decoded on the event
+# loop, larger ones in a dedicated thread pool.
+_JSON_OFFLOAD_BYTES = 64 * 1024
+# Maximum number of values inspected to estimate the size of a request body.
+_JSON_INLINE_MAX_VALUES = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _json_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="langgraph-sdk-json")
+
+
+def _is_small_json(json: Any) -> bool:
+    """Cheaply check that a value encodes to less than _JSON_OFFLOAD_BYTES.
+
+    Strings count for their UTF-8 size, as orjson doesn't escape non-ASCII text.
+
+    Gives up, returning False, after inspecting _JSON_INLINE_MAX_VALUES values
+    or on values whose encoded size can't be estimated (e.g. pydantic models).
+    """
+    budget = _JSON_OFFLOAD_BYTES
+    remaining = _JSON_INLINE_MAX_VALUES
+    stack = [json]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            budget -= (len(value) if value.isascii() else len(value.encode())) + 2
+        elif value is None or isinstance(value, (bool, int, float)):
+            budget -= 8
+        elif isinstance(value, dict):
+            remaining -= len(value)
+            if remaining < 0:
+                return False
+            for k, v in value.items():
+                stack.append(k)
+                stack.append(v)
+        elif isinstance(value, (list, tuple)):
+            remaining -= len(value)
+            if remaining < 0:
+                return False
+            stack.extend(value)
+        else:
+            return False
+        remaining -= 1
+        if budget < 0 or remaining < 0:
+            return False
+    return True
 
 
 async def _aencode_json(json: Any) -> tuple[dict[str, str], bytes]:
     if json is None:
         return {}, None
-    body = await asyncio.get_running_loop().run_in_executor(
-        None,
-        orjson.dumps,
-        json,
-        _orjson_default,
-        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
-    )
+    if _is_small_json(json):
+        body = orjson.dumps(
+            json,
+            _orjson_default,
+            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        body = await asyncio.get_running_loop().run_in_executor(
+            _json_executor(),
+            orjson.dumps,
+            json,
+            _orjson_default,
+            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
     content_length = str(len(body))
     content_type = "application/json"
     headers = {"Content-Length": content_length, "Content-Type": content_type}
@@ -439,10 +774,12 @@ async def _aencode_json(json: Any) -> tuple[dict[str, str], bytes]:
 
 async def _adecode_json(r: httpx.Response) -> Any:
     body = await r.aread()
-    return (
-        await asyncio.get_running_loop().run_in_executor(None, orjson.loads, body)
-        if body
-        else None
+    if not body:
+        return None
+    if len(body) < _JSON_OFFLOAD_BYTES:
+        return orjson.loads(body)
+    return await asyncio.get_running_loop().run_in_executor(
+        _json_executor(), orjson.loads, body
     )
 
 
@@ -1517,7 +1854,7 @@ class RunsClient:
         command: Command | None = None,
         stream_mode: StreamMode | Sequence[StreamMode] = "values",
         stream_subgraphs: bool = False,
-        stream_resumable: bool = False,
+        stream_resumable: bool | None = None,
         metadata: dict | None = None,
         config: Config | None = None,
         context: Context | None = None,
@@ -1534,6 +1871,7 @@ class RunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> AsyncIterator[StreamPart]: ...
 
     @overload
@@ -1546,7 +1884,7 @@ class RunsClient:
         command: Command | None = None,
         stream_mode: StreamMode | Sequence[StreamMode] = "values",
         stream_subgraphs: bool = False,
-        stream_resumable: bool = False,
+        stream_resumable: bool | None = None,
         metadata: dict | None = None,
         config: Config | None = None,
         checkpoint_during: bool | None = None,
@@ -1560,6 +1898,7 @@ class RunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> AsyncIterator[StreamPart]: ...
 
     def stream(
@@ -1571,7 +1910,7 @@ class RunsClient:
         command: Command | None = None,
         stream_mode: StreamMode | Sequence[StreamMode] = "values",
         stream_subgraphs: bool = False,
-        stream_resumable: bool = False,
+        stream_resumable: bool | None = None,
         metadata: dict | None = None,
         config: Config | None = None,
         context: Context | None = None,
@@ -1589,6 +1928,7 @@ class RunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> AsyncIterator[StreamPart]:
         """Create a run and stream the results.
 
@@ -1603,6 +1943,7 @@ class RunsClient:
             stream_subgraphs: Whether to stream output from subgraphs.
             stream_resumable: Whether the stream is considered resumable.
                 If true, the stream can be resumed and replayed in its entirety even after disconnection.
+                Defaults to true with `reconnect_attempts`, false otherwise.
             metadata: Metadata to assign to the run.
             config: The configuration for the assistant.
             context: Static context to add to the assistant.
@@ -1613,7 +1954,8 @@ class RunsClient:
             interrupt_after: Nodes to Nodes to interrupt immediately after they get executed.
             feedback_keys: Feedback keys to assign to run.
             on_disconnect: The disconnect mode to use.
-                Must be one of 'cancel' or 'continue'.
+                Must be one of 'cancel' or 'continue'. Defaults to 'continue' with
+                `reconnect_attempts`.
             on_completion: Whether to delete or keep the thread created for a stateless run.
                 Must be one of 'delete' or 'keep'.
             webhook: Webhook to call after LangGraph API call is done.
@@ -1624,6 +1966,11 @@ class RunsClient:
             after_seconds: The number of seconds to wait before starting the run.
                 Use to schedule future runs.
             on_run_created: Callback when a run is created.
+            reconnect_attempts: Number of times to resume the stream after a network
+                error, from the last received event. Only runs on a thread can be
+                resumed. The run must keep going and replay its events while no
+                client is connected, so `stream_resumable=False` and
+                `on_disconnect="cancel"` can't be combined with it. Defaults to 0.
 
         Returns:
             AsyncIterator[StreamPart]: Asynchronous iterator of stream results.
@@ -1659,6 +2006,10 @@ class RunsClient:
             ```
 
         """  # noqa: E501
+        if reconnect_attempts:
+            stream_resumable, on_disconnect = _resumable_stream_options(
+                stream_resumable, on_disconnect
+            )
         payload = {
             "input": input,
             "command": (
@@ -1701,6 +2052,7 @@ class RunsClient:
             json={k: v for k, v in payload.items() if v is not None},
             headers=headers,
             on_response=on_response if on_run_created else None,
+            reconnect_attempts=reconnect_attempts,
         )
 
     @overload
@@ -1934,6 +2286,55 @@ class RunsClient:
         payloads = [filter_payload(payload) for payload in payloads]
         return await self.http.post("/runs/batch", json=payloads)
 
+    def create_many(
+        self,
+        payloads: Iterable[RunCreate],
+        *,
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[BulkRunResult]:
+        """Create background runs in bulk, with bounded concurrency.
+
+        Runs are submitted as payloads are consumed, with at most `max_concurrency`
+        requests in flight. When the server responds with 429 or 503, the request is
+        retried after the Retry-After delay (or an exponential backoff) and the
+        concurrency is halved, then increased again as requests succeed.
+        Errors are returned with each result instead of being raised.
+
+        Args:
+            payloads: The parameters of each run, as accepted by `create`.
+                Runs without a `thread_id` are stateless.
+            max_concurrency: Maximum number of requests in flight. Should not exceed
+                the connection limit of the client.
+            max_retries: Maximum number of retries of a throttled request.
+            headers: Optional custom headers to include with each request.
+
+        Returns:
+            AsyncIterator[BulkRunResult]: The result of each run, with the created run,
+                in order of completion.
+
+        ???+ example "Example Usage"
+
+            ```python
+            client = get_client(url="http://localhost:2024")
+            payloads = [
+                {"assistant_id": "agent", "input": {"question": q}} for q in questions
+            ]
+            async for item in client.runs.create_many(payloads, max_concurrency=20):
+                if item["error"] is not None:
+                    print(item["index"], item["error"])
+            ```
+        """
+        return _asubmit_many(
+            lambda payload: self.create(
+                **{"thread_id": None, **payload}, headers=headers
+            ),
+            payloads,
+            max_concurrency,
+            max_retries,
+        )
+
     @overload
     async def wait(
         self,
@@ -2139,6 +2540,55 @@ class RunsClient:
             )
         return response
 
+    def wait_many(
+        self,
+        payloads: Iterable[RunCreate],
+        *,
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[BulkRunResult]:
+        """Create runs in bulk and wait until they finish, with bounded concurrency.
+
+        Runs are submitted as payloads are consumed, with at most `max_concurrency`
+        requests in flight. When the server responds with 429 or 503, the request is
+        retried after the Retry-After delay (or an exponential backoff) and the
+        concurrency is halved, then increased again as requests succeed.
+        Errors are returned with each result instead of being raised.
+
+        Args:
+            payloads: The parameters of each run, as accepted by `wait`.
+                Runs without a `thread_id` are stateless.
+            max_concurrency: Maximum number of requests in flight. Should not exceed
+                the connection limit of the client.
+            max_retries: Maximum number of retries of a throttled request.
+            headers: Optional custom headers to include with each request.
+
+        Returns:
+            AsyncIterator[BulkRunResult]: The result of each run, with the output of the run,
+                in order of completion.
+
+        ???+ example "Example Usage"
+
+            ```python
+            client = get_client(url="http://localhost:2024")
+            payloads = [
+                {"assistant_id": "agent", "input": {"question": q}} for q in questions
+            ]
+            async for item in client.runs.wait_many(payloads, max_concurrency=20):
+                if item["error"] is not None:
+                    print(item["index"], item["error"])
+            ```
+        """
+        return _asubmit_many(
+            lambda payload: self.wait(
+                **{"thread_id": None, **payload}, headers=headers
+            ),
+            payloads,
+            max_concurrency,
+            max_retries,
+        )
+
     async def list(
         self,
         thread_id: str,
@@ -2289,6 +2739,7 @@ class RunsClient:
         stream_mode: StreamMode | Sequence[StreamMode] | None = None,
         headers: dict[str, str] | None = None,
         last_event_id: str | None = None,
+        reconnect_attempts: int = 0,
     ) -> AsyncIterator[StreamPart]:
         """Stream output from a run in real-time, until the run is done.
         Output is not buffered, so any output produced before this call will
@@ -2302,6 +2753,11 @@ class RunsClient:
                 when creating the run. Background runs default to having the union of all
                 stream modes.
             headers: Optional custom headers to include with the request.
+            last_event_id: The ID of the last event received, to resume from.
+            reconnect_attempts: Number of times to rejoin the stream after a network
+                error, from the last received event. Only runs created with
+                `stream_resumable=True` replay the events missed in between, and
+                `cancel_on_disconnect` can't be combined with it. Defaults to 0.
 
         Returns:
             None
@@ -2319,6 +2775,10 @@ class RunsClient:
             ```
 
         """  # noqa: E501
+        if reconnect_attempts and cancel_on_disconnect:
+            raise ValueError(
+                "reconnect_attempts can't be used with cancel_on_disconnect"
+            )
         return self.http.stream(
             f"/threads/{thread_id}/runs/{run_id}/stream",
             "GET",
@@ -2331,6 +2791,8 @@ class RunsClient:
                 **(headers or {}),
             }
             or None,
+            reconnect_attempts=reconnect_attempts,
+            reconnect_path=f"/threads/{thread_id}/runs/{run_id}/stream",
         )
 
     async def delete(
@@ -2929,6 +3391,8 @@ def get_sync_client(
     api_key: str | None = None,
     headers: dict[str, str] | None = None,
     timeout: TimeoutTypes | None = None,
+    http2: bool = False,
+    limits: httpx.Limits | None = None,
 ) -> SyncLangGraphClient:
     """Get a synchronous LangGraphClient instance.
 
@@ -2945,6 +3409,11 @@ def get_sync_client(
             Accepts an httpx.Timeout instance, a float (seconds), or a tuple of timeouts.
             Tuple format is (connect, read, write, pool)
             If not provided, defaults to connect=5s, read=300s, write=300s, and pool=5s.
+        http2: Whether to use HTTP/2, which multiplexes concurrent requests over
+            a single connection. Requires the `h2` package (`pip install
+            "langgraph-sdk[http2]"`). Defaults to False.
+        limits: Optional connection pool limits for the HTTP client.
+            If not provided, keeps up to 100 idle connections alive for 5s.
     Returns:
         SyncLangGraphClient: The top-level synchronous client for accessing AssistantsClient,
         ThreadsClient, RunsClient, and CronClient.
@@ -2965,7 +3434,7 @@ def get_sync_client(
     if url is None:
         url = "http://localhost:8123"
 
-    transport = httpx.HTTPTransport(retries=5)
+    transport = httpx.HTTPTransport(retries=5, **_transport_kwargs(http2, limits))
     client = httpx.Client(
         base_url=url,
         transport=transport,
@@ -3152,41 +3621,88 @@ class SyncHttpClient:
         params: QueryParamTypes | None = None,
         headers: dict[str, str] | None = None,
         on_response: Callable[[httpx.Response], None] | None = None,
+        reconnect_attempts: int = 0,
+        reconnect_path: str | None = None,
     ) -> Iterator[StreamPart]:
-        """Stream the results of a request using SSE."""
+        """Stream the results of a request using SSE.
+
+        With `reconnect_attempts`, a stream interrupted by a network error is resumed
+        by joining `reconnect_path` (defaults to the run the request created) with
+        the last received event ID. Events up to the last yielded one are skipped.
+        """
         request_headers, content = _encode_json(json)
         request_headers["Accept"] = "text/event-stream"
         request_headers["Cache-Control"] = "no-store"
         if headers:
             request_headers.update(headers)
-        with self.client.stream(
-            method, path, headers=request_headers, content=content, params=params
-        ) as res:
-            if on_response:
-                on_response(res)
-            # check status
+
+        yielded_id: str | None = None
+        last_event_id: str | None = None
+        retry: int | None = None
+        attempt = 0
+        while True:
             try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                body = (res.read()).decode()
-                if sys.version_info >= (3, 11):
-                    e.add_note(body)
-                else:
-                    logger.error(f"Error from langgraph-api: {body}", exc_info=e)
-                raise e
-            # check content type
-            content_type = res.headers.get("content-type", "").partition(";")[0]
-            if "text/event-stream" not in content_type:
-                raise httpx.TransportError(
-                    "Expected response header Content-Type to contain 'text/event-stream', "
-                    f"got {content_type!r}"
-                )
-            # parse SSE
-            decoder = SSEDecoder()
-            for line in iter_lines_raw(res):
-                sse = decoder.decode(line.rstrip(b"\n"))
-                if sse is not None:
-                    yield sse
+                with self.client.stream(
+                    method,
+                    path,
+                    headers=request_headers,
+                    content=content,
+                    params=params,
+                ) as res:
+                    if on_response:
+                        on_response(res)
+                    # check status
+                    try:
+                        res.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        body = (res.read()).decode()
+                        if sys.version_info >= (3, 11):
+                            e.add_note(body)
+                        else:
+                            logger.error(
+                                f"Error from langgraph-api: {body}", exc_info=e
+                            )
+                        raise e
+                    # check content type
+                    content_type = res.headers.get("content-type", "").partition(";")[0]
+                    if "text/event-stream" not in content_type:
+                        raise httpx.TransportError(
+                            "Expected response header Content-Type to contain 'text/event-stream', "
+                            f"got {content_type!r}"
+                        )
+                    if reconnect_attempts and reconnect_path is None:
+                        reconnect_path = _get_reconnect_path(res)
+                    # parse SSE
+                    decoder = SSEDecoder()
+                    for line in iter_lines_raw(res):
+                        sse = decoder.decode(line.rstrip(b"\n"))
+                        if sse is None:
+                            continue
+                        last_event_id = decoder.last_event_id or last_event_id
+                        retry = decoder.retry or retry
+                        if decoder.event_id is not None:
+                            if _is_replayed(decoder.event_id, yielded_id):
+                                continue
+                            yielded_id = decoder.event_id
+                        attempt = 0
+                        yield sse
+                    return
+            except _RECONNECT_ERRORS:
+                if attempt >= reconnect_attempts or reconnect_path is None:
+                    raise
+            attempt += 1
+            time.sleep(_reconnect_delay(retry, attempt))
+            # join the run's stream, from the last received event
+            if path != reconnect_path:
+                method, path, content, params = "GET", reconnect_path, None, None
+                request_headers = {
+                    "Accept": "text/event-stream",
+                    "Cache-Control": "no-store",
+                    **(headers or {}),
+                }
+            if last_event_id is not None:
+                request_headers["Last-Event-ID"] = last_event_id
+            on_response = None
 
 
 def _encode_json(json: Any) -> tuple[dict[str, str], bytes]:
@@ -4298,6 +4814,7 @@ class SyncRunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> Iterator[StreamPart]: ...
 
     @overload
@@ -4310,7 +4827,7 @@ class SyncRunsClient:
         command: Command | None = None,
         stream_mode: StreamMode | Sequence[StreamMode] = "values",
         stream_subgraphs: bool = False,
-        stream_resumable: bool = False,
+        stream_resumable: bool | None = None,
         metadata: dict | None = None,
         config: Config | None = None,
         context: Context | None = None,
@@ -4325,6 +4842,7 @@ class SyncRunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> Iterator[StreamPart]: ...
 
     def stream(
@@ -4336,7 +4854,7 @@ class SyncRunsClient:
         command: Command | None = None,
         stream_mode: StreamMode | Sequence[StreamMode] = "values",
         stream_subgraphs: bool = False,
-        stream_resumable: bool = False,
+        stream_resumable: bool | None = None,
         metadata: dict | None = None,
         config: Config | None = None,
         context: Context | None = None,
@@ -4354,6 +4872,7 @@ class SyncRunsClient:
         after_seconds: int | None = None,
         headers: dict[str, str] | None = None,
         on_run_created: Callable[[RunCreateMetadata], None] | None = None,
+        reconnect_attempts: int = 0,
     ) -> Iterator[StreamPart]:
         """Create a run and stream the results.
 
@@ -4368,6 +4887,7 @@ class SyncRunsClient:
             stream_subgraphs: Whether to stream output from subgraphs.
             stream_resumable: Whether the stream is considered resumable.
                 If true, the stream can be resumed and replayed in its entirety even after disconnection.
+                Defaults to true with `reconnect_attempts`, false otherwise.
             metadata: Metadata to assign to the run.
             config: The configuration for the assistant.
             context: Static context to add to the assistant.
@@ -4378,7 +4898,8 @@ class SyncRunsClient:
             interrupt_after: Nodes to Nodes to interrupt immediately after they get executed.
             feedback_keys: Feedback keys to assign to run.
             on_disconnect: The disconnect mode to use.
-                Must be one of 'cancel' or 'continue'.
+                Must be one of 'cancel' or 'continue'. Defaults to 'continue' with
+                `reconnect_attempts`.
             on_completion: Whether to delete or keep the thread created for a stateless run.
                 Must be one of 'delete' or 'keep'.
             webhook: Webhook to call after LangGraph API call is done.
@@ -4390,6 +4911,11 @@ class SyncRunsClient:
                 Use to schedule future runs.
             headers: Optional custom headers to include with the request.
             on_run_created: Optional callback to call when a run is created.
+            reconnect_attempts: Number of times to resume the stream after a network
+                error, from the last received event. Only runs on a thread can be
+                resumed. The run must keep going and replay its events while no
+                client is connected, so `stream_resumable=False` and
+                `on_disconnect="cancel"` can't be combined with it. Defaults to 0.
 
         Returns:
             Iterator[StreamPart]: Iterator of stream results.
@@ -4422,6 +4948,10 @@ class SyncRunsClient:
             StreamPart(event='end', data=None)
             ```
         """  # noqa: E501
+        if reconnect_attempts:
+            stream_resumable, on_disconnect = _resumable_stream_options(
+                stream_resumable, on_disconnect
+            )
         payload = {
             "input": input,
             "command": (
@@ -4464,6 +4994,7 @@ class SyncRunsClient:
             json={k: v for k, v in payload.items() if v is not None},
             headers=headers,
             on_response=on_response if on_run_created else None,
+            reconnect_attempts=reconnect_attempts,
         )
 
     @overload
@@ -4699,6 +5230,55 @@ class SyncRunsClient:
         payloads = [filter_payload(payload) for payload in payloads]
         return self.http.post("/runs/batch", json=payloads, headers=headers)
 
+    def create_many(
+        self,
+        payloads: Iterable[RunCreate],
+        *,
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[BulkRunResult]:
+        """Create background runs in bulk, with bounded concurrency.
+
+        Runs are submitted as payloads are consumed, with at most `max_concurrency`
+        requests in flight. When the server responds with 429 or 503, the request is
+        retried after the Retry-After delay (or an exponential backoff) and the
+        concurrency is halved, then increased again as requests succeed.
+        Errors are returned with each result instead of being raised.
+
+        Args:
+            payloads: The parameters of each run, as accepted by `create`.
+                Runs without a `thread_id` are stateless.
+            max_concurrency: Maximum number of requests in flight. Should not exceed
+                the connection limit of the client.
+            max_retries: Maximum number of retries of a throttled request.
+            headers: Optional custom headers to include with each request.
+
+        Returns:
+            Iterator[BulkRunResult]: The result of each run, with the created run,
+                in order of completion.
+
+        ???+ example "Example Usage"
+
+            ```python
+            client = get_sync_client(url="http://localhost:2024")
+            payloads = [
+                {"assistant_id": "agent", "input": {"question": q}} for q in questions
+            ]
+            for item in client.runs.create_many(payloads, max_concurrency=20):
+                if item["error"] is not None:
+                    print(item["index"], item["error"])
+            ```
+        """
+        return _submit_many(
+            lambda payload: self.create(
+                **{"thread_id": None, **payload}, headers=headers
+            ),
+            payloads,
+            max_concurrency,
+            max_retries,
+        )
+
     @overload
     def wait(
         self,
@@ -4892,6 +5472,55 @@ class SyncRunsClient:
             on_response=on_response if on_run_created else None,
         )
 
+    def wait_many(
+        self,
+        payloads: Iterable[RunCreate],
+        *,
+        max_concurrency: int = 10,
+        max_retries: int = 5,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[BulkRunResult]:
+        """Create runs in bulk and wait until they finish, with bounded concurrency.
+
+        Runs are submitted as payloads are consumed, with at most `max_concurrency`
+        requests in flight. When the server responds with 429 or 503, the request is
+        retried after the Retry-After delay (or an exponential backoff) and the
+        concurrency is halved, then increased again as requests succeed.
+        Errors are returned with each result instead of being raised.
+
+        Args:
+            payloads: The parameters of each run, as accepted by `wait`.
+                Runs without a `thread_id` are stateless.
+            max_concurrency: Maximum number of requests in flight. Should not exceed
+                the connection limit of the client.
+            max_retries: Maximum number of retries of a throttled request.
+            headers: Optional custom headers to include with each request.
+
+        Returns:
+            Iterator[BulkRunResult]: The result of each run, with the output of the run,
+                in order of completion.
+
+        ???+ example "Example Usage"
+
+            ```python
+            client = get_sync_client(url="http://localhost:2024")
+            payloads = [
+                {"assistant_id": "agent", "input": {"question": q}} for q in questions
+            ]
+            for item in client.runs.wait_many(payloads, max_concurrency=20):
+                if item["error"] is not None:
+                    print(item["index"], item["error"])
+            ```
+        """
+        return _submit_many(
+            lambda payload: self.wait(
+                **{"thread_id": None, **payload}, headers=headers
+            ),
+            payloads,
+            max_concurrency,
+            max_retries,
+        )
+
     def list(
         self,
         thread_id: str,
@@ -5039,6 +5668,7 @@ class SyncRunsClient:
         cancel_on_disconnect: bool = False,
         headers: dict[str, str] | None = None,
         last_event_id: str | None = None,
+        reconnect_attempts: int = 0,
     ) -> Iterator[StreamPart]:
         """Stream output from a run in real-time, until the run is done.
         Output is not buffered, so any output produced before this call will
@@ -5052,6 +5682,11 @@ class SyncRunsClient:
                 stream modes.
             cancel_on_disconnect: Whether to cancel the run when the stream is disconnected.
             headers: Optional custom headers to include with the request.
+            last_event_id: The ID of the last event received, to resume from.
+            reconnect_attempts: Number of times to rejoin the stream after a network
+                error, from the last received event. Only runs created with
+                `stream_resumable=True` replay the events missed in between, and
+                `cancel_on_disconnect` can't be combined with it. Defaults to 0.
 
         Returns:
             None
@@ -5068,6 +5703,10 @@ class SyncRunsClient:
             ```
 
         """  # noqa: E501
+        if reconnect_attempts and cancel_on_disconnect:
+            raise ValueError(
+                "reconnect_attempts can't be used with cancel_on_disconnect"
+            )
         return self.http.stream(
             f"/threads/{thread_id}/runs/{run_id}/stream",
             "GET",
@@ -5080,6 +5719,8 @@ class SyncRunsClient:
                 **(headers or {}),
             }
             or None,
+            reconnect_attempts=reconnect_attempts,
+            reconnect_path=f"/threads/{thread_id}/runs/{run_id}/stream",
         )
 
     def delete(
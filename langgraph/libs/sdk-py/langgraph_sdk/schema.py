@@ -480,3 +480,19 @@ class RunCreateMetadata(TypedDict):
 
     thread_id: str | None
     """The ID of the thread."""
+
+
+class BulkRunResult(TypedDict):
+    """The outcome of one run submitted by `runs.create_many` or `runs.wait_many`."""
+
+    index: int
+    """The position of the run's parameters in the submitted payloads."""
+
+    payload: RunCreate
+    """The parameters of the run."""
+
+    result: Any
+    """The created run, or the output of the run for `wait_many`. None on error."""
+
+    error: BaseException | None
+    """The error raised submitting the run, if any."""
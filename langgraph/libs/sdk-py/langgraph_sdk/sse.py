@@ -80,6 +80,20 @@ class SSEDecoder:
         self._data = bytearray()
         self._last_event_id = ""
         self._retry: int | None = None
+        self._event_id: str | None = None
+        self._reconnection_time: int | None = None
+        self.event_id: str | None = None
+        """The ID of the last dispatched event, if it had one."""
+
+    @property
+    def last_event_id(self) -> str | None:
+        """The last event ID received, to resume the stream from."""
+        return self._last_event_id or None
+
+    @property
+    def retry(self) -> int | None:
+        """The reconnection time in milliseconds, as last set by the server."""
+        return self._reconnection_time
 
     def decode(self, line: bytes) -> StreamPart | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -99,9 +113,11 @@ class SSEDecoder:
             )
 
             # NOTE: as per the SSE spec, do not reset last_event_id.
+            self.event_id = self._event_id
             self._event = ""
             self._data = bytearray()
             self._retry = None
+            self._event_id = None
 
             return sse
 
@@ -121,10 +137,10 @@ class SSEDecoder:
             if b"\0" in value:
                 pass
             else:
-                self._last_event_id = value.decode()
+                self._last_event_id = self._event_id = value.decode()
         elif fieldname == b"retry":
             try:
-                self._retry = int(value)
+                self._retry = self._reconnection_time = int(value)
             except (TypeError, ValueError):
                 pass
         else:
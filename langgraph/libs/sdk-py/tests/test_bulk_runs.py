@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import orjson
+import pytest
+
+from langgraph_sdk.client import LangGraphClient, SyncLangGraphClient, _Throttle
+
+
+class Server:
+    """Creates runs, replying to each attempt with the status its input lists.
+
+    Each run's input has an `id`, an optional `delay` in seconds and optional
+    `statuses`, one per attempt. Throttled replies set Retry-After to 0.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.attempts: dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list[int] = []
+
+    def start(self, request: httpx.Request) -> tuple[dict, int]:
+        run_input = orjson.loads(request.content)["input"]
+        with self.lock:
+            attempt = self.attempts.get(run_input["id"], 0)
+            self.attempts[run_input["id"]] = attempt + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        statuses = run_input.get("statuses", [])
+        return run_input, statuses[attempt] if attempt < len(statuses) else 200
+
+    def reply(self, request: httpx.Request, run_input: dict, status: int):
+        with self.lock:
+            self.in_flight -= 1
+        if status != 200:
+            headers = {"Retry-After": "0"} if status in (429, 503) else {}
+            return httpx.Response(status, headers=headers, json={"detail": "error"})
+        if request.url.path == "/runs/wait":
+            return httpx.Response(200, json={"output": run_input["id"]})
+        return httpx.Response(200, json={"run_id": f"run-{run_input['id']}"})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        run_input, status = self.start(request)
+        time.sleep(run_input.get("delay", 0))
+        return self.reply(request, run_input, status)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        run_input, status = self.start(request)
+        try:
+            await asyncio.sleep(run_input.get("delay", 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(run_input["id"])
+            raise
+        return self.reply(request, run_input, status)
+
+
+def clients(server: Server) -> tuple[LangGraphClient, SyncLangGraphClient]:
+    return (
+        LangGraphClient(
+            httpx.AsyncClient(
+                base_url="http://api",
+                transport=httpx.MockTransport(server.handle_async_request),
+            )
+        ),
+        SyncLangGraphClient(
+            httpx.Client(base_url="http://api", transport=httpx.MockTransport(server))
+        ),
+    )
+
+
+def payloads(*inputs: dict) -> list[dict]:
+    return [
+        {"assistant_id": "agent", "input": {"id": i, **run_input}}
+        for i, run_input in enumerate(inputs)
+    ]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_create_many_retries_throttled_runs(use_async: bool) -> None:
+    server = Server()
+    aclient, client = clients(server)
+    runs = payloads(
+        {"statuses": [429, 503]},
+        {},
+        {"statuses": [400]},
+        {"statuses": [429, 429, 429]},
+    )
+    if use_async:
+        results = [item async for item in aclient.runs.create_many(runs, max_retries=2)]
+    else:
+        results = list(client.runs.create_many(runs, max_retries=2))
+
+    by_index = {item["index"]: item for item in results}
+    assert sorted(by_index) == [0, 1, 2, 3]
+    assert by_index[0]["result"] == {"run_id": "run-0"}
+    assert by_index[0]["error"] is None
+    assert by_index[1]["result"] == {"run_id": "run-1"}
+    assert by_index[2]["payload"] is runs[2]
+    assert by_index[2]["result"] is None
+    # other errors are not retried
+    assert by_index[2]["error"].response.status_code == 400
+    # throttled runs are retried at most max_retries times
+    assert by_index[3]["error"].response.status_code == 429
+    assert server.attempts == {0: 3, 1: 1, 2: 1, 3: 3}
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_wait_many_yields_in_completion_order(use_async: bool) -> None:
+    server = Server()
+    aclient, client = clients(server)
+    runs = payloads({"delay": 0.2}, {"delay": 0}, {"delay": 0.1})
+    if use_async:
+        results = [item async for item in aclient.runs.wait_many(runs)]
+    else:
+        results = list(client.runs.wait_many(runs))
+    assert [item["index"] for item in results] == [1, 2, 0]
+    assert [item["result"] for item in results] == [{"output": i} for i in (1, 2, 0)]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_create_many_bounds_concurrency(use_async: bool) -> None:
+    server = Server()
+    aclient, client = clients(server)
+    runs = payloads(*({"delay": 0.01} for _ in range(20)))
+    if use_async:
+        results = [
+            item async for item in aclient.runs.create_many(runs, max_concurrency=4)
+        ]
+    else:
+        results = list(client.runs.create_many(runs, max_concurrency=4))
+    assert len(results) == 20
+    assert server.max_in_flight == 4
+
+
+async def test_create_many_cancels_pending_runs_on_close() -> None:
+    server = Server()
+    aclient, _ = clients(server)
+    runs = payloads({"delay": 0}, *({"delay": 10} for _ in range(9)))
+    results = aclient.runs.create_many(runs, max_concurrency=2)
+    async for item in results:
+        assert item["index"] == 0
+        break
+    await results.aclose()
+    await asyncio.sleep(0)
+    # no more runs are submitted, and the one in flight is cancelled
+    assert sorted(server.attempts) == [0, 1]
+    assert server.cancelled == [1]
+
+
+def test_sync_create_many_stops_submitting_on_close() -> None:
+    server = Server()
+    _, client = clients(server)
+    runs = payloads({"delay": 0}, *({"delay": 0.1} for _ in range(9)))
+    results = client.runs.create_many(runs, max_concurrency=2)
+    for item in results:
+        assert item["index"] == 0
+        break
+    # waits for the run in flight, without submitting the others
+    results.close()
+    assert sorted(server.attempts) == [0, 1]
+
+
+def test_throttle_halves_and_regrows_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    throttled = httpx.Response(429, headers={"Retry-After": "2"})
+
+    throttle = _Throttle(8)
+    throttle.throttled(throttled, attempt=1)
+    assert throttle.concurrency == 4
+    assert throttle.delay() == 2
+    # requests throttled during the pause count once
+    throttle.throttled(throttled, attempt=1)
+    assert throttle.concurrency == 4
+
+    now = 103.0
+    assert throttle.delay() == 0
+    throttle.throttled(httpx.Response(503), attempt=1)
+    assert throttle.concurrency == 2
+    # without Retry-After, backs off exponentially
+    assert throttle.delay() == 0.5
+
+    # the limit grows by about one for every `limit` successful requests
+    for _ in range(2):
+        throttle.success()
+    assert throttle.concurrency == 2
+    throttle.success()
+    assert throttle.concurrency == 3
+    for _ in range(30):
+        throttle.success()
+    assert throttle.concurrency == 8
+    assert throttle.limit == 8
+
+    for _ in range(10):
+        now += 10
+        throttle.throttled(throttled, attempt=1)
+    assert throttle.concurrency == 1
+
+
+def test_throttle_requires_positive_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        _Throttle(0)
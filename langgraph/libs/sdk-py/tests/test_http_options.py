@@ -0,0 +1,40 @@
+import httpx
+import pytest
+
+from langgraph_sdk import get_client, get_sync_client
+from langgraph_sdk.client import _JSON_OFFLOAD_BYTES, _is_small_json
+
+
+def test_http2_is_opt_in() -> None:
+    for client in (get_client(url="http://api"), get_sync_client(url="http://api")):
+        pool = client.http.client._transport._pool
+        assert pool._http2 is False
+        # idle connections expire after httpx's default 5s
+        assert pool._keepalive_expiry == 5.0
+
+
+def test_limits_override_default() -> None:
+    client = get_sync_client(
+        url="http://api", limits=httpx.Limits(max_connections=3, keepalive_expiry=1)
+    )
+    pool = client.http.client._transport._pool
+    assert pool._max_connections == 3
+    assert pool._keepalive_expiry == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "small"),
+    [
+        ({"messages": [{"role": "user", "content": "hi"}]}, True),
+        ("a" * (_JSON_OFFLOAD_BYTES // 2), True),
+        # two bytes per character in UTF-8
+        ("é" * (_JSON_OFFLOAD_BYTES // 2), False),
+        ({"é" * (_JSON_OFFLOAD_BYTES // 2): 1}, False),
+        ("a" * _JSON_OFFLOAD_BYTES, False),
+        (list(range(1000)), False),
+        (object(), False),
+    ],
+    ids=["small", "ascii", "utf8", "utf8-key", "large", "many-values", "object"],
+)
+def test_is_small_json(value, small: bool) -> None:
+    assert _is_small_json(value) is small
@@ -0,0 +1,125 @@
+import httpx
+import orjson
+import pytest
+
+from langgraph_sdk.client import LangGraphClient, SyncLangGraphClient, _is_replayed
+
+FIRST = b'id: 1\nretry: 1\nevent: values\ndata: {"step": 1}\n\n'
+# the second event is cut off before its blank line
+PARTIAL = b'id: 2\nevent: values\ndata: {"st'
+REPLAY = (
+    b'id: 1\nevent: values\ndata: {"step": 1}\n\n'
+    b'id: 2\nevent: values\ndata: {"step": 2}\n\n'
+    b'id: 3\nevent: values\ndata: {"step": 3}\n\n'
+)
+
+
+class DroppedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Body that fails with a network error after its chunks are sent."""
+
+    def __init__(self, *chunks: bytes) -> None:
+        self.chunks = chunks
+
+    def __iter__(self):
+        yield from self.chunks
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        raise httpx.ReadError("connection reset")
+
+
+class Server:
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        headers = {"Content-Type": "text/event-stream"}
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                headers={**headers, "Content-Location": "/threads/t1/runs/r1"},
+                stream=DroppedStream(FIRST, PARTIAL),
+            )
+        assert request.url.path == "/threads/t1/runs/r1/stream"
+        return httpx.Response(200, headers=headers, content=REPLAY)
+
+
+def check_rejoined(server: Server, parts: list) -> None:
+    assert [part.data for part in parts] == [{"step": 1}, {"step": 2}, {"step": 3}]
+    post, join = server.requests
+    payload = orjson.loads(post.content)
+    assert payload["stream_resumable"] is True
+    assert payload["on_disconnect"] == "continue"
+    assert join.method == "GET"
+    assert join.headers["Last-Event-ID"] == "1"
+
+
+async def test_stream_rejoins_after_network_error() -> None:
+    server = Server()
+    client = LangGraphClient(
+        httpx.AsyncClient(base_url="http://api", transport=httpx.MockTransport(server))
+    )
+    parts = [
+        part
+        async for part in client.runs.stream(
+            "t1", "agent", input={}, reconnect_attempts=1
+        )
+    ]
+    check_rejoined(server, parts)
+
+
+def test_sync_stream_rejoins_after_network_error() -> None:
+    server = Server()
+    client = SyncLangGraphClient(
+        httpx.Client(base_url="http://api", transport=httpx.MockTransport(server))
+    )
+    parts = list(client.runs.stream("t1", "agent", input={}, reconnect_attempts=1))
+    check_rejoined(server, parts)
+
+
+async def test_stream_raises_once_attempts_are_exhausted() -> None:
+    server = Server()
+    client = LangGraphClient(
+        httpx.AsyncClient(base_url="http://api", transport=httpx.MockTransport(server))
+    )
+    parts = []
+    with pytest.raises(httpx.ReadError):
+        async for part in client.runs.stream("t1", "agent", input={}):
+            parts.append(part)
+    assert [part.data for part in parts] == [{"step": 1}]
+    assert len(server.requests) == 1
+    assert "stream_resumable" not in orjson.loads(server.requests[0].content)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"stream_resumable": False}, {"on_disconnect": "cancel"}]
+)
+def test_stream_reconnect_requires_resumable_run(kwargs: dict) -> None:
+    client = SyncLangGraphClient(
+        httpx.Client(base_url="http://api", transport=httpx.MockTransport(Server()))
+    )
+    with pytest.raises(ValueError, match="reconnect_attempts"):
+        client.runs.stream("t1", "agent", reconnect_attempts=1, **kwargs)
+    with pytest.raises(ValueError, match="reconnect_attempts"):
+        client.runs.join_stream(
+            "t1", "r1", cancel_on_disconnect=True, reconnect_attempts=1
+        )
+
+
+@pytest.mark.parametrize(
+    ("event_id", "yielded_id", "replayed"),
+    [
+        ("1", None, False),
+        ("1700000000000-0", "1700000000000-0", True),
+        ("1700000000000-0", "1700000000000-1", True),
+        ("1700000000000-2", "1700000000000-1", False),
+        ("1700000000001-0", "999999999999-5", False),
+        ("b", "a", False),
+        ("a", "a", True),
+    ],
+)
+def test_is_replayed(event_id: str, yielded_id, replayed: bool) -> None:
+    assert _is_replayed(event_id, yielded_id) is replayed